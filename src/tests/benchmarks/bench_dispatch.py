@@ -0,0 +1,73 @@
+"""Per-call cost of the KernelTable dispatch against plum multiple dispatch.
+
+Run from the src directory:
+>> python -m tests.benchmarks.bench_dispatch
+"""
+
+import timeit
+
+from plum import Function, Signature
+from whenever import Time
+
+from whenever_time_period.abstract import less_than
+from whenever_time_period.dispatch import KernelTable
+from whenever_time_period.time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    intersection,
+)
+
+PERIODS = {
+    LinearTimePeriod: LinearTimePeriod(Time(3), Time(10)),
+    ModularTimePeriod: ModularTimePeriod(Time(7), Time(5)),
+    InfiniteTimePeriod: InfiniteTimePeriod(Time(5), Time(5)),
+}
+
+
+def plum_reference(table: KernelTable, pairs: list[tuple[type, type]]) -> Function:
+    """Build a plum Function dispatching to the same kernels as the given table, as
+    every operator did before the kernel tables were introduced"""
+
+    def reference(left, right): ...
+
+    function = Function(reference)
+    for left, right in pairs:
+        kernel = table.resolve(left, right)
+        function.register(
+            lambda a, b, kernel=kernel: kernel(a, b), Signature(left, right)
+        )
+    return function
+
+
+def per_call_ns(op, left, right, number: int) -> float:
+    return (
+        min(timeit.repeat(lambda: op(left, right), number=number, repeat=5))
+        / number
+        * 1e9
+    )
+
+
+def main(number: int = 20_000) -> None:
+    pairs = [(left, right) for left in PERIODS for right in PERIODS]
+    benchmarks = [
+        ("&", intersection, plum_reference(intersection, pairs), pairs),
+        ("<", less_than, plum_reference(less_than, pairs), pairs),
+    ]
+
+    print(
+        f"{'op':<3}{'left':<20}{'right':<20}{'plum ns':>10}{'table ns':>10}{'speedup':>9}"
+    )
+    for symbol, table, reference, op_pairs in benchmarks:
+        for left, right in op_pairs:
+            a, b = PERIODS[left], PERIODS[right]
+            plum_ns = per_call_ns(reference, a, b, number)
+            table_ns = per_call_ns(table, a, b, number)
+            print(
+                f"{symbol:<3}{left.__name__:<20}{right.__name__:<20}"
+                f"{plum_ns:>10.0f}{table_ns:>10.0f}{plum_ns / table_ns:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Speed and memory benchmarks of the TimePeriod classes, parametrized by collection
+size, emitting machine-readable JSON results that can be compared between releases.
+
+Run from the src directory:
+>> python -m tests.benchmarks.bench_time_period --sizes 1000 10000 --output results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Callable
+
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    AbstractTimePeriod,
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    PeriodBitmap,
+    TimePeriodSet,
+    format_periods,
+    from_times,
+    parse_periods,
+)
+
+SUBCLASSES = (LinearTimePeriod, ModularTimePeriod, InfiniteTimePeriod)
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def best_of(operation: Callable[[], object], repeat: int) -> float:
+    """The fastest of repeat runs of the operation, in seconds"""
+
+    return min(timeit.repeat(operation, number=1, repeat=repeat))
+
+
+def record(benchmark: str, subject: str, size: int, seconds: float) -> dict:
+    return {
+        "benchmark": benchmark,
+        "subject": subject,
+        "size": size,
+        "seconds": seconds,
+        "ns_per_op": seconds / size * 1e9,
+    }
+
+
+def bench_construction(size: int, repeat: int) -> list[dict]:
+    results = []
+    for subcls in SUBCLASSES:
+        bounds = [
+            (p.start_time, p.end_time)
+            for p in TestUtils.generate_time_periods_of(subcls, size)
+        ]
+        seconds = best_of(lambda: [subcls(a, b) for a, b in bounds], repeat)
+        results.append(record("construction", subcls.__name__, size, seconds))
+    return results
+
+
+def bench_membership(size: int, repeat: int) -> list[dict]:
+    results = []
+    times = TestUtils.generate_times(size)
+    for subcls in SUBCLASSES:
+        period = TestUtils.generate_time_periods_of(subcls, 1)[0]
+        seconds = best_of(lambda: [time in period for time in times], repeat)
+        results.append(record("membership", subcls.__name__, size, seconds))
+    return results
+
+
+def bench_intersection(size: int, repeat: int) -> list[dict]:
+    results = []
+    for left in SUBCLASSES:
+        for right in SUBCLASSES:
+            pairs = list(
+                zip(
+                    TestUtils.generate_time_periods_of(left, size),
+                    TestUtils.generate_time_periods_of(right, size),
+                )
+            )
+            seconds = best_of(lambda: [a & b for a, b in pairs], repeat)
+            subject = f"{left.__name__} & {right.__name__}"
+            results.append(record("intersection", subject, size, seconds))
+    return results
+
+
+def bench_sorting(size: int, repeat: int) -> list[dict]:
+    periods = TestUtils.generate_time_periods(size, resolution_minutes=1)
+    random.shuffle(periods)
+    seconds = best_of(lambda: sorted(periods), repeat)
+    return [record("sorting", AbstractTimePeriod.__name__, size, seconds)]
+
+
+def bench_memory(size: int, repeat: int) -> list[dict]:
+    results = []
+    for subcls in SUBCLASSES:
+        bounds = [
+            (p.start_time, p.end_time)
+            for p in TestUtils.generate_time_periods_of(subcls, size)
+        ]
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        periods = [subcls(a, b) for a, b in bounds]
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del periods
+
+        # the bounds are shared with the input, so this counts the instances and the
+        # list holding them
+        results.append(
+            {
+                "benchmark": "memory",
+                "subject": subcls.__name__,
+                "size": size,
+                "bytes": after - before,
+                "bytes_per_instance": (after - before) / size,
+            }
+        )
+    return results
+
+
+def bench_bitmap(size: int, repeat: int) -> list[dict]:
+    times = TestUtils.generate_times(size)
+    periods = TestUtils.generate_time_periods(8, resolution_minutes=1)
+    bitmap, period_set = PeriodBitmap(periods), TimePeriodSet(periods)
+    results = [
+        record(
+            "bitmap",
+            f"{subject.__class__.__name__} membership",
+            size,
+            best_of(lambda: [time in subject for time in times], repeat),
+        )
+        for subject in (bitmap, period_set)
+    ]
+
+    collections = [TestUtils.generate_time_periods(4, 1) for _ in range(size)]
+    bitmaps = [PeriodBitmap(periods) for periods in collections]
+    period_sets = [TimePeriodSet(periods) for periods in collections]
+    for subjects in (bitmaps, period_sets):
+        seconds = best_of(lambda: subjects[0].union(*subjects[1:]), repeat)
+        subject = f"{subjects[0].__class__.__name__} union"
+        results.append(record("bitmap", subject, size, seconds))
+    return results
+
+
+def bench_text(size: int, repeat: int) -> list[dict]:
+    periods = TestUtils.generate_time_periods(size, resolution_minutes=1)
+    rows = [f"{p.start_time}-{p.end_time}" for p in periods]
+
+    def parse_by_hand() -> list[AbstractTimePeriod]:
+        return [
+            from_times(*(Time.parse_iso(text) for text in row.split("-")))
+            for row in rows
+        ]
+
+    return [
+        record(
+            "text",
+            "parse_periods",
+            size,
+            best_of(lambda: list(parse_periods(rows)), repeat),
+        ),
+        record(
+            "text",
+            "Time.parse_iso and from_times",
+            size,
+            best_of(parse_by_hand, repeat),
+        ),
+        record(
+            "text",
+            "format_periods",
+            size,
+            best_of(lambda: list(format_periods(periods)), repeat),
+        ),
+        record(
+            "text", "repr", size, best_of(lambda: [repr(p) for p in periods], repeat)
+        ),
+    ]
+
+
+def bench_threads(size: int, repeat: int) -> list[dict]:
+    # requires numpy, so only imported when this benchmark runs
+    from whenever_time_period.parallel import contains_many, intersect_many
+
+    left = TestUtils.generate_time_periods(size, resolution_minutes=1)
+    right = TestUtils.generate_time_periods(size, resolution_minutes=1)
+    times = TestUtils.generate_times(size)
+    results = []
+    for threads in THREAD_COUNTS:
+        # one chunk per thread, converted from TimePeriods and Times by that thread
+        chunk_size = max(-(-size // threads), 1)
+        operations = {
+            "contains_many": lambda: contains_many(
+                left, times, threads=threads, chunk_size=chunk_size
+            ),
+            "intersect_many": lambda: intersect_many(
+                left, right, threads=threads, chunk_size=chunk_size
+            ),
+        }
+        for name, operation in operations.items():
+            subject = f"{name} threads={threads}"
+            results.append(record("threads", subject, size, best_of(operation, repeat)))
+    return results
+
+
+BENCHMARKS = {
+    "construction": bench_construction,
+    "membership": bench_membership,
+    "intersection": bench_intersection,
+    "sorting": bench_sorting,
+    "memory": bench_memory,
+    "bitmap": bench_bitmap,
+    "text": bench_text,
+    "threads": bench_threads,
+}
+
+
+def run(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    benchmarks: tuple[str, ...] = tuple(BENCHMARKS),
+    repeat: int = 5,
+    seed: int = 0,
+) -> dict:
+    """Run the given benchmarks for every collection size, returning the results along
+    with the environment they were measured in"""
+
+    random.seed(seed)
+    results = [
+        result
+        for size in sizes
+        for name in benchmarks
+        for result in BENCHMARKS[name](size, repeat)
+    ]
+
+    try:
+        version = metadata.version("whenever_time_period")
+    except metadata.PackageNotFoundError:
+        version = None
+
+    return {
+        "package_version": version,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        # False on free-threaded builds of CPython running without the GIL
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args()
+
+    report = run(tuple(args.sizes), tuple(args.benchmarks), args.repeat, args.seed)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
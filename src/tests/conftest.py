@@ -4,10 +4,12 @@ from tests.generators import Generators, ParametrizedArgs
 
 GeneratorRegister: dict[str, ParametrizedArgs] = {
     "TestTimePeriod.test_time_period_construction": Generators.time_period_construction_cases(),
+    "TestTimePeriod.test_time_period_from_times": Generators.time_period_from_times_cases(),
     "TestTimePeriod.test_time_period_membership": Generators.time_period_membership_cases(),
     "TestTimePeriod.test_time_period_linear_intersection_cases": Generators.time_period_linear_intersection_cases(),
     "TestTimePeriod.test_time_period_modular_intersection_cases": Generators.time_period_modular_intersection_cases(),
     "TestTimePeriod.test_time_period_infinite_intersection_cases": Generators.time_period_infinite_intersection_cases(),
+    "TestTimePeriodSet.test_time_period_set_algebra": Generators.time_period_set_algebra_cases(),
 }
 
 
@@ -10,6 +10,7 @@ from whenever_time_period import (
     InfiniteTimePeriod,
     LinearTimePeriod,
     ModularTimePeriod,
+    TimePeriodSet,
 )
 
 
@@ -45,6 +46,25 @@ class Generators:
             funcargs=cases,
         )
 
+    def time_period_from_times_cases() -> ParametrizedArgs:
+        """Generate relevant cases to assert that from_times constructs the TimePeriod
+        subclass implied by the ordering of the given times"""
+
+        start_int, end_int = TestUtils.generate_integers(2, 0, 23, min_gap=1)
+        start_time, end_time = Time(start_int), Time(end_int)
+
+        cases = [
+            (start_time, end_time, LinearTimePeriod),
+            (end_time, start_time, ModularTimePeriod),
+            (start_time, start_time, InfiniteTimePeriod),
+            (Time(0), Time(0, nanosecond=1), LinearTimePeriod),
+            (Time(23, 59, 59, nanosecond=999_999_999), Time(0), ModularTimePeriod),
+        ]
+
+        return ParametrizedArgs(
+            argnames=["start_time", "end_time", "expected_subcls"], funcargs=cases
+        )
+
     def time_period_membership_cases() -> ParametrizedArgs:
         """Generate relevant cases to assert that a given Time is contained within
         the period defined by a TimePeriod subclass"""
@@ -420,3 +440,81 @@ class Generators:
         return ParametrizedArgs(
             argnames=["period_a", "period_b", "expected_intersection"], funcargs=cases
         )
+
+    def time_period_set_algebra_cases() -> ParametrizedArgs:
+        """Generate relevant cases to assert the correctness of the set algebra of
+        TimePeriodSets, in particular the splitting and rejoining of periods at midnight
+
+        Relevant cases are:
+
+        1. Union of overlapping and touching periods coalesces them
+        2. Union of periods touching at midnight rejoins them as a ModularTimePeriod
+        3. Intersection with a ModularTimePeriod yields both overlaps
+        4. Difference splits a period
+        5. Complement of a ModularTimePeriod is a LinearTimePeriod
+        6. Symmetric difference of overlapping periods
+        7. Complement of the empty set is an InfiniteTimePeriod
+        """
+
+        cases = [
+            (  # 1.
+                TimePeriodSet([LinearTimePeriod(Time(1), Time(3))]),
+                "|",
+                TimePeriodSet(
+                    [
+                        LinearTimePeriod(Time(2), Time(5)),
+                        LinearTimePeriod(Time(5), Time(6)),
+                    ]
+                ),
+                [LinearTimePeriod(Time(1), Time(6))],
+            ),
+            (  # 2.
+                TimePeriodSet([LinearTimePeriod(Time(0), Time(3))]),
+                "|",
+                TimePeriodSet([ModularTimePeriod(Time(22), Time(0))]),
+                [ModularTimePeriod(Time(22), Time(3))],
+            ),
+            (  # 3.
+                TimePeriodSet([LinearTimePeriod(Time(3), Time(10))]),
+                "&",
+                TimePeriodSet([ModularTimePeriod(Time(7), Time(5))]),
+                [
+                    LinearTimePeriod(Time(3), Time(5)),
+                    LinearTimePeriod(Time(7), Time(10)),
+                ],
+            ),
+            (  # 4.
+                TimePeriodSet([LinearTimePeriod(Time(9), Time(17))]),
+                "-",
+                TimePeriodSet([LinearTimePeriod(Time(12), Time(13))]),
+                [
+                    LinearTimePeriod(Time(9), Time(12)),
+                    LinearTimePeriod(Time(13), Time(17)),
+                ],
+            ),
+            (  # 5.
+                TimePeriodSet([ModularTimePeriod(Time(22), Time(6))]),
+                "~",
+                None,
+                [LinearTimePeriod(Time(6), Time(22))],
+            ),
+            (  # 6.
+                TimePeriodSet([LinearTimePeriod(Time(1), Time(5))]),
+                "^",
+                TimePeriodSet([LinearTimePeriod(Time(3), Time(8))]),
+                [
+                    LinearTimePeriod(Time(1), Time(3)),
+                    LinearTimePeriod(Time(5), Time(8)),
+                ],
+            ),
+            (  # 7.
+                TimePeriodSet(),
+                "~",
+                None,
+                [InfiniteTimePeriod(Time(0), Time(0))],
+            ),
+        ]
+
+        return ParametrizedArgs(
+            argnames=["set_a", "operator", "set_b", "expected_periods"], funcargs=cases
+        )
@@ -0,0 +1,105 @@
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import LinearTimePeriod, ModularTimePeriod, TimePeriodSet
+
+np = pytest.importorskip("numpy")
+
+from whenever_time_period.array import EMPTY, PeriodArray, times_to_ns  # noqa: E402
+
+
+def as_intersection(first, second):
+    """Convert a pair of intersection pieces back to the form returned by __and__"""
+
+    pieces = [piece for piece in (first, second) if piece is not None]
+    if not pieces:
+        return None
+    return pieces[0] if len(pieces) == 1 else pieces
+
+
+class TestPeriodArray:
+    def test_period_array_round_trip(self) -> None:
+        """Assert that periods survive conversion to and from a PeriodArray"""
+
+        periods = TestUtils.generate_time_periods(200)
+        array = PeriodArray.from_periods(periods)
+        array.validate()
+
+        assert array.to_periods() == periods
+        assert array[10:20].to_periods() == periods[10:20]
+
+    def test_period_array_contains(self) -> None:
+        """Assert that the membership matrix and mask agree with __contains__"""
+
+        periods = TestUtils.generate_time_periods(100)
+        times = TestUtils.generate_times(100)
+        array = PeriodArray.from_periods(periods)
+
+        matrix = array.contains(times_to_ns(times))
+        mask = array.contains_elementwise(times_to_ns(times))
+
+        for i, period in enumerate(periods):
+            assert list(matrix[i]) == [time in period for time in times]
+            assert mask[i] == (times[i] in period)
+
+    def test_period_array_intersection(self) -> None:
+        """Assert that elementwise intersection agrees with __and__ for every pair of
+        kinds, including double overlaps and touching bounds"""
+
+        left = TestUtils.generate_time_periods(2000)
+        right = TestUtils.generate_time_periods(2000)
+
+        first, second = PeriodArray.from_periods(left) & PeriodArray.from_periods(right)
+
+        for i, (a, b) in enumerate(zip(left, right)):
+            assert as_intersection(first[i], second[i]) == (a & b)
+
+    def test_period_array_preallocated_output(self) -> None:
+        """Assert that results are written to the given output buffers"""
+
+        array = PeriodArray.from_periods([LinearTimePeriod(Time(3), Time(10))])
+        other = PeriodArray.from_periods([ModularTimePeriod(Time(7), Time(5))])
+        out = (PeriodArray.empty(1), PeriodArray.empty(1))
+        matrix = np.empty((1, 2), dtype=bool)
+
+        assert array.intersect(other, out=out) is out
+        assert out[0][0] == LinearTimePeriod(Time(3), Time(5))
+        assert out[1][0] == LinearTimePeriod(Time(7), Time(10))
+        assert array.contains(times_to_ns([Time(2), Time(5)]), out=matrix) is matrix
+        assert list(matrix[0]) == [False, True]
+
+    def test_period_array_empty_periods(self) -> None:
+        """Assert that EMPTY periods contain nothing and intersect to EMPTY"""
+
+        array = PeriodArray.empty(2)
+        other = PeriodArray.from_periods([LinearTimePeriod(Time(3), Time(10))] * 2)
+
+        assert not array.contains(times_to_ns([Time(4)])).any()
+        assert ((array & other)[0].kind == EMPTY).all()
+        assert array.to_periods() == [None, None]
+
+    def test_period_array_overlap_durations(self) -> None:
+        """Assert that durations and the overlap matrix agree with the clock time of the
+        equivalent TimePeriodSets, counting both sides of midnight"""
+
+        periods = TestUtils.generate_time_periods(60)
+        array = PeriodArray.from_periods(periods)
+        other = PeriodArray.from_periods(periods[:20])
+
+        durations = array.duration_ns()
+        matrix = array.overlap_ns()
+        assert matrix.shape == (60, 60)
+        assert array.overlap_ns(other).shape == (60, 20)
+
+        for i, a in enumerate(periods):
+            assert durations[i] == a.duration.total("nanoseconds")
+            assert matrix[i, i] == durations[i]
+            for j, b in enumerate(periods):
+                expected = (TimePeriodSet([a]) & TimePeriodSet([b])).duration
+                assert matrix[i, j] == expected.total("nanoseconds")
+
+        night = PeriodArray.from_periods([ModularTimePeriod(Time(22), Time(6))])
+        day = PeriodArray.from_periods([ModularTimePeriod(Time(4), Time(3))])
+        assert night.overlap_ns(day)[0, 0] == 7 * 3_600_000_000_000
+        assert PeriodArray.empty(1).overlap_ns(day)[0, 0] == 0
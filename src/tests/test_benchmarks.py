@@ -0,0 +1,17 @@
+import json
+
+from tests.benchmarks import bench_time_period
+
+
+class TestBenchmarks:
+    def test_benchmark_suite_runs(self) -> None:
+        """Assert that every benchmark runs for small sizes and reports JSON-serializable
+        results for every subject"""
+
+        report = bench_time_period.run(sizes=(10, 20), repeat=1)
+        results = json.loads(json.dumps(report))["results"]
+
+        benchmarks = {result["benchmark"] for result in results}
+        assert benchmarks == set(bench_time_period.BENCHMARKS)
+        assert {result["size"] for result in results} == {10, 20}
+        assert sum(r["benchmark"] == "intersection" for r in results) == 2 * 9
@@ -0,0 +1,68 @@
+import operator
+import random
+
+import pytest
+from whenever import Time, TimeDelta
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    LinearTimePeriod,
+    ModularTimePeriod,
+    PeriodBitmap,
+    TimePeriodSet,
+)
+
+
+class TestPeriodBitmap:
+    def test_period_bitmap_round_trip(self) -> None:
+        """Assert that periods on the resolution grid convert to a bitmap and back
+        without loss, with membership agreeing with the periods"""
+
+        times = TestUtils.generate_times(100)
+
+        for _ in range(100):
+            periods = TestUtils.generate_time_periods(random.randint(0, 6), 15)
+            bitmap = PeriodBitmap(periods)
+
+            assert bitmap.exact
+            assert bitmap.to_period_set() == TimePeriodSet(periods)
+            assert list(bitmap) == list(TimePeriodSet(periods))
+            for time in times:
+                assert (time in bitmap) is any(time in period for period in periods)
+
+    def test_period_bitmap_algebra(self) -> None:
+        """Assert that the bitwise operators agree with the TimePeriodSet operators"""
+
+        for _ in range(100):
+            periods_a = TestUtils.generate_time_periods(random.randint(0, 6))
+            periods_b = TestUtils.generate_time_periods(random.randint(0, 6))
+            bitmap_a = PeriodBitmap(periods_a, TimeDelta(hours=1))
+            bitmap_b = PeriodBitmap(periods_b, TimeDelta(hours=1))
+            set_a, set_b = TimePeriodSet(periods_a), TimePeriodSet(periods_b)
+
+            for op in (operator.or_, operator.and_, operator.sub, operator.xor):
+                assert op(bitmap_a, bitmap_b).to_period_set() == op(set_a, set_b)
+            assert (~bitmap_a).to_period_set() == ~set_a
+            assert bitmap_a.union(bitmap_b, ~bitmap_b) == ~PeriodBitmap(
+                resolution=TimeDelta(hours=1)
+            )
+            assert bitmap_a.intersection(bitmap_b) == bitmap_a & bitmap_b
+
+    def test_period_bitmap_off_grid(self) -> None:
+        """Assert that bitmaps of periods off the grid, and bitmaps computed from them,
+        refuse to convert back to periods"""
+
+        on_grid = PeriodBitmap([LinearTimePeriod(Time(9), Time(17))])
+        off_grid = PeriodBitmap([ModularTimePeriod(Time(22, 0, 30), Time(6))])
+
+        assert not off_grid.exact
+        assert Time(22, 0, 30) not in off_grid and Time(22, 1) in off_grid
+        for bitmap in (off_grid, on_grid | off_grid, ~off_grid):
+            with pytest.raises(ValueError):
+                bitmap.to_period_set()
+        assert len(on_grid) == 8 * 60
+
+        with pytest.raises(ValueError):
+            on_grid | PeriodBitmap(resolution=TimeDelta(seconds=1))
+        with pytest.raises(ValueError):
+            PeriodBitmap(resolution=TimeDelta(minutes=7))
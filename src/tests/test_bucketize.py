@@ -0,0 +1,95 @@
+import random
+from collections import Counter
+
+import pytest
+from whenever import Instant, Time
+
+from whenever_time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+)
+from whenever_time_period.bucketize import PeriodBucket, bucketize
+
+PERIODS = [
+    ModularTimePeriod(Time(22), Time(6)),
+    LinearTimePeriod(Time(9), Time(17)),
+    InfiniteTimePeriod(Time(5), Time(5)),
+]
+
+
+class TestBucketize:
+    def test_bucketize_agrees_with_membership(self) -> None:
+        """Assert that the counts and sums per period per day agree with testing each
+        event against each period, across a daylight saving time transition"""
+
+        tz = "Europe/Amsterdam"
+        start = Instant.from_utc(2024, 3, 28).timestamp(unit="nanosecond")
+        rng = random.Random(20240331)
+        timestamps = sorted(
+            rng.randrange(start, start + 6 * 86_400 * 10**9) for _ in range(2000)
+        )
+        events = [(timestamp, 1.5) for timestamp in timestamps]
+
+        expected = Counter()
+        for timestamp in timestamps:
+            local = Instant.from_timestamp(timestamp, unit="nanosecond").to_tz(tz)
+            for i, period in enumerate(PERIODS):
+                if local.time() in period:
+                    day = local.date()
+                    if i != 1 and local.time() < period.start_time:
+                        day = day.subtract(days=1)
+                    expected[i, day] += 1
+
+        buckets = list(bucketize(events, PERIODS, tz, chunk_size=100))
+
+        assert {
+            (PERIODS.index(bucket.period), bucket.day): bucket.count
+            for bucket in buckets
+        } == dict(expected)
+        assert [(b.day, PERIODS.index(b.period)) for b in buckets] == sorted(
+            (day, i) for i, day in expected
+        )
+        for bucket in buckets:
+            assert bucket.aggregates.sum == pytest.approx(1.5 * bucket.count)
+            assert bucket.aggregates.min == bucket.aggregates.max == 1.5
+
+    def test_bucketize_yields_incrementally(self) -> None:
+        """Assert that buckets are yielded once later events rule them out, before the
+        stream is exhausted"""
+
+        def events():
+            yield Instant.from_utc(2024, 1, 1, 23)
+            yield Instant.from_utc(2024, 1, 2, 10)
+            yield Instant.from_utc(2024, 1, 3, 10)
+            raise AssertionError("consumed beyond the first yielded bucket")
+
+        buckets = bucketize(events(), PERIODS, "UTC", chunk_size=1)
+        first = next(buckets)
+
+        assert first.period == PERIODS[0]
+        assert first.day == Instant.from_utc(2024, 1, 1).to_tz("UTC").date()
+        assert first.count == 1
+        assert first.aggregates.min is None
+
+    def test_bucketize_rejects_late_events(self) -> None:
+        """Assert that an event belonging to an already yielded bucket raises"""
+
+        events = [
+            Instant.from_utc(2024, 1, 1, 10),
+            Instant.from_utc(2024, 1, 5, 10),
+            Instant.from_utc(2024, 1, 1, 11),
+        ]
+
+        with pytest.raises(ValueError):
+            list(bucketize(events, PERIODS, "UTC", chunk_size=1))
+
+    def test_bucketize_zoned_input(self) -> None:
+        """Assert that ZonedDateTimes are converted to the given timezone"""
+
+        event = Instant.from_utc(2024, 1, 1, 12).to_tz("Asia/Tokyo")
+
+        (bucket,) = bucketize([event], PERIODS[1:2], "UTC")
+        assert bucket == PeriodBucket(
+            PERIODS[1], event.to_tz("UTC").date(), 1, bucket.aggregates
+        )
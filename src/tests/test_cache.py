@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    CacheInfo,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    PeriodCache,
+)
+
+
+class TestPeriodCache:
+    def test_period_cache_interning(self) -> None:
+        """Assert that equal periods are interned to the same instance"""
+
+        cache = PeriodCache()
+        period = cache.from_times(Time(9), Time(17))
+
+        assert cache.intern(LinearTimePeriod(Time(9), Time(17))) is period
+        assert cache.from_times(Time(9), Time(17)) is period
+        assert cache.intern_info() == CacheInfo(
+            hits=2, misses=1, evictions=0, maxsize=4096, currsize=1
+        )
+
+    def test_period_cache_infinite_periods(self) -> None:
+        """Assert that InfiniteTimePeriods of different bounds, which are equal, are
+        interned and intersected by their own bounds"""
+
+        cache = PeriodCache()
+        early = cache.from_times(Time(3), Time(3))
+        late = cache.from_times(Time(9), Time(9))
+
+        assert late is not early
+        assert (late.start_time, late.end_time) == (Time(9), Time(9))
+        assert cache.from_times(Time(3), Time(3)) is early
+
+        assert cache.intersect(early, early) is early
+        result = cache.intersect(late, late)
+        assert result is late
+        assert (result.start_time, result.end_time) == (Time(9), Time(9))
+
+    def test_period_cache_intersection(self) -> None:
+        """Assert that memoized intersections agree with __and__, count hits and misses,
+        and return list results that are safe to modify"""
+
+        cache = PeriodCache()
+        linear = LinearTimePeriod(Time(3), Time(10))
+        modular = ModularTimePeriod(Time(7), Time(5))
+
+        result = cache.intersect(linear, modular)
+        assert result == linear & modular
+        result.clear()
+
+        assert cache.intersect(linear, modular) == linear & modular
+        assert (
+            cache.intersect(linear, modular)[0] is cache.intersect(linear, modular)[0]
+        )
+        assert cache.intersection_info().misses == 1
+        assert cache.intersection_info().hits == 3
+
+        with pytest.raises(TypeError):
+            cache.intersect(linear, Time(5))
+
+    def test_period_cache_eviction(self) -> None:
+        """Assert that the least recently used results are evicted beyond maxsize"""
+
+        cache = PeriodCache(maxsize=2)
+        periods = [LinearTimePeriod(Time(hour), Time(hour + 1)) for hour in range(3)]
+
+        for period in periods:
+            cache.intersect(period, period)
+        cache.intersect(periods[0], periods[0])
+
+        info = cache.intersection_info()
+        assert (info.misses, info.evictions, info.currsize) == (4, 2, 2)
+
+    def test_period_cache_threads(self) -> None:
+        """Assert that concurrent use from many threads agrees with __and__"""
+
+        cache = PeriodCache(maxsize=64)
+        left = TestUtils.generate_time_periods(200)
+        right = TestUtils.generate_time_periods(200)
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(cache.intersect, left * 10, right * 10))
+
+        assert results == [a & b for a, b in zip(left * 10, right * 10)]
+        assert cache.intersection_info().currsize <= 64
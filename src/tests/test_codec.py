@@ -0,0 +1,93 @@
+import io
+
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import LinearTimePeriod
+from whenever_time_period.codec import HEADER, RECORD, dump, dumps, load, loads
+
+
+class TestCodec:
+    def test_codec_round_trip(self) -> None:
+        """Assert that periods of every kind survive encoding and decoding, from bytes
+        and from a memoryview"""
+
+        periods = TestUtils.generate_time_periods(500, resolution_minutes=1)
+        data = dumps(periods)
+
+        assert len(data) == HEADER.size + len(periods) * RECORD.size
+        assert list(loads(data)) == periods
+        assert loads(memoryview(data))[100:110] == periods[100:110]
+        assert loads(data)[-1] == periods[-1]
+
+    def test_codec_memory_mapped_file(self, tmp_path) -> None:
+        """Assert that a dumped file can be memory-mapped and read lazily"""
+
+        periods = TestUtils.generate_time_periods(100)
+        path = tmp_path / "periods.bin"
+        with open(path, "wb") as file:
+            dump(periods, file)
+
+        with load(path) as sequence:
+            assert len(sequence) == 100
+            assert sequence[42] == periods[42]
+            assert list(sequence) == periods
+
+    def test_codec_to_array(self) -> None:
+        """Assert that the records can be viewed as a PeriodArray without copying"""
+
+        pytest.importorskip("numpy")
+
+        periods = TestUtils.generate_time_periods(100)
+        buffer = bytearray(dumps(periods))
+        array = loads(buffer).to_array()
+
+        assert array.to_periods() == periods
+        buffer[HEADER.size + 1 : HEADER.size + 9] = (0).to_bytes(8, "little")
+        assert array.start_ns[0] == 0
+
+    def test_codec_memory_mapped_file_to_array(self, tmp_path) -> None:
+        """Assert that the array of a loaded file views the map without copying it,
+        and outlives the closing of the sequence"""
+
+        np = pytest.importorskip("numpy")
+
+        periods = TestUtils.generate_time_periods(100)
+        path = tmp_path / "periods.bin"
+        with open(path, "wb") as file:
+            dump(periods, file)
+
+        with load(path) as sequence:
+            array = sequence.to_array()
+            mapped = np.frombuffer(sequence._mmap, dtype=np.uint8)
+            assert np.shares_memory(array.start_ns, mapped)
+        assert array.to_periods() == periods
+
+        buffer = bytearray(dumps(periods))
+        sequence = loads(buffer)
+        view = sequence.to_array()
+        sequence.close()
+        assert view.to_periods() == periods
+
+    def test_codec_rejects_invalid_buffers(self) -> None:
+        """Assert that foreign, truncated and corrupt buffers raise ValueError"""
+
+        data = dumps([LinearTimePeriod(Time(3), Time(10))])
+
+        with pytest.raises(ValueError):
+            loads(b"NOPE" + data[4:])
+        with pytest.raises(ValueError):
+            loads(data[:-1])
+        with pytest.raises(ValueError):
+            loads(data[: HEADER.size] + RECORD.pack(1, 0, 5))[0]
+        with pytest.raises(IndexError):
+            loads(data)[1]
+
+    def test_codec_file_object(self) -> None:
+        """Assert that dump writes to any binary file object, including no periods"""
+
+        file = io.BytesIO()
+        dump([], file)
+
+        assert len(loads(file.getvalue())) == 0
@@ -0,0 +1,124 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from whenever import Time
+
+from whenever_time_period.abstract import greater_than, less_than
+from whenever_time_period.dispatch import KernelTable
+from whenever_time_period.time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    intersection,
+)
+
+
+class ShiftedLinearTimePeriod(LinearTimePeriod):
+    """A user-defined subclass, unknown to the precomputed kernel tables"""
+
+
+class TestKernelTable:
+    def test_kernel_table_builtin_pairs_are_precomputed(self) -> None:
+        """Assert that every pair of built-in classes is served from the table without
+        resolution"""
+
+        builtins = (LinearTimePeriod, ModularTimePeriod, InfiniteTimePeriod)
+        for left in builtins:
+            for right in builtins:
+                assert (left, right) in intersection._kernels
+                assert (left, right) in less_than._kernels
+                assert (left, right) in greater_than._kernels
+            assert (left, Time) in less_than._kernels
+            assert (left, Time) in greater_than._kernels
+
+    def test_kernel_table_resolves_and_caches_subclasses(self) -> None:
+        """Assert that a subclass of a built-in class resolves to the kernel of its
+        parent, and that the resolution is cached"""
+
+        period = ShiftedLinearTimePeriod(Time(1), Time(4))
+        other = LinearTimePeriod(Time(2), Time(5))
+
+        assert period & other == LinearTimePeriod(Time(2), Time(4))
+        assert intersection._kernels[ShiftedLinearTimePeriod, LinearTimePeriod] is (
+            intersection.resolve(LinearTimePeriod, LinearTimePeriod)
+        )
+        assert period < other
+
+    def test_kernel_table_unsupported_operands(self) -> None:
+        """Assert that pairs without a kernel defer to Python's reflected operators"""
+
+        with pytest.raises(TypeError):
+            LinearTimePeriod(Time(1), Time(4)) & Time(2)
+
+        with pytest.raises(TypeError):
+            LinearTimePeriod(Time(1), Time(4)) < 1
+
+    def test_kernel_table_registration(self) -> None:
+        """Assert that kernels can be registered by annotation or explicitly, and that a
+        more specific registration replaces a previously cached resolution"""
+
+        table = KernelTable("describe")
+
+        @table.register
+        def _(left: int, right: object) -> str:
+            return "int, object"
+
+        assert table(1, 2) == "int, object"
+        assert table("a", 2) is NotImplemented
+
+        table.register(int, int)(lambda left, right: "int, int")
+        assert table(1, 2) == "int, int"
+        assert table(1, "b") == "int, object"
+
+        with pytest.raises(TypeError):
+            table.register(int)
+
+    def test_kernel_table_precomputed_pairs_survive_registration(self) -> None:
+        """Assert that precomputed pairs are resolved again after a later registration,
+        to the kernel of the most specific signature"""
+
+        table = KernelTable("describe")
+        table.register(int, object)(lambda left, right: "int, object")
+        table.precompute((int, bool), (int, str))
+        table.register(bool, int)(lambda left, right: "bool, int")
+
+        assert set(table._kernels) >= {(int, int), (int, str), (bool, int), (bool, str)}
+        assert table._kernels[bool, str](True, "a") == "int, object"
+        assert table(True, 1) == "bool, int"
+
+    def test_kernel_table_plum_resolution(self) -> None:
+        """Assert that signatures which are not pairs of classes are resolved with plum,
+        including signatures registered before plum was first needed"""
+
+        table = KernelTable("describe")
+        table.register(int, int)(lambda left, right: "int, int")
+        assert table._function is None
+
+        table.register(int | str, str)(lambda left, right: "int | str, str")
+
+        assert table("a", "b") == "int | str, str"
+        assert table(1, "b") == "int | str, str"
+        assert table(1, 2) == "int, int"
+        assert table(1.0, 2) is NotImplemented
+        assert table._function is not None
+
+    def test_kernel_table_concurrent_resolution(self) -> None:
+        """Assert that threads resolving new pairs at once, including with plum, each get
+        the kernel of the most specific signature"""
+
+        table = KernelTable("describe")
+        table.register(int | str, object)(lambda left, right: "int | str, object")
+        table.register(int, int)(lambda left, right: "int, int")
+        subclasses = [type(f"Int{i}", (int,), {}) for i in range(50)]
+        barrier = threading.Barrier(8)
+
+        def resolve_all() -> list[str]:
+            barrier.wait()
+            return [table(cls(1), 2) for cls in subclasses] + [table("a", 2)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(resolve_all) for _ in range(8)]
+            results = [future.result() for future in futures]
+
+        assert results == [["int, int"] * 50 + ["int | str, object"]] * 8
@@ -0,0 +1,87 @@
+from itertools import islice
+
+import pytest
+from whenever import Date, SkippedTime, Time, TimeDelta
+
+from whenever_time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    expand,
+)
+
+AMSTERDAM = "Europe/Amsterdam"
+
+
+class TestExpand:
+    def test_expand_order_and_bounds(self) -> None:
+        """Assert that occurrences are yielded per day in order of the periods, and that
+        ModularTimePeriods and InfiniteTimePeriods end on the next day"""
+
+        morning = LinearTimePeriod(Time(5), Time(9))
+        night = ModularTimePeriod(Time(22), Time(6))
+        always = InfiniteTimePeriod(Time(12), Time(12))
+
+        occurrences = list(
+            expand([morning, night, always], Date(2024, 1, 1), Date(2024, 1, 3), "UTC")
+        )
+
+        assert [(o.period, o.day) for o in occurrences] == [
+            (morning, Date(2024, 1, 1)),
+            (night, Date(2024, 1, 1)),
+            (always, Date(2024, 1, 1)),
+            (morning, Date(2024, 1, 2)),
+            (night, Date(2024, 1, 2)),
+            (always, Date(2024, 1, 2)),
+        ]
+        night_occurrence = occurrences[1]
+        assert night_occurrence.start.date() == Date(2024, 1, 1)
+        assert night_occurrence.end.date() == Date(2024, 1, 2)
+        assert night_occurrence.end.time() == Time(6)
+        assert occurrences[2].end - occurrences[2].start == TimeDelta(hours=24)
+
+    def test_expand_daylight_saving_time(self) -> None:
+        """Assert that occurrences spanning a transition last the real elapsed time, and
+        that clock times in gaps and folds are resolved with the disambiguation"""
+
+        night = ModularTimePeriod(Time(22), Time(6))
+        spring = list(expand(night, Date(2024, 3, 30), Date(2024, 3, 31), AMSTERDAM))
+        autumn = list(expand(night, Date(2024, 10, 26), Date(2024, 10, 27), AMSTERDAM))
+
+        assert spring[0].end - spring[0].start == TimeDelta(hours=7)
+        assert autumn[0].end - autumn[0].start == TimeDelta(hours=9)
+
+        skipped = LinearTimePeriod(Time(2, 15), Time(4))
+        (gap,) = expand(skipped, Date(2024, 3, 31), Date(2024, 4, 1), AMSTERDAM)
+        assert gap.start.time() == Time(3, 15)
+
+        repeated = LinearTimePeriod(Time(2, 15), Time(2, 45))
+        for disambiguation, offset in (("earlier", 2), ("later", 1)):
+            (fold,) = expand(
+                repeated,
+                Date(2024, 10, 27),
+                Date(2024, 10, 28),
+                AMSTERDAM,
+                disambiguation,
+            )
+            assert fold.start.offset == TimeDelta(hours=offset)
+            assert fold.end - fold.start == TimeDelta(minutes=30)
+
+        with pytest.raises(SkippedTime):
+            list(
+                expand(skipped, Date(2024, 3, 31), Date(2024, 4, 1), AMSTERDAM, "raise")
+            )
+
+    def test_expand_is_lazy(self) -> None:
+        """Assert that expanding over a long range only does the work consumed"""
+
+        night = ModularTimePeriod(Time(22), Time(6))
+        occurrences = expand(night, Date(1900, 1, 1), Date(9999, 1, 1), AMSTERDAM)
+
+        first = list(islice(occurrences, 3))
+        assert [o.day for o in first] == [
+            Date(1900, 1, 1),
+            Date(1900, 1, 2),
+            Date(1900, 1, 3),
+        ]
+        assert list(expand(night, Date(2024, 1, 2), Date(2024, 1, 1), "UTC")) == []
@@ -0,0 +1,139 @@
+import random
+
+import pytest
+from whenever import PlainDateTime, Time, Weekday
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    ModularWeeklyTimePeriod,
+    PeriodExpression,
+    TimePeriodSet,
+    WeeklyTimePeriodSet,
+    lazy,
+)
+
+
+def random_rule(depth: int) -> tuple[PeriodExpression, TimePeriodSet]:
+    """A random expression of periods and the TimePeriodSet it evaluates to eagerly"""
+
+    if depth == 0 or random.random() < 0.2:
+        period = TestUtils.generate_time_periods(1, resolution_minutes=180)[0]
+        return lazy(period), TimePeriodSet([period])
+
+    op = random.choice("&|-~")
+    expression, expected = random_rule(depth - 1)
+    if op == "~":
+        return ~expression, ~expected
+    other, other_expected = random_rule(depth - 1)
+    if op == "&":
+        return expression & other, expected & other_expected
+    if op == "|":
+        return expression | other, expected | other_expected
+    return expression - other, expected - other_expected
+
+
+class TestPeriodExpression:
+    def test_period_expression_matches_eager_evaluation(self) -> None:
+        """Assert that compiling random expressions gives the same set as evaluating
+        them eagerly with TimePeriodSets, and the same membership of Times"""
+
+        times = TestUtils.generate_times(200)
+        for _ in range(300):
+            expression, expected = random_rule(depth=4)
+            compiled = expression.compile()
+
+            assert compiled == expected
+            assert compiled is expression.compile()
+            assert [t in expression for t in times] == [t in expected for t in times]
+
+    def test_period_expression_simplification(self) -> None:
+        """Assert that the planner flattens nested operations, drops identities and
+        collapses absorbed, complementary and doubly complemented operands"""
+
+        a = lazy(LinearTimePeriod(Time(9), Time(17)))
+        b = lazy(ModularTimePeriod(Time(22), Time(6)))
+        c = lazy(LinearTimePeriod(Time(12), Time(13)))
+        always = InfiniteTimePeriod(Time(3), Time(3))
+
+        assert ((a & b) & (always & c)).simplify() == PeriodExpression("and", (a, b, c))
+        assert (a | (b | c) | None | []).simplify() == PeriodExpression("or", (a, b, c))
+        assert (a & always).simplify() == a
+        assert (a & b & None).simplify() == lazy(None)
+        assert (a | b | always).simplify() == lazy(always)
+        assert (a & ~a).simplify() == lazy(None)
+        assert (c | ~c).simplify() == lazy(always)
+        assert (~~a).simplify() == a
+        assert (~lazy(TimePeriodSet())).simplify() == lazy(TimePeriodSet.full())
+        assert repr((a - b) | c) == (
+            "(lazy(LinearTimePeriod[09:00:00, 17:00:00)) & "
+            "~lazy(ModularTimePeriod[22:00:00, 06:00:00))) | "
+            "lazy(LinearTimePeriod[12:00:00, 13:00:00))"
+        )
+
+    def test_period_expression_from_period_operators(self) -> None:
+        """Assert that the complement of a period starts an expression, which absorbs
+        the eager results of intersecting periods on either side of an operator"""
+
+        business_hours = LinearTimePeriod(Time(9), Time(17))
+        holidays_window = LinearTimePeriod(Time(12), Time(20))
+        on_call = ModularTimePeriod(Time(20), Time(4))
+        night_shift = ModularTimePeriod(Time(22), Time(2))
+
+        rule = (business_hours & ~holidays_window) | lazy(on_call) & night_shift
+        assert isinstance(rule, PeriodExpression)
+        assert rule.compile() == TimePeriodSet(
+            [LinearTimePeriod(Time(9), Time(12)), night_shift]
+        )
+        assert Time(23) in rule and Time(13) not in rule
+
+        # an eager intersection of two pieces, and of none
+        pieces = LinearTimePeriod(Time(1), Time(23)) & night_shift
+        assert (pieces | ~night_shift).compile() == TimePeriodSet(
+            [LinearTimePeriod(Time(1), Time(23))]
+        )
+        assert (
+            business_hours - lazy(business_hours & night_shift)
+        ).compile() == TimePeriodSet([business_hours])
+        assert list((TimePeriodSet([on_call]) & ~business_hours).compile()) == [on_call]
+
+        with pytest.raises(TypeError):
+            lazy(Time(3))
+        with pytest.raises(TypeError):
+            ~business_hours & 3
+
+    def test_period_expression_intersections_of_periods_are_eager(self) -> None:
+        """Assert that & between two periods is the eager intersection, while & with
+        an expression on either side is the exact lazy one"""
+
+        a = ModularTimePeriod(Time(20), Time(10))
+        b = ModularTimePeriod(Time(8), Time(5))
+        early = LinearTimePeriod(Time(0), Time(1))
+
+        assert a & b == ModularTimePeriod(Time(20), Time(5))
+        assert (lazy(a) & b).compile() == TimePeriodSet(
+            [LinearTimePeriod(Time(8), Time(10)), ModularTimePeriod(Time(20), Time(5))]
+        )
+        assert (a & lazy(b)).compile() == (lazy(a) & b).compile()
+        assert Time(9) not in (lazy(early) | a & b)
+        assert Time(9) in (lazy(early) | lazy(a) & b)
+
+    def test_weekly_period_expression(self) -> None:
+        """Assert that an expression with any weekly operand compiles to a
+        WeeklyTimePeriodSet, wherein daily periods recur on every day"""
+
+        weekend = ModularWeeklyTimePeriod(
+            Weekday.SATURDAY, Time(0), Weekday.MONDAY, Time(0)
+        )
+        nights = ModularTimePeriod(Time(22), Time(6))
+        rule = ~lazy(weekend) & nights
+
+        compiled = rule.compile()
+        assert isinstance(compiled, WeeklyTimePeriodSet)
+        for hour in range(168):
+            moment = PlainDateTime(2024, 1, 1 + hour // 24, hour % 24)
+            assert (moment in rule) == (
+                moment not in weekend and moment.time() in nights
+            )
@@ -0,0 +1,110 @@
+import random
+from typing import Optional
+
+from whenever import Time, TimeDelta
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    AbstractTimePeriod,
+    FreeSlots,
+    LinearTimePeriod,
+    ModularTimePeriod,
+)
+from whenever_time_period.time_period import from_ns
+
+NS_PER_HOUR = 3_600_000_000_000
+
+
+def first_free_window(free: list[bool], hours: int, after: int) -> Optional[tuple]:
+    """Brute force first fit over a day of hourly free flags, as (start, end) hours"""
+
+    for offset in range(24):
+        start = (after + offset) % 24
+        if hours <= 24 and all(free[(start + i) % 24] for i in range(hours)):
+            return start, (start + hours) % 24
+    return None
+
+
+class TestFreeSlots:
+    def test_free_slots_first_fit(self) -> None:
+        """Assert that first fit agrees with a brute force search of random hourly busy
+        periods, whether they were given up front or added one at a time"""
+
+        for _ in range(100):
+            busy = TestUtils.generate_time_periods(random.randint(0, 5))
+            free = [
+                not any(Time(hour) in period for period in busy) for hour in range(24)
+            ]
+            incremental = FreeSlots()
+            for period in busy:
+                incremental.add(period)
+
+            for slots in (FreeSlots(busy), incremental):
+                for hours in range(1, 26):
+                    after = random.randrange(24)
+                    expected = first_free_window(free, hours, after)
+                    window = slots.first_fit(TimeDelta(hours=hours), Time(after))
+
+                    if expected is None:
+                        assert window is None
+                    else:
+                        assert (window.start_ns, window.end_ns) == (
+                            expected[0] * NS_PER_HOUR,
+                            expected[1] * NS_PER_HOUR,
+                        )
+
+    def test_free_slots_all_fits_and_largest_gap(self) -> None:
+        """Assert that all fits yields distinct, entirely free stretches starting with the
+        first fit, and that the largest gap is the longest free stretch"""
+
+        for _ in range(100):
+            busy = TestUtils.generate_time_periods(random.randint(1, 5))
+            free = [
+                not any(Time(hour) in period for period in busy) for hour in range(24)
+            ]
+            slots = FreeSlots(busy)
+
+            hours, after = random.randint(1, 6), Time(random.randrange(24))
+            fits = list(slots.all_fits(TimeDelta(hours=hours), after))
+            first = slots.first_fit(TimeDelta(hours=hours), after)
+            assert (first is None) == (not fits)
+            if fits:
+                assert fits[0].start_ns == first.start_ns
+            assert len({fit.start_ns for fit in fits}) == len(fits)
+            for fit in fits:
+                assert fit.duration >= TimeDelta(hours=hours)
+                start = fit.start_ns // NS_PER_HOUR
+                length = int(fit.duration.total("hours"))
+                assert all(free[hour % 24] for hour in range(start, start + length))
+
+            longest = max(
+                (n for n in range(25) if first_free_window(free, n, 0) is not None),
+                default=0,
+            )
+            largest: Optional[AbstractTimePeriod] = slots.largest_gap()
+            if longest == 0:
+                assert largest is None
+            else:
+                assert largest.duration == TimeDelta(hours=longest)
+
+    def test_free_slots_wraparound(self) -> None:
+        """Assert that free time on either side of midnight is a single stretch"""
+
+        slots = FreeSlots([LinearTimePeriod(Time(6), Time(22))])
+
+        assert slots.first_fit(TimeDelta(hours=8), Time(7)) == ModularTimePeriod(
+            Time(22), Time(6)
+        )
+        assert slots.first_fit(TimeDelta(hours=3), Time(4)) == from_ns(
+            22 * NS_PER_HOUR, NS_PER_HOUR
+        )
+        assert list(slots.all_fits(TimeDelta(hours=1), Time(23))) == [
+            ModularTimePeriod(Time(23), Time(6))
+        ]
+        assert slots.largest_gap() == ModularTimePeriod(Time(22), Time(6))
+
+        slots.add(ModularTimePeriod(Time(23), Time(1)))
+        assert slots.largest_gap() == LinearTimePeriod(Time(1), Time(6))
+        assert FreeSlots().first_fit(TimeDelta(hours=24), Time(5)) == from_ns(
+            5 * NS_PER_HOUR, 5 * NS_PER_HOUR
+        )
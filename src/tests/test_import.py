@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import whenever_time_period
+
+# the budget for importing whenever_time_period on top of whenever itself, which
+# eagerly importing plum alone would exceed several times over
+IMPORT_BUDGET_US = 150_000
+
+PACKAGE_ROOT = Path(whenever_time_period.__file__).resolve().parents[1]
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(PACKAGE_ROOT)}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def cumulative_import_us(stderr: str, module: str) -> int:
+    """The cumulative import time of a top-level module from -X importtime output"""
+
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.rstrip() == f" {module}":
+            return int(cumulative)
+    raise LookupError(module)
+
+
+class TestImport:
+    def test_import_does_not_load_optional_modules(self) -> None:
+        """Assert that importing the package, constructing periods, testing membership,
+        intersecting and sorting never imports plum or numpy"""
+
+        result = run_python(
+            "import sys\n"
+            "from whenever import Time\n"
+            "from whenever_time_period import from_times\n"
+            "period = from_times(Time(1), Time(3))\n"
+            "assert Time(2) in period\n"
+            "assert period & from_times(Time(2), Time(1)) is not None\n"
+            "sorted([period, from_times(Time(0), Time(5))])\n"
+            "print(sorted({'plum', 'numpy'} & set(sys.modules)))\n"
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_import_time(self) -> None:
+        """Guard against import time regressions, measured with -X importtime as the best
+        of three runs"""
+
+        package_us = []
+        for _ in range(3):
+            stderr = run_python(
+                "import whenever; import whenever_time_period", "-X", "importtime"
+            ).stderr
+            package_us.append(
+                cumulative_import_us(stderr, "whenever_time_period")
+                - cumulative_import_us(stderr, "whenever")
+            )
+
+        assert min(package_us) < IMPORT_BUDGET_US
@@ -0,0 +1,43 @@
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    PeriodIndex,
+)
+
+
+class TestPeriodIndex:
+    def test_period_index_agrees_with_membership(self) -> None:
+        """Assert that stabbing queries report exactly the keys of the periods which
+        contain the queried time, for a random collection of overlapping periods"""
+
+        periods = TestUtils.generate_time_periods(500, resolution_minutes=30)
+        times = TestUtils.generate_times(300)
+        index = PeriodIndex(enumerate(periods))
+
+        for time, keys in zip(times, index.stab_many(times)):
+            expected = [i for i, period in enumerate(periods) if time in period]
+            assert sorted(keys) == expected
+            assert sorted(index.stab(time)) == expected
+
+    def test_period_index_wraparound(self) -> None:
+        """Assert that ModularTimePeriods and InfiniteTimePeriods are reported on both
+        sides of midnight, once each"""
+
+        index = PeriodIndex(
+            {
+                "night": ModularTimePeriod(Time(22), Time(6)),
+                "always": InfiniteTimePeriod(Time(3), Time(3)),
+                "morning": LinearTimePeriod(Time(5), Time(9)),
+            }
+        )
+
+        assert len(index) == 3
+        assert sorted(index.stab(Time(23))) == ["always", "night"]
+        assert sorted(index.stab(Time(0))) == ["always", "night"]
+        assert sorted(index.stab(Time(5, 30))) == ["always", "morning", "night"]
+        assert sorted(index.stab(Time(6))) == ["always", "morning"]
+        assert PeriodIndex({}).stab(Time(1)) == []
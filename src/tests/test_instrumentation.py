@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from whenever import Time
+
+from whenever_time_period import (
+    AbstractTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    from_times,
+    instrumentation,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_instrumentation():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_instrumentation_counts_operations(self) -> None:
+        """Assert that every instrumented operation is counted per pair of operand types,
+        and that every call lands in exactly one histogram bucket"""
+
+        linear = LinearTimePeriod(Time(3), Time(10))
+        modular = ModularTimePeriod(Time(7), Time(5))
+
+        with instrumentation.enabled():
+            linear & modular
+            linear & modular
+            Time(4) in modular
+            sorted([linear, modular])
+            linear > Time(1)
+            from_times(Time(1), Time(2))
+
+        snapshot = json.loads(json.dumps(instrumentation.snapshot()))
+        pairs = {
+            (pair["operation"], pair["left"], pair["right"]): pair
+            for pair in snapshot["pairs"]
+        }
+
+        assert not snapshot["enabled"]
+        assert pairs["and", "LinearTimePeriod", "ModularTimePeriod"]["count"] == 2
+        assert pairs["contains", "ModularTimePeriod", "Time"]["count"] == 1
+        assert pairs["gt", "LinearTimePeriod", "Time"]["count"] == 1
+        assert snapshot["operations"]["lt"]["count"] == 1
+        # one from_times and two pieces of each double overlap
+        assert pairs["construct", "LinearTimePeriod", None]["count"] == 5
+        for stats in snapshot["pairs"]:
+            assert sum(stats["histogram"]) == stats["count"]
+            assert len(stats["histogram"]) == len(snapshot["bucket_bounds_ns"]) + 1
+
+    def test_instrumentation_restores_methods(self) -> None:
+        """Assert that disabling restores the original methods, so nothing is counted
+        and nothing is paid while disabled"""
+
+        original_and = LinearTimePeriod.__and__
+        original_lt = AbstractTimePeriod.__lt__
+
+        instrumentation.enable()
+        assert LinearTimePeriod.__and__ is not original_and
+        instrumentation.disable()
+
+        assert LinearTimePeriod.__and__ is original_and
+        assert AbstractTimePeriod.__lt__ is original_lt
+        assert "_from_parts" not in LinearTimePeriod.__dict__
+
+        LinearTimePeriod(Time(3), Time(10)) & LinearTimePeriod(Time(4), Time(5))
+        assert instrumentation.snapshot()["pairs"] == []
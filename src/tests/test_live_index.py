@@ -0,0 +1,132 @@
+import random
+import threading
+
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    LivePeriodIndex,
+    ModularTimePeriod,
+)
+
+
+def expected_keys(periods, time) -> list:
+    return sorted(key for key, period in periods.items() if time in period)
+
+
+class TestLivePeriodIndex:
+    def test_live_period_index_agrees_with_membership(self) -> None:
+        """Assert that after a random sequence of additions, replacements and removals
+        the current snapshot reports exactly the keys of the periods containing each
+        time, and iterates exactly the indexed periods"""
+
+        periods = TestUtils.generate_time_periods(600, resolution_minutes=30)
+        times = TestUtils.generate_times(100)
+        index = LivePeriodIndex(enumerate(periods[:200]))
+        model = dict(enumerate(periods[:200]))
+
+        for period in periods[200:]:
+            key = random.randrange(300)
+            if key in model and random.random() < 0.5:
+                index.remove(key)
+                del model[key]
+            else:
+                index.add(key, period)
+                model[key] = period
+
+        snapshot = index.snapshot
+        assert len(index) == len(snapshot) == len(model)
+        assert dict(snapshot.items()) == model
+        for time, keys in zip(times, snapshot.stab_many(times)):
+            assert sorted(keys) == expected_keys(model, time)
+
+    def test_live_period_index_snapshots_are_immutable(self) -> None:
+        """Assert that published snapshots are unaffected by later updates, and that a
+        batch update publishes a single new version"""
+
+        index = LivePeriodIndex(
+            {
+                "night": ModularTimePeriod(Time(22), Time(6)),
+                "always": InfiniteTimePeriod(Time(3), Time(3)),
+            }
+        )
+        first = index.snapshot
+        assert first.version == 1
+
+        second = index.update(
+            add={"morning": LinearTimePeriod(Time(5), Time(9))}, remove=["night"]
+        )
+        assert second is index.snapshot
+        assert second.version == 2
+        assert sorted(first.stab(Time(5, 30))) == ["always", "night"]
+        assert sorted(second.stab(Time(5, 30))) == ["always", "morning"]
+        assert sorted(first.stab(Time(23))) == ["always", "night"]
+        assert second.stab(Time(23)) == ["always"]
+
+        index.add("morning", LinearTimePeriod(Time(10), Time(11)))
+        assert index.snapshot.version == 3
+        assert sorted(second.stab(Time(5, 30))) == ["always", "morning"]
+        assert index.snapshot.stab(Time(5, 30)) == ["always"]
+
+    def test_live_period_index_failed_update_changes_nothing(self) -> None:
+        """Assert that an update removing an unknown key, adding an invalid period or
+        failing partway raises without publishing a snapshot or changing the index"""
+
+        index = LivePeriodIndex({"night": ModularTimePeriod(Time(22), Time(6))})
+        snapshot = index.snapshot
+
+        with pytest.raises(KeyError):
+            index.update(add={"day": LinearTimePeriod(Time(9), Time(17))}, remove=["x"])
+        with pytest.raises(TypeError):
+            index.update(add={"day": "09:00-17:00"}, remove=["night"])
+        # an unhashable key fails only after the removal has been applied
+        with pytest.raises(TypeError):
+            index.update(
+                add=[(["day"], LinearTimePeriod(Time(9), Time(17)))], remove=["night"]
+            )
+
+        assert index.snapshot is snapshot
+        assert dict(index.snapshot.items()) == {
+            "night": ModularTimePeriod(Time(22), Time(6))
+        }
+        assert len(index) == 1
+        assert index.remove("night").stab(Time(23)) == []
+
+    def test_live_period_index_concurrent_readers(self) -> None:
+        """Assert that readers querying while a writer updates always see consistent
+        snapshots of increasing version"""
+
+        periods = TestUtils.generate_time_periods(400)
+        index = LivePeriodIndex(enumerate(periods[:100]))
+        done = threading.Event()
+        errors = []
+
+        def read() -> None:
+            version = 0
+            try:
+                while not done.is_set():
+                    snapshot = index.snapshot
+                    assert snapshot.version >= version
+                    version = snapshot.version
+                    time = Time(random.randrange(24), random.randrange(60))
+                    assert sorted(snapshot.stab(time)) == expected_keys(
+                        dict(snapshot.items()), time
+                    )
+            except AssertionError as error:
+                errors.append(error)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i, period in enumerate(periods[100:]):
+            index.update(add=[(i + 100, period)], remove=[i])
+        done.set()
+        for reader in readers:
+            reader.join()
+
+        assert not errors
+        assert index.snapshot.version == 301
+        assert len(index) == 100
@@ -0,0 +1,141 @@
+from collections import Counter
+
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import InfiniteTimePeriod, LinearTimePeriod
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from whenever_time_period.array import times_to_ns  # noqa: E402
+from whenever_time_period.pandas_ext import (  # noqa: E402
+    TimePeriodArray,
+    TimePeriodDtype,
+)
+
+
+class TestTimePeriodArray:
+    def test_time_period_dtype_is_registered(self) -> None:
+        """Assert that Series of periods can be built by the name of the dtype and
+        round-trip to lists of periods, with None as the missing value"""
+
+        periods = TestUtils.generate_time_periods(50) + [None]
+        series = pd.Series(periods, dtype="time_period")
+
+        assert isinstance(series.dtype, TimePeriodDtype)
+        assert isinstance(series.array, TimePeriodArray)
+        assert series.array.to_periods() == periods
+        assert series.tolist() == periods
+        assert series.isna().tolist() == [False] * 50 + [True]
+        assert pd.api.types.pandas_dtype("time_period") == TimePeriodDtype()
+
+    def test_time_period_array_take_and_concat(self) -> None:
+        """Assert that take, with and without fill, and concat agree with the lists of
+        periods"""
+
+        periods = TestUtils.generate_time_periods(50)
+        array = TimePeriodArray.from_periods(periods)
+
+        indices = [3, 0, 49, 3]
+        assert array.take(indices).to_periods() == [periods[i] for i in indices]
+        assert array.take([1, -1], allow_fill=True).to_periods() == [periods[1], None]
+        with pytest.raises(IndexError):
+            array.take([50])
+
+        concatenated = pd.concat([pd.Series(array), pd.Series(array[:10])])
+        assert concatenated.dtype == TimePeriodDtype()
+        assert concatenated.tolist() == periods + periods[:10]
+        assert array[np.arange(50) % 2 == 0].to_periods() == periods[::2]
+
+    def test_time_period_array_sorts_by_start(self) -> None:
+        """Assert that sorting orders periods by start, with missing values last"""
+
+        periods = TestUtils.generate_time_periods(200, resolution_minutes=1)
+        series = pd.Series(periods + [None], dtype="time_period")
+
+        ordered = series.sort_values().tolist()
+        assert ordered[-1] is None
+        assert Counter(ordered[:-1]) == Counter(periods)
+        assert [p.start_ns for p in ordered[:-1]] == sorted(p.start_ns for p in periods)
+
+    def test_time_period_array_factorize(self) -> None:
+        """Assert that equal periods, including every InfiniteTimePeriod, share a code
+        in order of appearance"""
+
+        periods = TestUtils.generate_time_periods(300)
+        periods += [InfiniteTimePeriod(Time(1), Time(1)), None]
+        array = TimePeriodArray.from_periods(periods)
+
+        codes, uniques = array.factorize()
+        expected = list(dict.fromkeys(p for p in periods if p is not None))
+        assert uniques.to_periods() == expected
+        assert [None if code == -1 else expected[code] for code in codes] == periods
+        assert pd.Series(array).unique().to_periods() == expected + [None]
+        assert pd.Series(array).value_counts().sum() == len(periods) - 1
+
+    def test_time_period_array_equality(self) -> None:
+        """Assert that comparing with a period is elementwise equality, and that missing
+        periods are unequal to everything, including each other, as NaN is"""
+
+        periods = TestUtils.generate_time_periods(100)
+        series = pd.Series(periods + [None], dtype="time_period")
+
+        mask = series == periods[0]
+        assert mask.tolist() == [p == periods[0] for p in periods] + [False]
+        assert (series != periods[0]).tolist() == [p != periods[0] for p in periods] + [
+            True
+        ]
+
+        missing = pd.Series([None, None, periods[0]], dtype="time_period")
+        other = pd.Series([None, periods[0], None], dtype="time_period")
+        assert (missing == other).tolist() == [False, False, False]
+        assert (missing != other).tolist() == [True, True, True]
+
+    def test_time_period_array_contains(self) -> None:
+        """Assert that elementwise membership agrees with __contains__ for Times,
+        nanoseconds and datetime64 values"""
+
+        periods = TestUtils.generate_time_periods(100)
+        times = TestUtils.generate_times(100)
+        series = pd.Series(periods, dtype="time_period")
+        expected = [t in p for p, t in zip(periods, times)]
+
+        assert series.periods.contains(times).tolist() == expected
+        assert series.periods.contains(times_to_ns(times)).tolist() == expected
+
+        datetimes = pd.Series(
+            pd.Timestamp("2024-06-01") + pd.to_timedelta(times_to_ns(times))
+        )
+        assert series.periods.contains(datetimes).tolist() == expected
+        assert series.periods.contains(Time(12)).tolist() == [
+            Time(12) in p for p in periods
+        ]
+
+    def test_time_period_array_intersect(self) -> None:
+        """Assert that the elementwise intersection agrees with __and__"""
+
+        left = TestUtils.generate_time_periods(100)
+        right = TestUtils.generate_time_periods(100)
+        pieces = pd.Series(left, dtype="time_period").periods.intersect(
+            pd.Series(right, dtype="time_period")
+        )
+
+        for a, b, first, second in zip(left, right, pieces["first"], pieces["second"]):
+            intersection = a & b
+            if intersection is None:
+                assert (first, second) == (None, None)
+            elif isinstance(intersection, list):
+                assert [first, second] == intersection
+            else:
+                assert (first, second) == (intersection, None)
+
+    def test_periods_accessor_requires_time_period_dtype(self) -> None:
+        """Assert that the accessor is unavailable on other dtypes"""
+
+        with pytest.raises(AttributeError):
+            pd.Series([1, 2]).periods
+
+        with pytest.raises(TypeError):
+            TimePeriodArray.from_periods([LinearTimePeriod(Time(1), Time(2)), 3])
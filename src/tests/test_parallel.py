@@ -0,0 +1,135 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import LinearTimePeriod, ModularTimePeriod
+
+np = pytest.importorskip("numpy")
+
+from whenever_time_period.array import PeriodArray, times_to_ns  # noqa: E402
+from whenever_time_period.parallel import (  # noqa: E402
+    contains_many,
+    contains_pairs,
+    intersect_many,
+    intersect_pairs,
+)
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+class TestParallel:
+    def test_parallel_intersect_pairs(self, executor: ProcessPoolExecutor) -> None:
+        """Assert that chunked intersection in a process pool matches the vectorized
+        intersection, whatever the chunk size"""
+
+        left = TestUtils.generate_time_periods(1000)
+        right = TestUtils.generate_time_periods(1000)
+        expected = PeriodArray.from_periods(left) & PeriodArray.from_periods(right)
+
+        for chunk_size in (1000, 333, 7):
+            result = intersect_pairs(
+                left, right, chunk_size=chunk_size, executor=executor
+            )
+            for actual, wanted in zip(result, expected):
+                assert np.array_equal(actual.kind, wanted.kind)
+                assert actual.to_periods() == wanted.to_periods()
+
+    def test_parallel_contains_pairs(self, executor: ProcessPoolExecutor) -> None:
+        """Assert that chunked membership in a process pool agrees with __contains__,
+        for times given as whenever.Time objects or as nanoseconds"""
+
+        periods = TestUtils.generate_time_periods(500)
+        times = TestUtils.generate_times(500)
+        expected = [time in period for period, time in zip(periods, times)]
+
+        assert list(contains_pairs(periods, times, executor=executor)) == expected
+        assert (
+            list(
+                contains_pairs(
+                    PeriodArray.from_periods(periods),
+                    times_to_ns(times),
+                    chunk_size=64,
+                    executor=executor,
+                )
+            )
+            == expected
+        )
+
+    def test_parallel_own_pool_and_empty_input(self) -> None:
+        """Assert that a pool of the given size is created when no executor is given, and
+        that empty collections need no workers"""
+
+        night = ModularTimePeriod(Time(22), Time(6))
+        first, second = intersect_pairs(
+            [LinearTimePeriod(Time(3), Time(23))], [night], workers=1
+        )
+
+        assert first.to_periods() == [LinearTimePeriod(Time(3), Time(6))]
+        assert second.to_periods() == [LinearTimePeriod(Time(22), Time(23))]
+        assert len(contains_pairs([], [], workers=1)) == 0
+
+    def test_parallel_invalid_arguments(self) -> None:
+        """Assert that mismatched lengths and non-positive sizes are rejected"""
+
+        period = LinearTimePeriod(Time(3), Time(10))
+
+        with pytest.raises(ValueError):
+            intersect_pairs([period], [])
+        with pytest.raises(ValueError):
+            contains_pairs([period], [])
+        with pytest.raises(ValueError):
+            contains_pairs([period], [Time(4)], chunk_size=0)
+        with pytest.raises(ValueError):
+            contains_pairs([period], [Time(4)], workers=0)
+
+    def test_threaded_intersect_many(self) -> None:
+        """Assert that chunked intersection in a thread pool matches the vectorized
+        intersection, whatever the number of threads and chunk size"""
+
+        left = TestUtils.generate_time_periods(1000)
+        right = TestUtils.generate_time_periods(1000)
+        expected = PeriodArray.from_periods(left) & PeriodArray.from_periods(right)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = [
+                intersect_many(left, right, executor=executor, chunk_size=7),
+                intersect_many(
+                    PeriodArray.from_periods(left), right, threads=4, chunk_size=100
+                ),
+                intersect_many(left, right, threads=1, chunk_size=333),
+                intersect_many(left, right),
+            ]
+        for result in results:
+            for actual, wanted in zip(result, expected):
+                assert np.array_equal(actual.kind, wanted.kind)
+                assert actual.to_periods() == wanted.to_periods()
+
+    def test_threaded_contains_many(self) -> None:
+        """Assert that chunked membership in a thread pool agrees with __contains__, for
+        times given as whenever.Time objects or as nanoseconds"""
+
+        periods = TestUtils.generate_time_periods(500)
+        times = TestUtils.generate_times(500)
+        expected = [time in period for period, time in zip(periods, times)]
+
+        assert list(contains_many(periods, times, threads=4, chunk_size=9)) == expected
+        assert (
+            list(
+                contains_many(
+                    PeriodArray.from_periods(periods), times_to_ns(times), chunk_size=64
+                )
+            )
+            == expected
+        )
+        assert len(contains_many([], [])) == 0
+
+        with pytest.raises(ValueError):
+            contains_many(periods, times[1:])
+        with pytest.raises(ValueError):
+            intersect_many(periods, periods, threads=0)
@@ -0,0 +1,102 @@
+import operator
+import random
+from typing import Optional
+
+from whenever import Time, TimeDelta
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    AbstractTimePeriod,
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    TimePeriodSet,
+    coverage,
+)
+
+OPERATORS = {
+    "|": operator.or_,
+    "&": operator.and_,
+    "-": operator.sub,
+    "^": operator.xor,
+}
+
+
+class TestTimePeriodSet:
+    def test_time_period_set_algebra(
+        self,
+        set_a: TimePeriodSet,
+        operator: str,
+        set_b: Optional[TimePeriodSet],
+        expected_periods: list[AbstractTimePeriod],
+    ) -> None:
+        """Assert that the set operators produce the expected normalized periods"""
+
+        if operator == "~":
+            result = ~set_a
+        else:
+            result = OPERATORS[operator](set_a, set_b)
+
+        assert list(result) == expected_periods
+        assert len(result) == len(expected_periods)
+        assert TimePeriodSet(expected_periods) == result
+
+    def test_time_period_set_agrees_with_membership(self) -> None:
+        """Assert that membership of every set operation agrees with membership of the
+        underlying periods, for random collections of periods"""
+
+        times = TestUtils.generate_times(200)
+
+        for _ in range(100):
+            periods_a = TestUtils.generate_time_periods(random.randint(0, 6))
+            periods_b = TestUtils.generate_time_periods(random.randint(0, 6))
+            set_a, set_b = TimePeriodSet(periods_a), TimePeriodSet(periods_b)
+
+            for time in times:
+                in_a = any(time in period for period in periods_a)
+                in_b = any(time in period for period in periods_b)
+
+                assert (time in set_a) is in_a
+                assert (time in ~set_a) is not in_a
+                assert (time in set_a | set_b) is (in_a or in_b)
+                assert (time in set_a & set_b) is (in_a and in_b)
+                assert (time in set_a - set_b) is (in_a and not in_b)
+                assert (time in set_a ^ set_b) is (in_a != in_b)
+
+            assert TimePeriodSet(set_a) == set_a
+
+    def test_time_period_set_mixed_operands(self) -> None:
+        """Assert that TimePeriods can be used as operands on either side"""
+
+        period_set = TimePeriodSet([LinearTimePeriod(Time(2), Time(5))])
+        period = LinearTimePeriod(Time(1), Time(3))
+        expected = TimePeriodSet([LinearTimePeriod(Time(2), Time(3))])
+
+        assert period_set & period == expected
+        assert period & period_set == expected
+        assert period | period_set == period_set.union(period)
+        assert period - period_set == TimePeriodSet(
+            [LinearTimePeriod(Time(1), Time(2))]
+        )
+
+    def test_time_period_set_coverage(self) -> None:
+        """Assert that coverage counts the clock time of overlapping periods once, and
+        agrees with the hours contained by random collections of hourly periods"""
+
+        assert coverage([]) == TimeDelta()
+        assert coverage(
+            [
+                LinearTimePeriod(Time(9), Time(17)),
+                ModularTimePeriod(Time(16), Time(1)),
+            ]
+        ) == TimeDelta(hours=16)
+        assert coverage(
+            [ModularTimePeriod(Time(22), Time(6)), InfiniteTimePeriod(Time(3), Time(3))]
+        ) == TimeDelta(hours=24)
+
+        for _ in range(50):
+            periods = TestUtils.generate_time_periods(random.randint(0, 6))
+            hours = sum(
+                any(Time(hour) in period for period in periods) for hour in range(24)
+            )
+            assert coverage(periods) == TimeDelta(hours=hours)
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import InfiniteTimePeriod, LinearTimePeriod, ModularTimePeriod
+
+np = pytest.importorskip("numpy")
+
+from whenever_time_period.array import times_to_ns  # noqa: E402
+from whenever_time_period.schedule import UNLABELLED, Schedule  # noqa: E402
+
+
+class TestSchedule:
+    def test_schedule_classify(self) -> None:
+        """Assert that classification labels every time with the first entry containing
+        it, or UNLABELLED"""
+
+        times = TestUtils.generate_times(200)
+
+        for _ in range(50):
+            labels = random.choices("abcd", k=random.randint(0, 6))
+            periods = TestUtils.generate_time_periods(len(labels))
+            entries = list(zip(labels, periods))
+            schedule = Schedule(entries)
+
+            expected = [
+                next((label for label, period in entries if time in period), None)
+                for time in times
+            ]
+            label_ids = schedule.classify(times_to_ns(times))
+
+            assert label_ids.dtype == np.int32
+            assert [
+                None if label_id == UNLABELLED else schedule.labels[label_id]
+                for label_id in label_ids
+            ] == expected
+            assert [schedule.label_of(time) for time in times] == expected
+
+    def test_schedule_segments(self) -> None:
+        """Assert that overlapping entries are resolved by priority and that neighbouring
+        segments of the same label are merged"""
+
+        schedule = Schedule(
+            [
+                ("peak", LinearTimePeriod(Time(17), Time(21))),
+                ("off-peak", LinearTimePeriod(Time(0), Time(7))),
+                ("off-peak", LinearTimePeriod(Time(7), Time(8))),
+                ("standard", InfiniteTimePeriod(Time(0), Time(0))),
+            ]
+        )
+
+        assert schedule.labels == ("peak", "off-peak", "standard")
+        assert list(schedule.segments()) == [
+            ("off-peak", LinearTimePeriod(Time(0), Time(8))),
+            ("standard", LinearTimePeriod(Time(8), Time(17))),
+            ("peak", LinearTimePeriod(Time(17), Time(21))),
+            ("standard", ModularTimePeriod(Time(21), Time(0))),
+        ]
+        assert Schedule([]).label_of(Time(5)) is None
+
+    def test_schedule_datetime64_and_immutability(self) -> None:
+        """Assert that datetime64 values are classified by their clock time, NaT as
+        UNLABELLED, and that the lookup arrays are read-only"""
+
+        schedule = Schedule([("night", LinearTimePeriod(Time(0), Time(6)))])
+        values = np.array(
+            ["2024-01-01T03:00", "1969-12-31T23:00", "NaT", "2024-06-01T05:59:59"],
+            dtype="datetime64[s]",
+        )
+
+        assert list(schedule.classify(values)) == [0, UNLABELLED, UNLABELLED, 0]
+        with pytest.raises(ValueError):
+            schedule.classify(np.array([-1]))
+        with pytest.raises(ValueError):
+            schedule.boundaries[0] = 1
+        with pytest.raises(ValueError):
+            schedule.label_ids[0] = 1
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    AbstractTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    intersect_all,
+    intersect_all_columns,
+)
+
+
+def all_pairs(
+    left: list[AbstractTimePeriod], right: list[AbstractTimePeriod]
+) -> list[tuple[int, int, AbstractTimePeriod]]:
+    """The expected intersection triples, by intersecting every pair"""
+
+    triples = []
+    for i, period_a in enumerate(left):
+        for j, period_b in enumerate(right):
+            pieces = period_a & period_b
+            if pieces is None:
+                continue
+            for piece in pieces if isinstance(pieces, list) else [pieces]:
+                triples.append((i, j, piece))
+    return triples
+
+
+class TestSweep:
+    def test_intersect_all_agrees_with_intersection(self) -> None:
+        """Assert that the sweep reports the same pieces as intersecting every pair"""
+
+        for _ in range(50):
+            left = TestUtils.generate_time_periods(random.randint(0, 40), 30)
+            right = TestUtils.generate_time_periods(random.randint(0, 40), 30)
+
+            assert list(intersect_all(left, right)) == all_pairs(left, right)
+
+    def test_intersect_all_double_overlap(self) -> None:
+        """Assert that a LinearTimePeriod & ModularTimePeriod double overlap yields both
+        pieces under the same pair of indices"""
+
+        left = [LinearTimePeriod(Time(3), Time(10)), LinearTimePeriod(Time(5), Time(6))]
+        right = [ModularTimePeriod(Time(7), Time(5))]
+
+        assert list(intersect_all(left, right)) == [
+            (0, 0, LinearTimePeriod(Time(3), Time(5))),
+            (0, 0, LinearTimePeriod(Time(7), Time(10))),
+        ]
+
+    def test_intersect_all_columns(self) -> None:
+        """Assert that the columnar output holds the same triples as the generator"""
+
+        pytest.importorskip("numpy")
+
+        left = TestUtils.generate_time_periods(200, 30)
+        right = TestUtils.generate_time_periods(200, 30)
+        columns = intersect_all_columns(left, right)
+
+        assert list(
+            zip(
+                columns.left_index.tolist(),
+                columns.right_index.tolist(),
+                columns.periods.to_periods(),
+            )
+        ) == list(intersect_all(left, right))
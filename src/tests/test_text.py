@@ -0,0 +1,81 @@
+import pytest
+from whenever import Time
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    MalformedRow,
+    ModularTimePeriod,
+    format_period,
+    format_periods,
+    parse_period,
+    parse_periods,
+    text,
+)
+
+
+class TestText:
+    def test_parse_period_classifies(self) -> None:
+        """Assert that the subclass is chosen from the ordering of the times, and that
+        fractions of seconds and surrounding whitespace are accepted"""
+
+        assert parse_period("22:00-06:00") == ModularTimePeriod(Time(22), Time(6))
+        assert parse_period("09:30:00.5-17:00") == LinearTimePeriod(
+            Time(9, 30, nanosecond=500_000_000), Time(17)
+        )
+        assert parse_period(" 03:00 - 03:00\n") == InfiniteTimePeriod(Time(3), Time(3))
+        assert isinstance(parse_period("03:00-03:00"), InfiniteTimePeriod)
+
+        with pytest.raises(ValueError):
+            parse_period("9am-5pm")
+
+    def test_parse_periods_reports_malformed_rows(self) -> None:
+        """Assert that malformed rows yield None in place and are reported with their
+        row number, without raising"""
+
+        errors: list[MalformedRow] = []
+        rows = ["22:00-06:00", "9am-5pm", "25:00-01:00", None, "", "22:00-06:00"]
+        periods = list(parse_periods(rows, errors))
+
+        night = ModularTimePeriod(Time(22), Time(6))
+        assert periods == [night, None, None, None, None, night]
+        assert periods[0] is periods[-1]
+        assert [(error.row, error.text) for error in errors] == [
+            (1, "9am-5pm"),
+            (2, "25:00-01:00"),
+            (3, None),
+            (4, ""),
+        ]
+        assert all(error.reason for error in errors)
+        assert list(parse_periods(rows)) == periods
+
+    def test_format_periods_round_trip(self) -> None:
+        """Assert that formatted periods parse back to equal periods of the same
+        subclass, including nanosecond bounds"""
+
+        periods = TestUtils.generate_time_periods(500, resolution_minutes=1)
+        periods.append(
+            LinearTimePeriod(Time(9, nanosecond=1), Time(17, 0, 59, nanosecond=10))
+        )
+
+        texts = list(format_periods(periods))
+        assert texts == [format_period(period) for period in periods]
+        parsed = list(parse_periods(texts))
+        assert parsed == periods
+        assert [type(p) for p in parsed] == [type(p) for p in periods]
+        assert (
+            format_period(ModularTimePeriod(Time(22), Time(6))) == "22:00:00-06:00:00"
+        )
+
+    def test_parse_periods_reuses_rows_after_the_cache_fills(self, monkeypatch) -> None:
+        """Assert that repeated rows yield the same period object even after more
+        distinct rows than the cache holds have been parsed"""
+
+        monkeypatch.setattr(text, "TEXT_CACHE_SIZE", 4)
+        rows = [f"{hour:02}:00-{hour + 1:02}:00" for hour in range(10)]
+
+        parsed = list(parse_periods(rows + rows[-2:] + rows[:1] + rows[:1]))
+        assert parsed[:10] == [parse_period(row) for row in rows]
+        assert parsed[10] is parsed[8] and parsed[11] is parsed[9]
+        assert parsed[12] == parsed[0] and parsed[13] is parsed[12]
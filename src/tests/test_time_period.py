@@ -1,12 +1,16 @@
+import pickle
+from dataclasses import FrozenInstanceError
 from typing import Any, Optional
 
-from whenever import Time
+import pytest
+from whenever import Time, TimeDelta
 
 from whenever_time_period.abstract import AbstractTimePeriod
 from whenever_time_period.time_period import (
     InfiniteTimePeriod,
     LinearTimePeriod,
     ModularTimePeriod,
+    from_times,
 )
 
 
@@ -25,6 +29,74 @@ class TestTimePeriod:
             inst = subcls(start_time, end_time)
             assert inst.start_time == start_time and inst.end_time == end_time
 
+    def test_time_period_from_times(
+        self, start_time: Time, end_time: Time, expected_subcls: type
+    ) -> None:
+        """Assert that from_times constructs an instance of the expected subclass, equal
+        to one constructed directly"""
+
+        period = from_times(start_time, end_time)
+
+        assert type(period) is expected_subcls
+        assert period == expected_subcls(start_time, end_time)
+        assert (period.start_ns, period.end_ns) == (
+            expected_subcls(start_time, end_time).start_ns,
+            expected_subcls(start_time, end_time).end_ns,
+        )
+
+    def test_time_period_is_frozen_and_hashable(self) -> None:
+        """Assert that TimePeriods are immutable, slotted, and usable as set members,
+        with InfiniteTimePeriods all hashing equal"""
+
+        period = LinearTimePeriod(Time(5), Time(10))
+
+        with pytest.raises(FrozenInstanceError):
+            period.start_time = Time(6)
+        assert not hasattr(period, "__dict__")
+        assert period.start_ns == 5 * 3_600_000_000_000
+
+        periods = {
+            period,
+            LinearTimePeriod(Time(5), Time(10)),
+            ModularTimePeriod(Time(10), Time(5)),
+            InfiniteTimePeriod(Time(1), Time(1)),
+            InfiniteTimePeriod(Time(2), Time(2)),
+        }
+        assert len(periods) == 3
+
+    def test_time_period_duration(self) -> None:
+        """Assert that the duration of each subclass is the clock time it covers,
+        wrapping around midnight for ModularTimePeriods"""
+
+        assert LinearTimePeriod(Time(5), Time(10, 30)).duration == TimeDelta(
+            hours=5, minutes=30
+        )
+        assert ModularTimePeriod(Time(22), Time(6)).duration == TimeDelta(hours=8)
+        assert ModularTimePeriod(Time(0, nanosecond=1), Time(0)).duration == TimeDelta(
+            hours=24, nanoseconds=-1
+        )
+        assert InfiniteTimePeriod(Time(3), Time(3)).duration == TimeDelta(hours=24)
+
+    def test_time_period_pickles_compactly(self) -> None:
+        """Assert that TimePeriods pickle as their class and nanosecond bounds, and are
+        restored with equal times"""
+
+        for period in (
+            LinearTimePeriod(Time(5), Time(10, nanosecond=1)),
+            ModularTimePeriod(Time(22), Time(6)),
+            InfiniteTimePeriod(Time(3), Time(3)),
+        ):
+            restored = pickle.loads(pickle.dumps(period))
+
+            assert type(restored) is type(period) and restored == period
+            assert restored.start_time == period.start_time
+            assert restored.end_time == period.end_time
+            assert period.__reduce__()[1] == (
+                type(period),
+                period.start_ns,
+                period.end_ns,
+            )
+
     def test_time_period_membership(
         self, period: AbstractTimePeriod, candidate_time: Time, is_expected_member: bool
     ) -> None:
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from typing import Optional
+
+from whenever import Instant, Time, TimeDelta
+
+from whenever_time_period import InfiniteTimePeriod, from_times
+from whenever_time_period.watch import ENTER, EXIT, PeriodEvent, PeriodWatcher
+
+NOON = Instant.from_utc(2024, 6, 1, 12)
+
+
+class PinnedClock:
+    """A clock reading noon UTC on a fixed date, far from midnight, which stands still
+    until started, so periods are added at a known instant, and then runs in real
+    time"""
+
+    def __init__(self) -> None:
+        self._started: Optional[int] = None
+
+    def start(self) -> None:
+        self._started = time.monotonic_ns()
+
+    def __call__(self) -> Instant:
+        if self._started is None:
+            return NOON
+        return NOON + TimeDelta(nanoseconds=time.monotonic_ns() - self._started)
+
+    def times(self, *milliseconds: int) -> list[Time]:
+        """The UTC clock times the given numbers of milliseconds from now"""
+
+        now = self().to_tz("UTC")
+        return [(now + TimeDelta(milliseconds=ms)).time() for ms in milliseconds]
+
+
+async def collect(watcher: PeriodWatcher, n: int) -> list[PeriodEvent]:
+    events = []
+    async for event in watcher:
+        events.append(event)
+        if len(events) == n:
+            return events
+
+
+class TestPeriodWatcher:
+    def test_period_watcher_events_in_order(self) -> None:
+        """Assert that enter and exit events are emitted in order of their boundaries, no
+        earlier than the boundary, and that current periods are entered immediately"""
+
+        clock = PinnedClock()
+        before, start_a, start_b, end_b, end_a = clock.times(-100, 60, 100, 140, 180)
+        watcher = PeriodWatcher(
+            {
+                "a": from_times(start_a, end_a),
+                "b": from_times(start_b, end_b),
+                "current": from_times(before, start_b),
+                "always": InfiniteTimePeriod(Time(1), Time(1)),
+            },
+            clock=clock,
+        )
+
+        clock.start()
+        events = asyncio.run(collect(watcher, 7))
+
+        assert [(event.kind, event.key) for event in events] == [
+            (ENTER, "current"),
+            (ENTER, "always"),
+            (ENTER, "a"),
+            (ENTER, "b"),
+            (EXIT, "current"),
+            (EXIT, "b"),
+            (EXIT, "a"),
+        ]
+        assert events[0].at.to_instant() == NOON
+        assert events[2].at.time() == start_a
+        assert events[-1].at.time() == end_a
+        assert clock() >= events[-1].at.to_instant()
+
+    def test_period_watcher_add_and_remove(self) -> None:
+        """Assert that removed periods emit no events, and that a period added while the
+        watcher sleeps wakes it for an earlier boundary"""
+
+        clock = PinnedClock()
+        start, end, late_start, late_end = clock.times(150, 250, 60_000, 61_000)
+        watcher = PeriodWatcher([("removed", from_times(start, end))], clock=clock)
+        watcher.add("late", from_times(late_start, late_end))
+        watcher.remove("removed")
+        assert "removed" not in watcher and len(watcher) == 1
+
+        async def scenario() -> list[PeriodEvent]:
+            consumer = asyncio.create_task(collect(watcher, 2))
+            # let the consumer start waiting for the late boundary
+            for _ in range(3):
+                await asyncio.sleep(0)
+            watcher.add("added", from_times(*clock.times(50, 100)))
+            return await asyncio.wait_for(consumer, 10)
+
+        clock.start()
+        events = asyncio.run(scenario())
+
+        assert [(event.kind, event.key) for event in events] == [
+            (ENTER, "added"),
+            (EXIT, "added"),
+        ]
+
+    def test_period_watcher_callbacks(self) -> None:
+        """Assert that run calls both plain and coroutine callbacks with every event"""
+
+        clock = PinnedClock()
+        start, end = clock.times(20, 40)
+        received, awaited = [], []
+
+        async def record(event: PeriodEvent) -> None:
+            awaited.append(event.kind)
+
+        async def scenario() -> None:
+            tasks = [
+                asyncio.create_task(
+                    PeriodWatcher({"window": from_times(start, end)}, clock=clock).run(
+                        callback
+                    )
+                )
+                for callback in (lambda event: received.append(event.kind), record)
+            ]
+
+            # wait for both exits however late they arrive, then stop the watchers
+            async def both_exited() -> None:
+                while len(received) < 2 or len(awaited) < 2:
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(both_exited(), 10)
+            for task in tasks:
+                task.cancel()
+
+        clock.start()
+        asyncio.run(scenario())
+
+        assert received == awaited == [ENTER, EXIT]
@@ -0,0 +1,208 @@
+import pickle
+
+import pytest
+from whenever import PlainDateTime, Time, Weekday, ZonedDateTime
+
+from tests.utils import TestUtils
+from whenever_time_period import (
+    AbstractTimePeriod,
+    InfiniteTimePeriod,
+    InfiniteWeeklyTimePeriod,
+    LinearTimePeriod,
+    LinearWeeklyTimePeriod,
+    ModularTimePeriod,
+    ModularWeeklyTimePeriod,
+    TimePeriodSet,
+    WeeklyPeriodIndex,
+    WeeklyTimePeriodSet,
+    weekly_from_times,
+)
+
+# the start of every hour of the week of Monday 2024-01-01
+HOURS_OF_WEEK = [PlainDateTime(2024, 1, 1 + h // 24, h % 24) for h in range(168)]
+
+
+def covered_hours(periods) -> set[PlainDateTime]:
+    """The hours of the week in any of the given periods, or pieces of an intersection"""
+
+    if periods is None:
+        return set()
+    if not isinstance(periods, list):
+        periods = [periods]
+    return {moment for moment in HOURS_OF_WEEK if any(moment in p for p in periods)}
+
+
+class TestWeeklyTimePeriod:
+    def test_weekly_time_period_construction(self) -> None:
+        """Assert that the subclass is chosen from the ordering of the bounds in a week
+        starting on Monday, and that mismatched bounds are rejected"""
+
+        overnight = weekly_from_times(
+            Weekday.MONDAY, Time(22), Weekday.TUESDAY, Time(6)
+        )
+        weekend = weekly_from_times(Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8))
+        always = weekly_from_times(Weekday.SUNDAY, Time(3), Weekday.SUNDAY, Time(3))
+
+        assert overnight == LinearWeeklyTimePeriod(
+            Weekday.MONDAY, Time(22), Weekday.TUESDAY, Time(6)
+        )
+        assert isinstance(weekend, ModularWeeklyTimePeriod)
+        assert always == InfiniteWeeklyTimePeriod(
+            Weekday.MONDAY, Time(0), Weekday.MONDAY, Time(0)
+        )
+        assert weekend.duration.total("hours") == 63
+        assert repr(weekend) == "ModularWeeklyTimePeriod[Fri 17:00:00, Mon 08:00:00)"
+
+        with pytest.raises(ValueError):
+            LinearWeeklyTimePeriod(Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8))
+        with pytest.raises(ValueError):
+            ModularWeeklyTimePeriod(Weekday.MONDAY, Time(22), Weekday.TUESDAY, Time(6))
+
+    def test_weekly_time_period_membership(self) -> None:
+        """Assert that datetimes are members by their local day of the week and clock
+        time, and that other objects are never members"""
+
+        weekend = ModularWeeklyTimePeriod(
+            Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8)
+        )
+
+        assert PlainDateTime(2024, 1, 6, 12) in weekend
+        assert PlainDateTime(2024, 1, 8, 7, 59) in weekend
+        assert PlainDateTime(2024, 1, 8, 8) not in weekend
+        assert PlainDateTime(2024, 1, 5, 16, 59) not in weekend
+        assert ZonedDateTime(2024, 1, 5, 17, tz="Asia/Tokyo") in weekend
+        assert Time(12) not in weekend
+
+        for period in TestUtils.generate_weekly_time_periods(100):
+            for moment in HOURS_OF_WEEK:
+                ns = (moment.day_of_week().value - 1) * 24 + moment.hour
+                start = period.start_ns // 3_600_000_000_000
+                end = period.end_ns // 3_600_000_000_000
+                if start < end:
+                    expected = start <= ns < end
+                elif end < start:
+                    expected = start <= ns or ns < end
+                else:
+                    expected = True
+                assert (moment in period) is expected
+
+    def test_weekly_time_period_intersection(self) -> None:
+        """Assert that intersections with weekly and daily periods cover exactly the
+        hours of the week covered by both operands"""
+
+        weekly = TestUtils.generate_weekly_time_periods(100)
+        daily = TestUtils.generate_time_periods(100)
+        others = TestUtils.generate_weekly_time_periods(100)
+
+        for period, day, other in zip(weekly, daily, others):
+            day_hours = {m for m in HOURS_OF_WEEK if m.time() in day}
+            assert covered_hours(period & other) == covered_hours(
+                period
+            ) & covered_hours(other)
+            assert covered_hours(period & day) == covered_hours(period) & day_hours
+            assert covered_hours(day & period) == covered_hours(period) & day_hours
+
+        weekend = ModularWeeklyTimePeriod(
+            Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8)
+        )
+        assert weekend & LinearTimePeriod(Time(9), Time(17)) == [
+            LinearWeeklyTimePeriod(
+                Weekday.SATURDAY, Time(9), Weekday.SATURDAY, Time(17)
+            ),
+            LinearWeeklyTimePeriod(Weekday.SUNDAY, Time(9), Weekday.SUNDAY, Time(17)),
+        ]
+        assert weekend & InfiniteTimePeriod(Time(0), Time(0)) == weekend
+
+    def test_weekly_time_period_with_time_period_sets(self) -> None:
+        """Assert that weekly periods intersect and unite with daily and weekly sets in
+        either operand order, as weekly sets"""
+
+        weekend = ModularWeeklyTimePeriod(
+            Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8)
+        )
+        daily = TimePeriodSet([LinearTimePeriod(Time(9), Time(17))])
+        weekly = WeeklyTimePeriodSet([weekend])
+
+        assert daily & weekend == weekend & daily == weekly & daily
+        assert daily | weekend == weekend | daily == weekly | daily
+        assert weekly & weekend == weekend & weekly == weekly
+        assert weekend | weekly == weekly
+        assert isinstance(daily & weekend, WeeklyTimePeriodSet)
+        with pytest.raises(TypeError):
+            weekend | 3
+
+    def test_weekly_time_period_ordering_and_pickling(self) -> None:
+        """Assert that weekly periods sort by start, are not comparable with daily
+        periods, and pickle to equal periods"""
+
+        periods = TestUtils.generate_weekly_time_periods(50)
+
+        assert [p.start_ns for p in sorted(periods)] == sorted(
+            p.start_ns for p in periods
+        )
+        assert pickle.loads(pickle.dumps(periods)) == periods
+        with pytest.raises(TypeError):
+            periods[0] < LinearTimePeriod(Time(1), Time(2))
+
+
+class TestWeeklyTimePeriodSet:
+    def test_weekly_time_period_set_agrees_with_membership(self) -> None:
+        """Assert that set algebra over weekly periods and daily sets agrees with
+        membership of the hours of the week"""
+
+        a = TestUtils.generate_weekly_time_periods(5)
+        b = TestUtils.generate_weekly_time_periods(5)
+        daily = TimePeriodSet(TestUtils.generate_time_periods(3))
+        a_set, b_set = WeeklyTimePeriodSet(a), WeeklyTimePeriodSet(b)
+        daily_hours = {m for m in HOURS_OF_WEEK if m.time() in daily}
+
+        for result, expected in [
+            (a_set | b_set, covered_hours(a) | covered_hours(b)),
+            (a_set & b_set, covered_hours(a) & covered_hours(b)),
+            (a_set - b_set, covered_hours(a) - covered_hours(b)),
+            (a_set ^ b_set, covered_hours(a) ^ covered_hours(b)),
+            (~a_set, set(HOURS_OF_WEEK) - covered_hours(a)),
+            (a_set & daily, covered_hours(a) & daily_hours),
+            (daily | a_set, covered_hours(a) | daily_hours),
+        ]:
+            assert isinstance(result, WeeklyTimePeriodSet)
+            assert {m for m in HOURS_OF_WEEK if m in result} == expected
+            assert covered_hours(list(result)) == expected
+            assert WeeklyTimePeriodSet(result) == result
+
+    def test_weekly_time_period_set_wraparound(self) -> None:
+        """Assert that intervals touching at midnight on Sunday rejoin into a single
+        ModularWeeklyTimePeriod, and that daily periods recur on every day"""
+
+        weekend = ModularWeeklyTimePeriod(
+            Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8)
+        )
+        night = ModularTimePeriod(Time(22), Time(6))
+
+        assert list(WeeklyTimePeriodSet([weekend])) == [weekend]
+        assert len(WeeklyTimePeriodSet([night])) == 7
+        assert WeeklyTimePeriodSet([night]).duration.total("hours") == 56
+        assert list(WeeklyTimePeriodSet.full()) == [
+            InfiniteWeeklyTimePeriod(Weekday.MONDAY, Time(0), Weekday.MONDAY, Time(0))
+        ]
+        assert WeeklyTimePeriodSet() != TimePeriodSet()
+
+
+class TestWeeklyPeriodIndex:
+    def test_weekly_period_index_agrees_with_membership(self) -> None:
+        """Assert that stabbing queries report exactly the keys of the weekly and daily
+        periods which contain the queried datetime"""
+
+        periods = TestUtils.generate_weekly_time_periods(200)
+        periods += TestUtils.generate_time_periods(50)
+        index = WeeklyPeriodIndex(enumerate(periods))
+
+        def contains(period, moment):
+            if isinstance(period, AbstractTimePeriod):
+                return moment.time() in period
+            return moment in period
+
+        for moment, keys in zip(HOURS_OF_WEEK, index.stab_many(HOURS_OF_WEEK)):
+            expected = [i for i, p in enumerate(periods) if contains(p, moment)]
+            assert sorted(keys) == expected
+            assert sorted(index.stab(moment)) == expected
@@ -1,5 +1,17 @@
 import random
 
+from whenever import Time, Weekday
+
+from whenever_time_period import (
+    AbstractTimePeriod,
+    AbstractWeeklyTimePeriod,
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    from_times,
+    weekly_from_times,
+)
+
 
 class TestUtils:
     """A collection of test generator tools, (which themselves are tested)"""
@@ -42,3 +54,68 @@ class TestUtils:
             current = next
 
         return sorted(numbers)
+
+    @staticmethod
+    def generate_time_periods(
+        N: int, resolution_minutes: int = 60
+    ) -> list[AbstractTimePeriod]:
+        """Generates N random TimePeriods of every kind, with bounds on a grid of the
+        given resolution in minutes so that boundary cases (touching and equal bounds)
+        are frequent."""
+
+        steps = 24 * 60 // resolution_minutes
+
+        def random_time() -> Time:
+            hour, minute = divmod(random.randrange(steps) * resolution_minutes, 60)
+            return Time(hour, minute)
+
+        return [from_times(random_time(), random_time()) for _ in range(N)]
+
+    @staticmethod
+    def generate_time_periods_of(
+        subcls: type[AbstractTimePeriod], N: int
+    ) -> list[AbstractTimePeriod]:
+        """Generates N random TimePeriods of the given subclass, with whole hour bounds"""
+
+        periods = []
+        for _ in range(N):
+            start, end = sorted(random.sample(range(24), 2))
+            if subcls is LinearTimePeriod:
+                periods.append(LinearTimePeriod(Time(start), Time(end)))
+            elif subcls is ModularTimePeriod:
+                periods.append(ModularTimePeriod(Time(end), Time(start)))
+            elif subcls is InfiniteTimePeriod:
+                periods.append(InfiniteTimePeriod(Time(start), Time(start)))
+            else:
+                raise TypeError(subcls)
+        return periods
+
+    @staticmethod
+    def generate_weekly_time_periods(
+        N: int, resolution_hours: int = 6
+    ) -> list[AbstractWeeklyTimePeriod]:
+        """Generates N random WeeklyTimePeriods of every kind, with bounds on a grid of
+        the given resolution in hours"""
+
+        def random_bound() -> tuple[Weekday, Time]:
+            day = random.choice(list(Weekday))
+            return day, Time(random.randrange(0, 24, resolution_hours))
+
+        return [weekly_from_times(*random_bound(), *random_bound()) for _ in range(N)]
+
+    @staticmethod
+    def generate_times(N: int) -> list[Time]:
+        """Generates N random clock times to nanosecond precision, including the start
+        of every hour so that period bounds are hit."""
+
+        times = [Time(hour) for hour in range(24)]
+        while len(times) < N:
+            times.append(
+                Time(
+                    random.randrange(24),
+                    random.randrange(60),
+                    random.randrange(60),
+                    nanosecond=random.randrange(1_000_000_000),
+                )
+            )
+        return times[:N]
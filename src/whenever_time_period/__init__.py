@@ -1,4 +1,85 @@
+from . import instrumentation
 from .abstract import AbstractTimePeriod
-from .time_period import InfiniteTimePeriod, LinearTimePeriod, ModularTimePeriod
+from .bitmap import PeriodBitmap
+from .bucketize import PeriodBucket, bucketize
+from .cache import CacheInfo, PeriodCache
+from .expand import Occurrence, expand
+from .expression import PeriodExpression, lazy
+from .free_slots import FreeSlots
+from .index import PeriodIndex, WeeklyPeriodIndex
+from .live_index import LivePeriodIndex, PeriodSnapshot
+from .nanoseconds import (
+    NS_PER_DAY,
+    NS_PER_WEEK,
+    ns_to_time,
+    ns_to_week,
+    time_to_ns,
+    week_to_ns,
+)
+from .period_set import TimePeriodSet, coverage
+from .sweep import intersect_all, intersect_all_columns
+from .text import (
+    MalformedRow,
+    format_period,
+    format_periods,
+    parse_period,
+    parse_periods,
+)
+from .time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    from_times,
+)
+from .weekly import (
+    AbstractWeeklyTimePeriod,
+    InfiniteWeeklyTimePeriod,
+    LinearWeeklyTimePeriod,
+    ModularWeeklyTimePeriod,
+    WeeklyTimePeriodSet,
+    weekly_from_times,
+)
 
-__all__ = [AbstractTimePeriod, InfiniteTimePeriod, LinearTimePeriod, ModularTimePeriod]
+__all__ = [
+    "AbstractTimePeriod",
+    "AbstractWeeklyTimePeriod",
+    "CacheInfo",
+    "FreeSlots",
+    "InfiniteTimePeriod",
+    "InfiniteWeeklyTimePeriod",
+    "LinearTimePeriod",
+    "LinearWeeklyTimePeriod",
+    "LivePeriodIndex",
+    "MalformedRow",
+    "ModularTimePeriod",
+    "ModularWeeklyTimePeriod",
+    "NS_PER_DAY",
+    "NS_PER_WEEK",
+    "Occurrence",
+    "PeriodBitmap",
+    "PeriodBucket",
+    "PeriodCache",
+    "PeriodExpression",
+    "PeriodIndex",
+    "PeriodSnapshot",
+    "TimePeriodSet",
+    "WeeklyPeriodIndex",
+    "WeeklyTimePeriodSet",
+    "bucketize",
+    "coverage",
+    "expand",
+    "format_period",
+    "format_periods",
+    "from_times",
+    "instrumentation",
+    "intersect_all",
+    "intersect_all_columns",
+    "lazy",
+    "ns_to_time",
+    "ns_to_week",
+    "parse_period",
+    "parse_periods",
+    "time_to_ns",
+    "week_to_ns",
+    "weekly_from_times",
+]
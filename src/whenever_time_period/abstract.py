@@ -1,20 +1,62 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from plum import dispatch
-from whenever import Time
+from whenever import Time, TimeDelta
 
+from whenever_time_period.dispatch import KernelTable
+from whenever_time_period.nanoseconds import ns_to_time, time_to_ns
 
-@dataclass
+if TYPE_CHECKING:
+    from whenever_time_period.expression import PeriodExpression
+
+less_than = KernelTable("less_than")
+greater_than = KernelTable("greater_than")
+
+
+@dataclass(frozen=True, slots=True)
 class AbstractTimePeriod(ABC):
     """A TimePeriod is an abstract right-open clock interval of whenever.Time objects,
     [start_time, end_time). There is no restriction on the relationship between start_time
-    and end_time."""
+    and end_time.
+
+    TimePeriods are immutable and hashable. The start and end times are cached as integer
+    nanoseconds since midnight, start_ns and end_ns, which are used for comparisons,
+    equality and hashing."""
+
+    start_time: Time = field(compare=False)
+    end_time: Time = field(compare=False)
+    start_ns: int = field(init=False, repr=False)
+    end_ns: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "start_ns", time_to_ns(self.start_time))
+        object.__setattr__(self, "end_ns", time_to_ns(self.end_time))
+
+    @classmethod
+    def _from_parts(
+        cls, start_time: Time, end_time: Time, start_ns: int, end_ns: int
+    ) -> AbstractTimePeriod:
+        """Construct an instance from already validated parts, skipping __post_init__"""
 
-    start_time: Time
-    end_time: Time
+        period = object.__new__(cls)
+        object.__setattr__(period, "start_time", start_time)
+        object.__setattr__(period, "end_time", end_time)
+        object.__setattr__(period, "start_ns", start_ns)
+        object.__setattr__(period, "end_ns", end_ns)
+        return period
+
+    def __reduce__(self) -> tuple:
+        # pickle as (class, start_ns, end_ns) rather than the dataclass state, which
+        # would also pickle both whenever.Time objects
+        return _unpickle, (type(self), self.start_ns, self.end_ns)
+
+    @property
+    @abstractmethod
+    def duration(self) -> TimeDelta:
+        """The length of clock time covered by the period"""
 
     @abstractmethod
     def __contains__(self, other: AbstractTimePeriod) -> bool: ...
@@ -22,24 +64,48 @@ class AbstractTimePeriod(ABC):
     @abstractmethod
     def __and__(self, other: AbstractTimePeriod) -> AbstractTimePeriod | None: ...
 
+    def __invert__(self) -> PeriodExpression:
+        """The lazy complement of the period, see whenever_time_period.expression"""
+
+        # imported here as the expression module builds on the period classes
+        from whenever_time_period.expression import lazy
+
+        return ~lazy(self)
+
     # The sorted ordering of Sequence[AbstractTimePeriod] is
     # arbitrarily defined by the value of the start_time relative
     # to the value being compared (or it's start time)
-    @dispatch
-    def __lt__(self, other: Time) -> bool:
-        return self.start_time < other
+    def __lt__(self, other: Time | AbstractTimePeriod) -> bool:
+        return less_than(self, other)
 
-    @dispatch
-    def __lt__(self, other: AbstractTimePeriod) -> bool:  # noqa: F811
-        return self.start_time < other.start_time
-
-    @dispatch
-    def __gt__(self, other: Time) -> bool:
-        return self.start_time > other
-
-    @dispatch
-    def __gt__(self, other: AbstractTimePeriod) -> bool:  # noqa: F811
-        return self.start_time > other.start_time
+    def __gt__(self, other: Time | AbstractTimePeriod) -> bool:
+        return greater_than(self, other)
 
     def __repr__(self) -> str:
+        # whenever formats the cached Times natively, which is as fast as any cache
+        # lookup and costs the same for every period, however many are logged
         return f"{self.__class__.__name__}[{self.start_time}, {self.end_time})"
+
+
+def _unpickle(cls: type, start_ns: int, end_ns: int) -> AbstractTimePeriod:
+    return cls._from_parts(ns_to_time(start_ns), ns_to_time(end_ns), start_ns, end_ns)
+
+
+@less_than.register
+def _(period: AbstractTimePeriod, other: Time) -> bool:
+    return period.start_time < other
+
+
+@less_than.register
+def _(period: AbstractTimePeriod, other: AbstractTimePeriod) -> bool:
+    return period.start_ns < other.start_ns
+
+
+@greater_than.register
+def _(period: AbstractTimePeriod, other: Time) -> bool:
+    return period.start_time > other
+
+
+@greater_than.register
+def _(period: AbstractTimePeriod, other: AbstractTimePeriod) -> bool:
+    return period.start_ns > other.start_ns
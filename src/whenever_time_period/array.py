@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+from whenever import Time
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import NS_PER_DAY, time_to_ns
+from whenever_time_period.time_period import PERIOD_TYPES, PeriodKind, from_ns
+
+# kind code of an absent period, e.g. an empty intersection
+EMPTY = -1
+
+LINEAR, MODULAR, INFINITE = PeriodKind.LINEAR, PeriodKind.MODULAR, PeriodKind.INFINITE
+
+
+def times_to_ns(times: Iterable[Time]) -> np.ndarray:
+    """Return the nanoseconds since midnight of the given whenever.Time objects as an
+    int64 array"""
+
+    return np.fromiter((time_to_ns(t) for t in times), dtype=np.int64)
+
+
+def kinds_of(start_ns: np.ndarray, end_ns: np.ndarray) -> np.ndarray:
+    """Vectorized time_period.kind_of: the PeriodKind of each (start, end) pair"""
+
+    return np.where(
+        start_ns < end_ns, LINEAR, np.where(end_ns < start_ns, MODULAR, INFINITE)
+    ).astype(np.int8)
+
+
+class PeriodArray:
+    """A struct-of-arrays collection of TimePeriods. Each period is stored as its start
+    and end in nanoseconds since midnight (int64) and its PeriodKind code (int8), with
+    EMPTY marking an absent period.
+
+    Membership and intersection are evaluated for the whole array at once with the same
+    semantics as the LinearTimePeriod, ModularTimePeriod and InfiniteTimePeriod classes.
+
+    Example:
+    >> periods = PeriodArray.from_periods([LinearTimePeriod(Time(3), Time(10))])
+    >> periods.contains(times_to_ns([Time(2), Time(5)]))
+    array([[False,  True]])
+    """
+
+    __slots__ = ("start_ns", "end_ns", "kind")
+
+    def __init__(
+        self,
+        start_ns: np.ndarray,
+        end_ns: np.ndarray,
+        kind: Optional[np.ndarray] = None,
+    ) -> None:
+        self.start_ns = np.asarray(start_ns, dtype=np.int64)
+        self.end_ns = np.asarray(end_ns, dtype=np.int64)
+        if self.start_ns.shape != self.end_ns.shape or self.start_ns.ndim != 1:
+            raise ValueError(
+                "start_ns and end_ns must be 1-dimensional and equal length"
+            )
+        self.kind = (
+            kinds_of(self.start_ns, self.end_ns)
+            if kind is None
+            else np.asarray(kind, dtype=np.int8)
+        )
+        if self.kind.shape != self.start_ns.shape:
+            raise ValueError("kind must be the same length as start_ns and end_ns")
+
+    @classmethod
+    def empty(cls, size: int) -> PeriodArray:
+        """Allocate an array of the given size in which every period is EMPTY, e.g. as an
+        output buffer"""
+
+        return cls(
+            np.zeros(size, dtype=np.int64),
+            np.zeros(size, dtype=np.int64),
+            np.full(size, EMPTY, dtype=np.int8),
+        )
+
+    @classmethod
+    def from_periods(cls, periods: Iterable[AbstractTimePeriod]) -> PeriodArray:
+        periods = list(periods)
+        return cls(
+            np.fromiter((p.start_ns for p in periods), np.int64, len(periods)),
+            np.fromiter((p.end_ns for p in periods), np.int64, len(periods)),
+            np.fromiter((p.kind for p in periods), np.int8, len(periods)),
+        )
+
+    def copy(self) -> PeriodArray:
+        return PeriodArray(self.start_ns.copy(), self.end_ns.copy(), self.kind.copy())
+
+    def validate(self) -> None:
+        """Raise a ValueError if any bound is outside of the day or any kind code does not
+        match the ordering of its bounds"""
+
+        for bound in (self.start_ns, self.end_ns):
+            if np.any((bound < 0) | (bound >= NS_PER_DAY)):
+                raise ValueError("bounds must be nanoseconds of the day")
+        present = self.kind != EMPTY
+        expected = kinds_of(self.start_ns[present], self.end_ns[present])
+        if np.any(self.kind[present] != expected):
+            raise ValueError("kind codes do not match the ordering of the bounds")
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def __getitem__(
+        self, index: int | slice | np.ndarray
+    ) -> AbstractTimePeriod | PeriodArray | None:
+        if isinstance(index, (slice, np.ndarray)):
+            return PeriodArray(
+                self.start_ns[index], self.end_ns[index], self.kind[index]
+            )
+        if self.kind[index] == EMPTY:
+            return None
+        return from_ns(int(self.start_ns[index]), int(self.end_ns[index]))
+
+    def __iter__(self) -> Iterator[AbstractTimePeriod | None]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_periods(self) -> list[AbstractTimePeriod | None]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        kinds = ", ".join(
+            "EMPTY" if k == EMPTY else PERIOD_TYPES[k].__name__ for k in self.kind[:3]
+        )
+        more = ", ..." if len(self) > 3 else ""
+        return f"{self.__class__.__name__}(size={len(self)}, kinds=[{kinds}{more}])"
+
+    def contains(
+        self, times_ns: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the boolean matrix M of shape (len(self), len(times_ns)) wherein
+        M[i, j] is True when times_ns[j] is in the i-th period. EMPTY periods contain
+        no times."""
+
+        times_ns = np.asarray(times_ns, dtype=np.int64)
+        if out is None:
+            out = np.empty((len(self), len(times_ns)), dtype=bool)
+
+        self._contains(
+            self.start_ns[:, None], self.end_ns[:, None], times_ns[None, :], out
+        )
+        out[self.kind == INFINITE] = True
+        out[self.kind == EMPTY] = False
+        return out
+
+    def contains_elementwise(
+        self, times_ns: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the boolean mask m wherein m[i] is True when times_ns[i] is in the i-th
+        period"""
+
+        times_ns = np.asarray(times_ns, dtype=np.int64)
+        if times_ns.shape != self.kind.shape:
+            raise ValueError("times_ns must be the same length as the PeriodArray")
+        if out is None:
+            out = np.empty(len(self), dtype=bool)
+
+        self._contains(self.start_ns, self.end_ns, times_ns, out)
+        out[self.kind == INFINITE] = True
+        out[self.kind == EMPTY] = False
+        return out
+
+    def _contains(
+        self,
+        start_ns: np.ndarray,
+        end_ns: np.ndarray,
+        times_ns: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        # linear periods contain start <= t < end, modular periods start <= t or t < end
+        before_end = times_ns < end_ns
+        np.greater_equal(times_ns, start_ns, out=out)
+        linear = (self.kind == LINEAR).reshape(start_ns.shape)
+        modular = (self.kind == MODULAR).reshape(start_ns.shape)
+        np.logical_and(out, before_end, out=out, where=linear)
+        np.logical_or(out, before_end, out=out, where=modular)
+
+    def duration_ns(self) -> np.ndarray:
+        """The duration of each period in nanoseconds, zero for EMPTY periods"""
+
+        (start_1, end_1), (start_2, end_2) = self._pieces()
+        return end_1 - start_1 + end_2 - start_2
+
+    def overlap_ns(self, other: Optional[PeriodArray] = None) -> np.ndarray:
+        """Return the int64 matrix M of shape (len(self), len(other)) wherein M[i, j] is
+        the clock time in nanoseconds shared by the i-th period of self and the j-th
+        period of other, or of self when other is omitted.
+
+        Overlaps are measured on the periods themselves rather than on the result of
+        __and__, so both stretches shared by two ModularTimePeriods, on either side of
+        midnight, are counted."""
+
+        other = self if other is None else other
+        out = np.zeros((len(self), len(other)), dtype=np.int64)
+        for start_a, end_a in self._pieces():
+            for start_b, end_b in other._pieces():
+                overlap = np.minimum(end_a[:, None], end_b[None, :])
+                overlap -= np.maximum(start_a[:, None], start_b[None, :])
+                np.maximum(overlap, 0, out=overlap)
+                out += overlap
+        return out
+
+    def _pieces(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        # each period as two disjoint clock intervals [start, end) within the day, the
+        # second non-empty only for the [0, end) part of a ModularTimePeriod
+        kind = self.kind
+        linear, modular = kind == LINEAR, kind == MODULAR
+        start_1 = np.where(linear | modular, self.start_ns, 0)
+        end_1 = np.where(
+            linear, self.end_ns, np.where(modular | (kind == INFINITE), NS_PER_DAY, 0)
+        )
+        end_2 = np.where(modular, self.end_ns, 0)
+        return (start_1, end_1), (np.zeros_like(end_2), end_2)
+
+    def intersect(
+        self,
+        other: PeriodArray,
+        out: Optional[tuple[PeriodArray, PeriodArray]] = None,
+    ) -> tuple[PeriodArray, PeriodArray]:
+        """Elementwise intersection of two arrays of equal length, written to a pair of
+        PeriodArrays (first, second).
+
+        Element i mirrors self[i] & other[i]: a None intersection is EMPTY in both,
+        a single period is stored in first with second EMPTY, and the two periods of a
+        LinearTimePeriod & ModularTimePeriod double overlap are stored in order in first
+        and second."""
+
+        if len(self) != len(other):
+            raise ValueError("elementwise intersection requires arrays of equal length")
+        if out is None:
+            out = (PeriodArray.empty(len(self)), PeriodArray.empty(len(self)))
+        first, second = out
+
+        a_start, a_end, a_kind = self.start_ns, self.end_ns, self.kind
+        b_start, b_end, b_kind = other.start_ns, other.end_ns, other.kind
+        start_inter = np.maximum(a_start, b_start)
+        end_inter = np.minimum(a_end, b_end)
+
+        first.kind[:] = EMPTY
+        second.kind[:] = EMPTY
+
+        # linear & linear, modular & modular
+        linear = (a_kind == LINEAR) & (b_kind == LINEAR) & (start_inter < end_inter)
+        modular = (a_kind == MODULAR) & (b_kind == MODULAR)
+        for mask, kind in ((linear, LINEAR), (modular, MODULAR)):
+            first.start_ns[mask] = start_inter[mask]
+            first.end_ns[mask] = end_inter[mask]
+            first.kind[mask] = kind
+
+        # infinite & any is the other operand, any & infinite is the operand itself
+        for mask, start, end, kind in (
+            (b_kind == INFINITE, a_start, a_end, a_kind),
+            (a_kind == INFINITE, b_start, b_end, b_kind),
+        ):
+            mask = mask & (a_kind != EMPTY) & (b_kind != EMPTY)
+            first.start_ns[mask] = start[mask]
+            first.end_ns[mask] = end[mask]
+            first.kind[mask] = kind[mask]
+
+        # linear & modular, in either order
+        a_linear = (a_kind == LINEAR) & (b_kind == MODULAR)
+        b_linear = (a_kind == MODULAR) & (b_kind == LINEAR)
+        mixed = a_linear | b_linear
+        lin_start = np.where(a_linear, a_start, b_start)
+        lin_end = np.where(a_linear, a_end, b_end)
+
+        # region 1, [max(starts), linear end), and region 2, [linear start, min(ends))
+        region_1 = mixed & (start_inter < lin_end)
+        region_2 = mixed & (lin_start < end_inter)
+        both = region_1 & region_2
+        region_2_first = both & (lin_start < start_inter)
+
+        # single region results go to first
+        only_1 = region_1 & ~region_2
+        only_2 = region_2 & ~region_1
+        first.start_ns[only_1] = start_inter[only_1]
+        first.end_ns[only_1] = lin_end[only_1]
+        first.start_ns[only_2] = lin_start[only_2]
+        first.end_ns[only_2] = end_inter[only_2]
+
+        # double overlaps are sorted by start, region 1 first on ties
+        region_1_first = both & ~region_2_first
+        for mask, target_1, target_2 in (
+            (region_1_first, first, second),
+            (region_2_first, second, first),
+        ):
+            target_1.start_ns[mask] = start_inter[mask]
+            target_1.end_ns[mask] = lin_end[mask]
+            target_2.start_ns[mask] = lin_start[mask]
+            target_2.end_ns[mask] = end_inter[mask]
+
+        first.kind[region_1 | region_2] = LINEAR
+        second.kind[both] = LINEAR
+        return out
+
+    def __and__(self, other: PeriodArray) -> tuple[PeriodArray, PeriodArray]:
+        if not isinstance(other, PeriodArray):
+            return NotImplemented
+        return self.intersect(other)
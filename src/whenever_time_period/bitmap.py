@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+from whenever import Time, TimeDelta
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import NS_PER_DAY, NS_PER_SECOND, time_to_ns
+from whenever_time_period.period_set import TimePeriodSet, split_at_midnight
+
+MINUTE = TimeDelta(minutes=1)
+
+
+class PeriodBitmap:
+    """A union of TimePeriods discretized to a fixed resolution, e.g. 1440 bits for the
+    minutes of a day, stored as the bits of a Python int.
+
+    Bit i is set when the union covers the start of the i-th slot of the day, so
+    membership of a time is a single bit test of its slot, and set algebra over any
+    number of bitmaps runs as bulk word operations on the ints.
+
+    Periods which lie on the resolution grid are represented exactly and can be
+    converted back to TimePeriods. A bitmap built from any period off the grid is
+    marked inexact, and so is every bitmap computed from it, and converting it back
+    raises a ValueError.
+
+    Example:
+    >> business_hours = PeriodBitmap([LinearTimePeriod(Time(9), Time(17))])
+    >> Time(12, 30) in business_hours & ~PeriodBitmap([LinearTimePeriod(Time(12), Time(13))])
+    False
+    """
+
+    __slots__ = ("resolution_ns", "exact", "_bits", "_packed", "_resolution_s")
+
+    def __init__(
+        self,
+        periods: Iterable[AbstractTimePeriod] = (),
+        resolution: TimeDelta = MINUTE,
+    ) -> None:
+        resolution_ns = resolution.total("nanoseconds")
+        if resolution_ns <= 0 or NS_PER_DAY % resolution_ns:
+            raise ValueError("resolution must be a positive divisor of a day")
+        self.resolution_ns = resolution_ns = int(resolution_ns)
+
+        bits = 0
+        exact = True
+        for period in periods:
+            for start, end in split_at_midnight(period):
+                exact = exact and not (start % resolution_ns or end % resolution_ns)
+                first = -(-start // resolution_ns)
+                last = -(-end // resolution_ns)
+                if first < last:
+                    bits |= ((1 << (last - first)) - 1) << first
+        self.exact = exact
+        self._set_bits(bits)
+
+    @classmethod
+    def _from_bits(cls, bits: int, resolution_ns: int, exact: bool) -> PeriodBitmap:
+        bitmap = object.__new__(cls)
+        bitmap.resolution_ns = resolution_ns
+        bitmap.exact = exact
+        bitmap._set_bits(bits)
+        return bitmap
+
+    def _set_bits(self, bits: int) -> None:
+        # bit tests read a byte of a packed copy of the bits, which is much cheaper than
+        # shifting a large int, and slots of whole seconds are found without computing
+        # nanoseconds
+        self._bits = bits
+        self._packed = bits.to_bytes(-(-self.slots // 8), "little")
+        seconds, remainder = divmod(self.resolution_ns, NS_PER_SECOND)
+        self._resolution_s = seconds if not remainder else 0
+
+    @property
+    def slots(self) -> int:
+        """The number of slots in a day"""
+
+        return NS_PER_DAY // self.resolution_ns
+
+    @property
+    def bits(self) -> int:
+        """The bits of the bitmap, bit i for the i-th slot of the day"""
+
+        return self._bits
+
+    def contains_ns(self, ns: int) -> bool:
+        """Whether the slot of the given nanosecond of the day is set"""
+
+        slot = ns // self.resolution_ns
+        return self._packed[slot >> 3] >> (slot & 7) & 1 == 1
+
+    def __contains__(self, other: Time) -> bool:
+        if not isinstance(other, Time):
+            return False
+        if self._resolution_s:
+            seconds = other.hour * 3600 + other.minute * 60 + other.second
+            slot = seconds // self._resolution_s
+        else:
+            slot = time_to_ns(other) // self.resolution_ns
+        return self._packed[slot >> 3] >> (slot & 7) & 1 == 1
+
+    def __len__(self) -> int:
+        """The number of set slots"""
+
+        return self._bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PeriodBitmap):
+            return NotImplemented
+        return (self._bits, self.resolution_ns) == (other._bits, other.resolution_ns)
+
+    def __hash__(self) -> int:
+        return hash((self._bits, self.resolution_ns))
+
+    def __repr__(self) -> str:
+        resolution = TimeDelta(nanoseconds=self.resolution_ns)
+        exact = "" if self.exact else ", inexact"
+        return (
+            f"{self.__class__.__name__}({len(self)} of {self.slots} slots of "
+            f"{resolution}{exact})"
+        )
+
+    def _check(self, other: object) -> bool:
+        if not isinstance(other, PeriodBitmap):
+            return False
+        if other.resolution_ns != self.resolution_ns:
+            raise ValueError("bitmaps of different resolutions cannot be combined")
+        return True
+
+    def __or__(self, other: PeriodBitmap) -> PeriodBitmap:
+        if not self._check(other):
+            return NotImplemented
+        return PeriodBitmap._from_bits(
+            self._bits | other._bits, self.resolution_ns, self.exact and other.exact
+        )
+
+    def __and__(self, other: PeriodBitmap) -> PeriodBitmap:
+        if not self._check(other):
+            return NotImplemented
+        return PeriodBitmap._from_bits(
+            self._bits & other._bits, self.resolution_ns, self.exact and other.exact
+        )
+
+    def __sub__(self, other: PeriodBitmap) -> PeriodBitmap:
+        if not self._check(other):
+            return NotImplemented
+        return PeriodBitmap._from_bits(
+            self._bits & ~other._bits, self.resolution_ns, self.exact and other.exact
+        )
+
+    def __xor__(self, other: PeriodBitmap) -> PeriodBitmap:
+        if not self._check(other):
+            return NotImplemented
+        return PeriodBitmap._from_bits(
+            self._bits ^ other._bits, self.resolution_ns, self.exact and other.exact
+        )
+
+    def __invert__(self) -> PeriodBitmap:
+        full = (1 << self.slots) - 1
+        return PeriodBitmap._from_bits(
+            self._bits ^ full, self.resolution_ns, self.exact
+        )
+
+    def union(self, *others: PeriodBitmap) -> PeriodBitmap:
+        """The union of the bitmap with any number of others"""
+
+        bits, exact = self._bits, self.exact
+        for other in others:
+            self._check(other)
+            bits |= other._bits
+            exact = exact and other.exact
+        return PeriodBitmap._from_bits(bits, self.resolution_ns, exact)
+
+    def intersection(self, *others: PeriodBitmap) -> PeriodBitmap:
+        """The intersection of the bitmap with any number of others"""
+
+        bits, exact = self._bits, self.exact
+        for other in others:
+            self._check(other)
+            bits &= other._bits
+            exact = exact and other.exact
+        return PeriodBitmap._from_bits(bits, self.resolution_ns, exact)
+
+    def to_period_set(self) -> TimePeriodSet:
+        """The exact union of periods represented by the bitmap. Raises a ValueError if
+        the bitmap is inexact."""
+
+        if not self.exact:
+            raise ValueError(
+                "bitmap was built from periods off its resolution grid, and cannot be "
+                "converted back to periods exactly"
+            )
+
+        starts, ends = [], []
+        bits, resolution_ns = self._bits, self.resolution_ns
+        while bits:
+            # the lowest run of set bits is [first, last)
+            first = (bits & -bits).bit_length() - 1
+            carried = bits + (1 << first)
+            last = (carried & -carried).bit_length() - 1
+            starts.append(first * resolution_ns)
+            ends.append(last * resolution_ns)
+            bits &= carried
+        return TimePeriodSet._from_normalized(starts, ends)
+
+    def __iter__(self) -> Iterator[AbstractTimePeriod]:
+        """Iterate the exact periods of the bitmap, as a TimePeriodSet would. Raises a
+        ValueError if the bitmap is inexact."""
+
+        return iter(self.to_period_set())
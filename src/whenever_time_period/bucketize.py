@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence, Union
+
+from whenever import Date, Instant, ZonedDateTime
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.index import PeriodIndex
+from whenever_time_period.nanoseconds import time_to_ns
+from whenever_time_period.time_period import LinearTimePeriod
+
+# an Instant, a ZonedDateTime, or nanoseconds since the Unix epoch
+Timestamp = Union[Instant, ZonedDateTime, int]
+Event = Union[Timestamp, tuple[Timestamp, float]]
+
+
+@dataclass(slots=True)
+class Aggregates:
+    """Running aggregates of the values of the events in a bucket. Events without a
+    value are counted, but do not contribute to the aggregates."""
+
+    sum: float = 0
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+
+class PeriodBucket(NamedTuple):
+    """The events which fell in the occurrence of a period that started on day"""
+
+    period: AbstractTimePeriod
+    day: Date
+    count: int
+    aggregates: Aggregates
+
+
+def bucketize(
+    events: Iterable[Event],
+    periods: Sequence[AbstractTimePeriod],
+    tz: str,
+    chunk_size: int = 4096,
+) -> Iterator[PeriodBucket]:
+    """Count and aggregate a stream of events per period per day, yielding each
+    PeriodBucket as soon as no later event can fall in it.
+
+    Events are timestamps, or (timestamp, value) pairs, in non-decreasing order. Each
+    is converted to the wall clock of the timezone tz and counted in every period
+    containing its clock time. The day of a bucket is the date on which the occurrence
+    of the period started: an event at 02:00 in ModularTimePeriod(Time(22), Time(6))
+    belongs to the occurrence which started the day before, as does an event before the
+    start time of an InfiniteTimePeriod.
+
+    Events are consumed chunk_size at a time, and only the buckets of the last two days
+    are held open, so memory is bounded regardless of the length of the stream.
+    Buckets are yielded in order of day, then of their period in periods.
+
+    Example:
+    >> night = ModularTimePeriod(Time(22), Time(6))
+    >> list(bucketize([(Instant.from_utc(2024, 1, 1, 23), 2.5)], [night], "UTC"))
+    [PeriodBucket(period=ModularTimePeriod[22:00:00, 06:00:00), day=Date("2024-01-01"),
+                  count=1, aggregates=Aggregates(sum=2.5, min=2.5, max=2.5))]
+    """
+
+    index = PeriodIndex(enumerate(periods))
+    starts_on_previous_day = [
+        not isinstance(period, LinearTimePeriod) for period in periods
+    ]
+    start_ns = [period.start_ns for period in periods]
+
+    open_buckets: dict[tuple[Date, int], list] = {}
+    watermark: Optional[Date] = None
+
+    iterator = iter(events)
+    while chunk := list(islice(iterator, chunk_size)):
+        for event in chunk:
+            if isinstance(event, tuple):
+                timestamp, value = event
+            else:
+                timestamp, value = event, None
+            local = _to_local(timestamp, tz)
+            date, ns = local.date(), time_to_ns(local.time())
+
+            for i in index.stab_ns(ns):
+                day = date
+                if starts_on_previous_day[i] and ns < start_ns[i]:
+                    day = date.subtract(days=1)
+                if watermark is not None and day < watermark:
+                    raise ValueError(
+                        f"event at {local} belongs to a bucket already yielded"
+                    )
+                bucket = open_buckets.get((day, i))
+                if bucket is None:
+                    bucket = open_buckets[day, i] = [0, Aggregates()]
+                bucket[0] += 1
+                if value is not None:
+                    bucket[1].add(value)
+
+            # an occurrence which started two days ago has ended by today
+            if watermark is None or date > watermark.add(days=1):
+                watermark = date.subtract(days=1)
+                yield from _flush(open_buckets, periods, before=watermark)
+
+    yield from _flush(open_buckets, periods, before=None)
+
+
+def _to_local(timestamp: Timestamp, tz: str) -> ZonedDateTime:
+    if isinstance(timestamp, int):
+        timestamp = Instant.from_timestamp(timestamp, unit="nanosecond")
+    return timestamp.to_tz(tz)
+
+
+def _flush(
+    open_buckets: dict[tuple[Date, int], list],
+    periods: Sequence[AbstractTimePeriod],
+    before: Optional[Date],
+) -> Iterator[PeriodBucket]:
+    """Yield and forget the buckets of days before the given day, or all buckets"""
+
+    closed = sorted(key for key in open_buckets if before is None or key[0] < before)
+    for day, i in closed:
+        count, aggregates = open_buckets.pop((day, i))
+        yield PeriodBucket(periods[i], day, count, aggregates)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+from whenever import Time
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.time_period import from_times, intersection
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Hit and miss statistics of a cache, in the style of functools.lru_cache"""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe mapping bounded to maxsize entries, evicting the least recently
+    used entry first"""
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        """Return the value cached for key, computing and caching it on a miss. The
+        value is computed outside of the lock, so concurrent misses of the same key may
+        both compute it and the first to finish is kept."""
+
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return value
+
+        value = compute()
+
+        with self._lock:
+            existing = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return existing
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+IntersectionResult = list[AbstractTimePeriod] | AbstractTimePeriod | None
+
+# the class and bounds of a period, which unlike period equality tell apart
+# InfiniteTimePeriods of different bounds
+PeriodKey = tuple[type, int, int]
+
+
+def _key(period: AbstractTimePeriod) -> PeriodKey:
+    return type(period), period.start_ns, period.end_ns
+
+
+def _unsupported(period: object, other: object) -> TypeError:
+    return TypeError(
+        f"unsupported operand type(s) for &: '{type(period).__name__}' and "
+        f"'{type(other).__name__}'"
+    )
+
+
+class PeriodCache:
+    """An opt-in cache for workloads that construct and intersect the same periods many
+    times. Periods of the same class and bounds are interned to one shared instance,
+    and intersections are memoized on the class and bounds of the operand pair. Both are bounded LRU caches and safe to
+    share between threads.
+
+    Example:
+    >> cache = PeriodCache(maxsize=1024)
+    >> business_hours = cache.from_times(Time(9), Time(17))
+    >> cache.intersect(business_hours, cache.from_times(Time(22), Time(10)))
+    LinearTimePeriod[09:00:00, 10:00:00)
+    >> cache.intersection_info()
+    CacheInfo(hits=0, misses=1, evictions=0, maxsize=1024, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 4096, intern_maxsize: int | None = None) -> None:
+        self._interned: LRUCache[PeriodKey, AbstractTimePeriod] = LRUCache(
+            intern_maxsize if intern_maxsize is not None else maxsize
+        )
+        self._intersections: LRUCache[
+            tuple[PeriodKey, PeriodKey], IntersectionResult
+        ] = LRUCache(maxsize)
+
+    def intern(self, period: AbstractTimePeriod) -> AbstractTimePeriod:
+        """Return the shared instance of the class and bounds of the given period"""
+
+        return self._interned.get_or_compute(_key(period), lambda: period)
+
+    def from_times(self, start_time: Time, end_time: Time) -> AbstractTimePeriod:
+        """The interned from_times(start_time, end_time)"""
+
+        return self.intern(from_times(start_time, end_time))
+
+    def intersect(
+        self, period: AbstractTimePeriod, other: AbstractTimePeriod
+    ) -> IntersectionResult:
+        """The memoized period & other, with interned result periods. A list result is
+        copied on every call, so callers are free to modify it."""
+
+        try:
+            key = (_key(period), _key(other))
+        except AttributeError:
+            raise _unsupported(period, other) from None
+        result = self._intersections.get_or_compute(
+            key, lambda: self._intersect(period, other)
+        )
+        if isinstance(result, tuple):
+            return list(result)
+        return result
+
+    def _intersect(
+        self, period: AbstractTimePeriod, other: AbstractTimePeriod
+    ) -> tuple[AbstractTimePeriod, ...] | AbstractTimePeriod | None:
+        result = intersection(period, other)
+        if result is NotImplemented:
+            raise _unsupported(period, other)
+        if isinstance(result, list):
+            return tuple(self.intern(piece) for piece in result)
+        if result is None:
+            return None
+        return self.intern(result)
+
+    def intern_info(self) -> CacheInfo:
+        return self._interned.info()
+
+    def intersection_info(self) -> CacheInfo:
+        return self._intersections.info()
+
+    def clear(self) -> None:
+        self._interned.clear()
+        self._intersections.clear()
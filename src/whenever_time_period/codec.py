@@ -0,0 +1,172 @@
+"""A compact binary format for collections of TimePeriods.
+
+The format is a 16 byte header followed by one fixed-width record per period, all
+little-endian:
+
+    header   magic      4 bytes   b"WTPB"
+             version    uint16    FORMAT_VERSION
+             record     uint16    size of a record in bytes, 17
+             count      uint64    number of records
+
+    record   kind       uint8     PeriodKind of the period
+             start_ns   int64     nanoseconds since midnight of the start time
+             end_ns     int64     nanoseconds since midnight of the end time
+
+Loading never copies the records: a PeriodSequence reads them straight from the given
+bytes, memoryview or memory-mapped file, and only materializes a TimePeriod when an
+element is accessed.
+
+Example:
+>> data = dumps([LinearTimePeriod(Time(3), Time(10))])
+>> loads(data)[0]
+LinearTimePeriod[03:00:00, 10:00:00)
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Sequence, overload
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import NS_PER_DAY, ns_to_time
+from whenever_time_period.time_period import PERIOD_TYPES, kind_of
+
+if TYPE_CHECKING:
+    from whenever_time_period.array import PeriodArray
+
+MAGIC = b"WTPB"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHHQ")
+RECORD = struct.Struct("<Bqq")
+
+
+def dumps(periods: Iterable[AbstractTimePeriod]) -> bytes:
+    """Encode the periods in the binary format"""
+
+    records = bytearray()
+    count = 0
+    for period in periods:
+        records += RECORD.pack(period.kind, period.start_ns, period.end_ns)
+        count += 1
+    return HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, count) + records
+
+
+def dump(periods: Iterable[AbstractTimePeriod], file: BinaryIO) -> None:
+    """Write the periods in the binary format to a binary file object"""
+
+    file.write(dumps(periods))
+
+
+def loads(data: bytes | bytearray | memoryview | mmap.mmap) -> PeriodSequence:
+    """Return a lazy, read-only sequence of the periods encoded in data, without copying
+    it. data must not be modified while the sequence is in use."""
+
+    return PeriodSequence(memoryview(data))
+
+
+def load(path: str | os.PathLike) -> PeriodSequence:
+    """Memory-map the file at path and return a lazy sequence of the periods it encodes.
+    The map is closed with the sequence's close(), or by using it as a context
+    manager."""
+
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    sequence = loads(mapped)
+    sequence._mmap = mapped
+    return sequence
+
+
+class PeriodSequence(Sequence[AbstractTimePeriod]):
+    """A read-only sequence of TimePeriods decoded on access from a buffer in the binary
+    format"""
+
+    def __init__(self, buffer: memoryview) -> None:
+        if buffer.nbytes < HEADER.size:
+            raise ValueError("buffer is too short to hold a header")
+        magic, version, record_size, count = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"not a TimePeriod buffer, magic is {magic!r}")
+        if version != FORMAT_VERSION or record_size != RECORD.size:
+            raise ValueError(f"unsupported format version {version}")
+        if buffer.nbytes < HEADER.size + count * RECORD.size:
+            raise ValueError(f"buffer is too short to hold {count} periods")
+
+        self._buffer = buffer
+        self._count = count
+        self._mmap: mmap.mmap | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, index: int) -> tuple[int, int, int]:
+        """The raw (kind, start_ns, end_ns) record at index"""
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("period index out of range")
+        return RECORD.unpack_from(self._buffer, HEADER.size + index * RECORD.size)
+
+    @overload
+    def __getitem__(self, index: int) -> AbstractTimePeriod: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AbstractTimePeriod]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        kind, start_ns, end_ns = self.record(index)
+        if not (0 <= start_ns < NS_PER_DAY and 0 <= end_ns < NS_PER_DAY) or (
+            kind != kind_of(start_ns, end_ns)
+        ):
+            raise ValueError(f"corrupt record at index {index}")
+        return PERIOD_TYPES[kind]._from_parts(
+            ns_to_time(start_ns), ns_to_time(end_ns), start_ns, end_ns
+        )
+
+    def __iter__(self) -> Iterator[AbstractTimePeriod]:
+        for i in range(self._count):
+            yield self[i]
+
+    def to_array(self) -> PeriodArray:
+        """View the records as a PeriodArray, which requires numpy. The columns are
+        strided views of the buffer, not copies. An array viewing a memory-mapped file
+        keeps the map alive after the sequence is closed."""
+
+        import numpy as np
+
+        from whenever_time_period.array import PeriodArray
+
+        records = np.frombuffer(
+            self._buffer,
+            dtype=np.dtype([("kind", "<i1"), ("start_ns", "<i8"), ("end_ns", "<i8")]),
+            count=self._count,
+            offset=HEADER.size,
+        )
+        return PeriodArray(records["start_ns"], records["end_ns"], records["kind"])
+
+    def close(self) -> None:
+        """Release the buffer, and close the file map if the sequence was loaded from a
+        file. A buffer or map still exported, e.g. to a numpy array viewing the records
+        of loads(), is left to be freed with its last export instead."""
+
+        try:
+            self._buffer.release()
+        except BufferError:
+            pass
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+
+    def __enter__(self) -> PeriodSequence:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import inspect
+import threading
+import typing
+from typing import Any, Callable, Iterable
+
+Kernel = Callable[[Any, Any], Any]
+
+
+def _not_implemented(left: Any, right: Any) -> Any:
+    return NotImplemented
+
+
+class KernelTable:
+    """A binary operator dispatcher backed by a precomputed table of kernels keyed on
+    the exact (type(left), type(right)) of the operands.
+
+    Kernels registered for concrete type pairs are served directly from the table.
+    Any other pair (user-defined subclasses, abstract or Union signatures) is resolved
+    once and the resolved kernel is cached in the table, so every subsequent call with
+    the same type pair is a single dict lookup. Pairs without an applicable kernel
+    resolve to NotImplemented, deferring to the reflected operator as Python does.
+
+    While every registered signature is a pair of classes and one applicable signature
+    is more specific than the others, resolution follows the MRO of the operands. Any
+    other resolution is delegated to plum's multiple dispatch, which is only imported
+    and populated at that point.
+
+    Pairs precomputed with precompute() are resolved again after every registration,
+    so they are served from the table whichever module registered its kernels last.
+
+    Tables are safe to share between threads, including on free-threaded builds. Calls
+    read the table without locking, while registration and the resolution of a new
+    pair are serialized by a lock, so plum's dispatch state is never used concurrently
+    and a resolution is never cached after a registration which invalidates it.
+
+    Example:
+    >> intersection = KernelTable("intersection")
+    >> @intersection.register
+    .. def _(a: LinearTimePeriod, b: LinearTimePeriod) -> LinearTimePeriod | None: ...
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._signatures: list[tuple[tuple[Any, Any], Kernel]] = []
+        self._registered: dict[tuple[type, type], Kernel] = {}
+        self._kernels: dict[tuple[type, type], Kernel] = {}
+        self._precomputed: dict[tuple[type, type], None] = {}
+        self._function = None
+        self._lock = threading.Lock()
+
+    def register(
+        self, *signature: type | Kernel
+    ) -> Kernel | Callable[[Kernel], Kernel]:
+        """Register a kernel for a pair of operand types. The types are taken from the
+        annotations of the kernel's two parameters, plum-style, or may be given
+        explicitly as `@table.register(LeftType, RightType)`."""
+
+        if len(signature) == 1 and not isinstance(signature[0], type):
+            return self._register(signature[0], None)
+        if len(signature) != 2:
+            raise TypeError(
+                f"{self.name}: expected a kernel or two operand types, got {signature}"
+            )
+        return lambda kernel: self._register(kernel, signature)
+
+    def _register(self, kernel: Kernel, types: tuple[type, type] | None) -> Kernel:
+        if types is None:
+            hints = typing.get_type_hints(kernel)
+            params = list(inspect.signature(kernel).parameters)[:2]
+            types = tuple(hints.get(name, object) for name in params)
+
+        with self._lock:
+            self._signatures.append((types, kernel))
+            if self._function is not None:
+                self._register_with_plum(self._function, types, kernel)
+            if all(isinstance(t, type) for t in types):
+                self._registered[types] = kernel
+            # a new signature may be more specific than a previously cached resolution,
+            # so readers are switched to a fresh table, with the precomputed pairs
+            # resolved again
+            kernels = dict(self._registered)
+            for pair in self._precomputed:
+                if pair not in kernels:
+                    kernels[pair] = self._resolve_uncached(*pair)
+            self._kernels = kernels
+        return kernel
+
+    def resolve(self, left: type, right: type) -> Kernel:
+        """Return the kernel applicable to the given operand types, caching the result."""
+
+        pair = (left, right)
+        kernel = self._kernels.get(pair)
+        if kernel is None:
+            with self._lock:
+                # another thread may have resolved the pair while this one waited
+                kernel = self._kernels.get(pair)
+                if kernel is None:
+                    kernel = self._kernels[pair] = self._resolve_uncached(left, right)
+        return kernel
+
+    def _resolve_uncached(self, left: type, right: type) -> Kernel:
+        kernel = self._resolve_by_mro(left, right)
+        if kernel is None:
+            kernel = self._resolve_with_plum(left, right)
+        return kernel
+
+    def _resolve_by_mro(self, left: type, right: type) -> Kernel | None:
+        """Return the kernel of the most specific applicable signature, or None if the
+        resolution is ambiguous or involves signatures that are not pairs of classes"""
+
+        candidates = []
+        for types, kernel in self._signatures:
+            if not all(isinstance(t, type) for t in types):
+                return None
+            if issubclass(left, types[0]) and issubclass(right, types[1]):
+                candidates.append((types, kernel))
+
+        if not candidates:
+            return _not_implemented
+        for (most_left, most_right), kernel in candidates:
+            if all(
+                issubclass(most_left, other_left)
+                and issubclass(most_right, other_right)
+                for (other_left, other_right), _ in candidates
+            ):
+                return kernel
+        return None
+
+    def _resolve_with_plum(self, left: type, right: type) -> Kernel:
+        from plum import NotFoundLookupError, Signature
+
+        try:
+            method, _ = self._plum_function().resolve_method(Signature(left, right))
+        except NotFoundLookupError:
+            return _not_implemented
+        return method.kernel
+
+    def _plum_function(self) -> Any:
+        """The plum Function holding every registered signature, built on first use"""
+
+        if self._function is None:
+            from plum import Function
+
+            def fallback(left, right): ...
+
+            fallback.__name__ = fallback.__qualname__ = self.name
+            function = Function(fallback)
+            for types, kernel in self._signatures:
+                self._register_with_plum(function, types, kernel)
+            self._function = function
+        return self._function
+
+    @staticmethod
+    def _register_with_plum(
+        function: Any, types: tuple[Any, Any], kernel: Kernel
+    ) -> None:
+        from plum import Signature
+
+        # plum only selects the kernel, so register an unannotated proxy to spare it
+        # from resolving the kernel's return annotation
+        def method(left, right):
+            return kernel(left, right)
+
+        method.kernel = kernel
+        function.register(method, Signature(*types))
+
+    def precompute(self, lefts: Iterable[type], rights: Iterable[type]) -> None:
+        """Resolve and cache kernels for every pair in the product of the given types,
+        and keep them cached across later registrations."""
+
+        rights = tuple(rights)
+        for left in lefts:
+            for right in rights:
+                self.resolve(left, right)
+                with self._lock:
+                    self._precomputed[left, right] = None
+
+    def __call__(self, left: Any, right: Any) -> Any:
+        try:
+            kernel = self._kernels[type(left), type(right)]
+        except KeyError:
+            kernel = self.resolve(type(left), type(right))
+        return kernel(left, right)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, kernels={len(self._kernels)})"
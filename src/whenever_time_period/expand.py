@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Literal, NamedTuple, Union
+
+from whenever import Date, ZonedDateTime
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.time_period import LinearTimePeriod
+
+Disambiguation = Literal["compatible", "earlier", "later", "raise"]
+
+
+class Occurrence(NamedTuple):
+    """A TimePeriod as the concrete interval [start, end) of the occurrence which
+    started on day"""
+
+    period: AbstractTimePeriod
+    day: Date
+    start: ZonedDateTime
+    end: ZonedDateTime
+
+
+def expand(
+    periods: Union[AbstractTimePeriod, Iterable[AbstractTimePeriod]],
+    start: Date,
+    end: Date,
+    tz: str,
+    disambiguation: Disambiguation = "compatible",
+) -> Iterator[Occurrence]:
+    """Lazily yield the occurrences of one or many periods on every day from start up to
+    but excluding end, as ZonedDateTime intervals in the timezone tz.
+
+    An occurrence runs from its start time on the day to its end time on the same day
+    for a LinearTimePeriod, and on the next day for a ModularTimePeriod. An
+    InfiniteTimePeriod lasts until its start time on the next day. Occurrences are
+    yielded in order of day, then of their period in periods.
+
+    Clock times which fall in a gap or a fold of the timezone are resolved with
+    disambiguation, as by whenever: by default a time skipped by a gap is shifted
+    forward by the length of the gap and a repeated time takes the earlier offset.
+    Occurrences which are empty once resolved are skipped. Every clock time is resolved
+    against whenever's timezone database, which is loaded once per timezone and
+    cached.
+
+    Example:
+    >> night = ModularTimePeriod(Time(22), Time(6))
+    >> next(expand(night, Date(2024, 3, 30), Date(2024, 4, 1), "Europe/Amsterdam"))
+    Occurrence(period=ModularTimePeriod[22:00:00, 06:00:00), day=Date("2024-03-30"),
+               start=ZonedDateTime("2024-03-30 22:00:00+01:00[Europe/Amsterdam]"),
+               end=ZonedDateTime("2024-03-31 06:00:00+02:00[Europe/Amsterdam]"))
+    """
+
+    if isinstance(periods, AbstractTimePeriod):
+        periods = [periods]
+    # (period, start time, end time, whether the end is on the next day)
+    bounds = [
+        (
+            period,
+            period.start_time,
+            period.end_time,
+            not isinstance(period, LinearTimePeriod),
+        )
+        for period in periods
+    ]
+
+    day = start
+    while day < end:
+        next_day = day.add(days=1)
+        for period, start_time, end_time, ends_next_day in bounds:
+            occurrence_start = day.at(start_time).assume_tz(
+                tz, disambiguation=disambiguation
+            )
+            occurrence_end = (
+                (next_day if ends_next_day else day)
+                .at(end_time)
+                .assume_tz(tz, disambiguation=disambiguation)
+            )
+            if occurrence_start < occurrence_end:
+                yield Occurrence(period, day, occurrence_start, occurrence_end)
+        day = next_day
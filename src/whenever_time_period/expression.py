@@ -0,0 +1,255 @@
+"""Lazy set algebra over TimePeriods, for rules built out of many periods.
+
+lazy(operand), or the complement ~period of a period, starts an expression, after
+which &, |, - and ~ build a tree rather than evaluating, whatever TimePeriods,
+TimePeriodSets or results of an eager intersection are on either side. Only operators
+with an expression on one side are lazy: & between two periods is still the eager
+intersection, whose result for two ModularTimePeriods may differ from the lazy one, so
+one operand of every & must be an expression for the whole rule to be lazy. The tree is
+simplified before it is evaluated: nested & and | are flattened into single n-ary
+operations, InfiniteTimePeriods, the identity of &, and empty operands, the identity
+of |, are dropped, and operations absorbing them collapse to a constant, as do x & ~x
+and x | ~x.
+
+The simplified tree is evaluated once, on first use, into a TimePeriodSet, or a
+WeeklyTimePeriodSet if any operand is weekly, which is cached and reused by every
+query. Intersections stop as soon as their result is empty, without evaluating their
+remaining operands.
+
+Example:
+>> rule = (business_hours & ~holidays_window) | lazy(on_call) & night_shift
+>> Time(23) in rule
+True
+>> rule.compile()
+TimePeriodSet[LinearTimePeriod[09:00:00, 12:00:00), ModularTimePeriod[22:00:00, 02:00:00)]
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Union
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.period_set import TimePeriodSet
+from whenever_time_period.time_period import InfiniteTimePeriod
+from whenever_time_period.weekly import (
+    AbstractWeeklyTimePeriod,
+    InfiniteWeeklyTimePeriod,
+    WeeklyTimePeriodSet,
+)
+
+Operand = Union[
+    "PeriodExpression",
+    AbstractTimePeriod,
+    AbstractWeeklyTimePeriod,
+    TimePeriodSet,
+    Iterable[AbstractTimePeriod],
+    None,
+]
+
+LEAF, NOT, AND, OR, EMPTY, FULL = "leaf", "not", "and", "or", "empty", "full"
+
+
+class PeriodExpression:
+    """A lazily evaluated union, intersection or complement of TimePeriods, built by
+    lazy() and the operators &, |, - and ~.
+
+    Expressions are immutable, and equal when their trees are. The result is computed
+    by compile(), at most once per expression, and membership of a Time, or of a
+    datetime for weekly expressions, is tested against it."""
+
+    __slots__ = ("_op", "_operands", "_compiled")
+
+    def __init__(self, op: str, operands: tuple = ()) -> None:
+        self._op = op
+        self._operands = operands
+        self._compiled: Optional[TimePeriodSet] = None
+
+    def __and__(self, other: Operand) -> PeriodExpression:
+        other = _operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return PeriodExpression(AND, (self, other))
+
+    def __rand__(self, other: Operand) -> PeriodExpression:
+        other = _operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return PeriodExpression(AND, (other, self))
+
+    def __or__(self, other: Operand) -> PeriodExpression:
+        other = _operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return PeriodExpression(OR, (self, other))
+
+    def __ror__(self, other: Operand) -> PeriodExpression:
+        other = _operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return PeriodExpression(OR, (other, self))
+
+    def __sub__(self, other: Operand) -> PeriodExpression:
+        other = _operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return PeriodExpression(AND, (self, ~other))
+
+    def __rsub__(self, other: Operand) -> PeriodExpression:
+        other = _operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return PeriodExpression(AND, (other, ~self))
+
+    def __invert__(self) -> PeriodExpression:
+        return PeriodExpression(NOT, (self,))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PeriodExpression):
+            return NotImplemented
+        return self._op == other._op and self._operands == other._operands
+
+    def __hash__(self) -> int:
+        return hash((self._op, self._operands))
+
+    def __repr__(self) -> str:
+        if self._op == LEAF:
+            return f"lazy({self._operands[0]!r})"
+        if self._op in (EMPTY, FULL):
+            return self._op.upper()
+        if self._op == NOT:
+            return f"~{_parenthesized(self._operands[0])}"
+        symbol = " & " if self._op == AND else " | "
+        return symbol.join(_parenthesized(operand) for operand in self._operands)
+
+    def simplify(self) -> PeriodExpression:
+        """The equivalent expression evaluated by compile, with nested operations
+        flattened and identities, constants and complementary operands eliminated"""
+
+        op, operands = self._op, self._operands
+        if op in (LEAF, EMPTY, FULL):
+            return self
+        if op == NOT:
+            operand = operands[0].simplify()
+            if operand._op == NOT:
+                return operand._operands[0]
+            if operand._op in (EMPTY, FULL):
+                return _FULL if operand._op == EMPTY else _EMPTY
+            return PeriodExpression(NOT, (operand,))
+
+        # the identity of the operation is dropped, and its absorbing element absorbs it
+        identity, absorbing = (_FULL, _EMPTY) if op == AND else (_EMPTY, _FULL)
+        flattened: dict[PeriodExpression, None] = {}
+        for operand in operands:
+            operand = operand.simplify()
+            for term in operand._operands if operand._op == op else (operand,):
+                if term == absorbing:
+                    return absorbing
+                if term != identity:
+                    flattened[term] = None
+        for term in flattened:
+            # x & ~x is empty and x | ~x is full
+            if term._op == NOT and term._operands[0] in flattened:
+                return absorbing
+        if not flattened:
+            return identity
+        if len(flattened) == 1:
+            return next(iter(flattened))
+        return PeriodExpression(op, tuple(flattened))
+
+    def compile(self) -> TimePeriodSet:
+        """Evaluate the simplified expression into a TimePeriodSet, or a
+        WeeklyTimePeriodSet if any operand is weekly. The result is cached, so the
+        expression is evaluated once however often it is queried."""
+
+        # concurrent first calls may each evaluate the expression, all to equal sets
+        compiled = self._compiled
+        if compiled is None:
+            set_type = WeeklyTimePeriodSet if self._is_weekly() else TimePeriodSet
+            compiled = self._compiled = _evaluate(self.simplify(), set_type)
+        return compiled
+
+    def _is_weekly(self) -> bool:
+        if self._op == LEAF:
+            return isinstance(
+                self._operands[0], (AbstractWeeklyTimePeriod, WeeklyTimePeriodSet)
+            )
+        return any(operand._is_weekly() for operand in self._operands)
+
+    def __contains__(self, other: Any) -> bool:
+        return other in self.compile()
+
+
+_EMPTY = PeriodExpression(EMPTY)
+_FULL = PeriodExpression(FULL)
+
+
+def lazy(operand: Operand) -> PeriodExpression:
+    """Start a lazy expression from a TimePeriod, WeeklyTimePeriod or TimePeriodSet. The
+    result of an eager intersection is accepted too, a list being the union of its
+    periods and None the empty set."""
+
+    expression = _operand(operand)
+    if expression is NotImplemented:
+        raise TypeError(f"cannot build a period expression from {operand!r}")
+    return expression
+
+
+def _operand(operand: Operand) -> PeriodExpression:
+    if isinstance(operand, PeriodExpression):
+        return operand
+    if operand is None:
+        return _EMPTY
+    if isinstance(operand, (InfiniteTimePeriod, InfiniteWeeklyTimePeriod)):
+        return _FULL
+    if isinstance(operand, (AbstractTimePeriod, AbstractWeeklyTimePeriod)):
+        return PeriodExpression(LEAF, (operand,))
+    if isinstance(operand, TimePeriodSet):
+        if not operand:
+            return _EMPTY
+        if operand == type(operand).full():
+            return _FULL
+        return PeriodExpression(LEAF, (operand,))
+    if isinstance(operand, (list, tuple)):
+        terms = tuple(_operand(period) for period in operand)
+        if any(term is NotImplemented for term in terms):
+            return NotImplemented
+        return PeriodExpression(OR, terms)
+    return NotImplemented
+
+
+def _parenthesized(expression: PeriodExpression) -> str:
+    if expression._op in (AND, OR):
+        return f"({expression!r})"
+    return repr(expression)
+
+
+def _evaluate(
+    expression: PeriodExpression, set_type: type[TimePeriodSet]
+) -> TimePeriodSet:
+    op, operands = expression._op, expression._operands
+    if op == LEAF:
+        operand = operands[0]
+        if type(operand) is set_type:
+            return operand
+        # a TimePeriodSet iterates its periods, which a WeeklyTimePeriodSet repeats on
+        # every day of the week
+        return set_type(operand if isinstance(operand, TimePeriodSet) else [operand])
+    if op == EMPTY:
+        return set_type()
+    if op == FULL:
+        return set_type.full()
+    if op == NOT:
+        return ~_evaluate(operands[0], set_type)
+    if op == OR:
+        first, *rest = (_evaluate(operand, set_type) for operand in operands)
+        return first.union(*rest)
+
+    # intersect the cheaper leaves first, and skip the remaining operands once the
+    # intersection is empty
+    result = None
+    for operand in sorted(operands, key=lambda operand: operand._op != LEAF):
+        value = _evaluate(operand, set_type)
+        result = value if result is None else result & value
+        if not result:
+            break
+    return result
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import random
+from typing import Iterable, Iterator, Optional
+
+from whenever import Time, TimeDelta
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import NS_PER_DAY, time_to_ns
+from whenever_time_period.period_set import TimePeriodSet, split_at_midnight
+from whenever_time_period.time_period import from_ns
+
+# (start_ns, end_ns) of a free stretch, wherein end_ns may exceed NS_PER_DAY when the
+# stretch continues past midnight
+Stretch = tuple[int, int]
+
+
+class _Gap:
+    """A node of a treap of free clock intervals [start, end) within the day, keyed by
+    start and holding the length of the longest interval in its subtree"""
+
+    __slots__ = ("start", "end", "priority", "left", "right", "longest")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        self.priority = random.random()
+        self.left: Optional[_Gap] = None
+        self.right: Optional[_Gap] = None
+        self.longest = end - start
+
+
+def _update(node: _Gap) -> _Gap:
+    longest = node.end - node.start
+    for child in (node.left, node.right):
+        if child is not None and child.longest > longest:
+            longest = child.longest
+    node.longest = longest
+    return node
+
+
+def _split(node: Optional[_Gap], key: int) -> tuple[Optional[_Gap], Optional[_Gap]]:
+    """Split a treap into the gaps starting before key and the rest"""
+
+    if node is None:
+        return None, None
+    if node.start < key:
+        node.right, right = _split(node.right, key)
+        return _update(node), right
+    left, node.left = _split(node.left, key)
+    return left, _update(node)
+
+
+def _merge(left: Optional[_Gap], right: Optional[_Gap]) -> Optional[_Gap]:
+    """Merge two treaps wherein every gap of left starts before every gap of right"""
+
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+
+def _floor(node: Optional[_Gap], key: int) -> Optional[_Gap]:
+    """The gap with the largest start <= key"""
+
+    found = None
+    while node is not None:
+        if node.start <= key:
+            found, node = node, node.right
+        else:
+            node = node.left
+    return found
+
+
+def _first_fit(node: Optional[_Gap], lo: int, length: int) -> Optional[_Gap]:
+    """The gap with the smallest start >= lo lasting at least length"""
+
+    if node is None or node.longest < length:
+        return None
+    if node.start >= lo:
+        found = _first_fit(node.left, lo, length)
+        if found is not None:
+            return found
+        if node.end - node.start >= length:
+            return node
+    return _first_fit(node.right, lo, length)
+
+
+def _longest(node: _Gap) -> _Gap:
+    """The earliest gap of the maximum length in the treap"""
+
+    while True:
+        if node.left is not None and node.left.longest == node.longest:
+            node = node.left
+        elif node.end - node.start == node.longest:
+            return node
+        else:
+            node = node.right
+
+
+class FreeSlots:
+    """A query structure over the free time left by a collection of busy TimePeriods,
+    answering first-fit, all-fits and largest-gap queries in O(log n) (plus O(log n)
+    per reported slot), with free time wrapping around midnight.
+
+    Free clock intervals are kept in a treap ordered by start and augmented with the
+    longest interval of each subtree, so busy periods can be added incrementally
+    without rebuilding it.
+
+    Example:
+    >> slots = FreeSlots([LinearTimePeriod(Time(9), Time(17))])
+    >> slots.add(ModularTimePeriod(Time(22), Time(6)))
+    >> slots.first_fit(TimeDelta(hours=2), after=Time(16))
+    LinearTimePeriod[17:00:00, 19:00:00)
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, busy: Iterable[AbstractTimePeriod] = ()) -> None:
+        self._root: Optional[_Gap] = None
+        for start, end in (~TimePeriodSet(busy)).intervals:
+            self._root = _merge(self._root, _Gap(start, end))
+
+    def add(self, period: AbstractTimePeriod) -> None:
+        """Mark the clock time of a newly busy period as taken"""
+
+        for start, end in split_at_midnight(period):
+            self._occupy(start, end)
+
+    def _occupy(self, start: int, end: int) -> None:
+        before, rest = _split(self._root, start)
+        inside, after = _split(rest, end)
+
+        # keep what is left of the gap overlapping start and of the last gap inside
+        remainders = []
+        last = _floor(before, start)
+        if last is not None and last.end > start:
+            before, _ = _split(before, last.start)
+            remainders.append(_Gap(last.start, start))
+            if last.end > end:
+                remainders.append(_Gap(end, last.end))
+        last = _floor(inside, end)
+        if last is not None and last.end > end:
+            remainders.append(_Gap(end, last.end))
+
+        for gap in remainders:
+            before = _merge(before, gap)
+        self._root = _merge(before, after)
+
+    def _ends(self) -> tuple[Optional[_Gap], Optional[_Gap]]:
+        """The gaps starting at midnight and ending at midnight, if any"""
+
+        head = tail = self._root
+        while head is not None and head.left is not None:
+            head = head.left
+        while tail is not None and tail.right is not None:
+            tail = tail.right
+        return (
+            head if head is not None and head.start == 0 else None,
+            tail if tail is not None and tail.end == NS_PER_DAY else None,
+        )
+
+    def _containing(self, ns: int) -> Optional[Stretch]:
+        """The free stretch containing the given nanosecond of the day, with an end
+        after ns"""
+
+        gap = _floor(self._root, ns)
+        if gap is None or gap.end <= ns:
+            return None
+        head, tail = self._ends()
+        if head is not None and tail is not None:
+            if gap is head:
+                return tail.start, gap.end
+            if gap is tail:
+                return gap.start, NS_PER_DAY + head.end
+        return gap.start, gap.end
+
+    def _stretches(self, length: int, lo: int, hi: int) -> Iterator[Stretch]:
+        """The free stretches starting in [lo, hi) lasting at least length, in order"""
+
+        head, tail = self._ends()
+        joined = head is not None and tail is not None and head is not tail
+
+        gap = _first_fit(self._root, lo, length)
+        while gap is not None and gap.start < hi:
+            if not (joined and (gap is head or gap is tail)):
+                yield gap.start, gap.end
+            gap = _first_fit(self._root, gap.start + 1, length)
+
+        # the stretch through midnight starts at the last gap
+        if joined and lo <= tail.start < hi:
+            if NS_PER_DAY - tail.start + head.end >= length:
+                yield tail.start, NS_PER_DAY + head.end
+
+    def first_fit(
+        self, duration: TimeDelta, after: Time = Time()
+    ) -> Optional[AbstractTimePeriod]:
+        """Return the earliest free window of the given duration starting at or after the
+        given time, wrapping around midnight, or None if no free stretch is long enough"""
+
+        length, after_ns = _length(duration), time_to_ns(after)
+        if self._is_free_all_day():
+            return _window(after_ns, length)
+
+        containing = self._containing(after_ns)
+        if containing is not None and containing[1] - after_ns >= length:
+            return _window(after_ns, length)
+        for lo, hi in ((after_ns + 1, NS_PER_DAY), (0, after_ns + 1)):
+            for start, _ in self._stretches(length, lo, hi):
+                return _window(start, length)
+        return None
+
+    def all_fits(
+        self, duration: TimeDelta, after: Time = Time()
+    ) -> Iterator[AbstractTimePeriod]:
+        """Yield every free stretch lasting at least the given duration, in order around
+        the clock from the given time. A stretch containing the time is cut to start at
+        it if what remains is still long enough, and is otherwise yielded whole in turn
+        on the next day."""
+
+        length, after_ns = _length(duration), time_to_ns(after)
+        if self._is_free_all_day():
+            if length <= NS_PER_DAY:
+                yield from_ns(after_ns, after_ns)
+            return
+
+        skip = None
+        containing = self._containing(after_ns)
+        if containing is not None and containing[1] - after_ns >= length:
+            skip = containing[0]
+            yield from_ns(after_ns, containing[1] % NS_PER_DAY)
+        for lo, hi in ((after_ns + 1, NS_PER_DAY), (0, after_ns + 1)):
+            for start, end in self._stretches(length, lo, hi):
+                if start != skip:
+                    yield from_ns(start, end % NS_PER_DAY)
+
+    def largest_gap(self) -> Optional[AbstractTimePeriod]:
+        """Return the longest free stretch, the earliest of equally long stretches, or
+        None if no time is free"""
+
+        if self._root is None:
+            return None
+        if self._is_free_all_day():
+            return from_ns(0, 0)
+
+        head, tail = self._ends()
+        longest = _longest(self._root)
+        if head is not None and tail is not None:
+            through_midnight = NS_PER_DAY - tail.start + head.end
+            if through_midnight > longest.end - longest.start:
+                return from_ns(tail.start, head.end)
+        return from_ns(longest.start, longest.end % NS_PER_DAY)
+
+    def _is_free_all_day(self) -> bool:
+        root = self._root
+        return root is not None and root.start == 0 and root.end == NS_PER_DAY
+
+
+def _length(duration: TimeDelta) -> int:
+    length = duration.total("nanoseconds")
+    if length <= 0:
+        raise ValueError("duration must be positive")
+    return int(length)
+
+
+def _window(start: int, length: int) -> Optional[AbstractTimePeriod]:
+    if length > NS_PER_DAY:
+        return None
+    return from_ns(start, (start + length) % NS_PER_DAY)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import ClassVar, Generic, Hashable, Iterable, Mapping, Optional, TypeVar
+
+from whenever import Time
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import NS_PER_DAY, NS_PER_WEEK, time_to_ns
+from whenever_time_period.period_set import split_at_midnight
+from whenever_time_period.weekly import (
+    AbstractWeeklyTimePeriod,
+    LocalDateTime,
+    datetime_to_week_ns,
+    split_at_week,
+)
+
+K = TypeVar("K", bound=Hashable)
+
+# (start_ns, end_ns, key)
+Entry = tuple[int, int, K]
+
+
+class _Node(Generic[K]):
+    """A node of a centered interval tree, holding the intervals containing its center
+    sorted by ascending start and by descending end"""
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(
+        self,
+        center: int,
+        entries: list[Entry],
+        left: Optional[_Node],
+        right: Optional[_Node],
+    ) -> None:
+        self.center = center
+        self.by_start = sorted(entries, key=lambda entry: entry[0])
+        self.by_end = sorted(entries, key=lambda entry: entry[1], reverse=True)
+        self.left = left
+        self.right = right
+
+
+def _build(entries: list[Entry]) -> Optional[_Node]:
+    if not entries:
+        return None
+
+    # the median start is the start of some interval, so that interval contains the
+    # center and every level of the tree removes at least one interval
+    center = sorted(entry[0] for entry in entries)[len(entries) // 2]
+    left, here, right = [], [], []
+    for entry in entries:
+        if entry[1] <= center:
+            left.append(entry)
+        elif entry[0] > center:
+            right.append(entry)
+        else:
+            here.append(entry)
+    return _Node(center, here, _build(left), _build(right))
+
+
+class PeriodIndex(Generic[K]):
+    """A read-optimized index answering "which periods contain this Time?" for a fixed
+    collection of keyed TimePeriods in O(log n + k), where k is the number of keys
+    reported.
+
+    ModularTimePeriods are split at midnight into two intervals under the same key and
+    InfiniteTimePeriods contain every time, so each key is reported at most once.
+
+    Example:
+    >> index = PeriodIndex({"night": ModularTimePeriod(Time(22), Time(6))})
+    >> index.stab(Time(23))
+    ['night']
+    """
+
+    __slots__ = ("_root", "_always", "_size")
+
+    # the length of the cycle of the intervals and how a period splits into them,
+    # overridden by WeeklyPeriodIndex
+    _cycle_ns: ClassVar[int] = NS_PER_DAY
+    _split = staticmethod(split_at_midnight)
+
+    def __init__(
+        self,
+        periods: Mapping[K, AbstractTimePeriod | AbstractWeeklyTimePeriod]
+        | Iterable[tuple[K, AbstractTimePeriod | AbstractWeeklyTimePeriod]],
+    ) -> None:
+        items = periods.items() if isinstance(periods, Mapping) else periods
+
+        entries: list[Entry] = []
+        self._always: list[K] = []
+        self._size = 0
+        split, whole = self._split, [(0, self._cycle_ns)]
+        for key, period in items:
+            self._size += 1
+            intervals = split(period)
+            if intervals == whole:
+                self._always.append(key)
+                continue
+            for start, end in intervals:
+                entries.append((start, end, key))
+
+        self._root = _build(entries)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def stab_ns(self, ns: int) -> list[K]:
+        """Return the keys of all periods containing the given nanosecond of the day"""
+
+        keys = list(self._always)
+        node = self._root
+        while node is not None:
+            if ns < node.center:
+                for start, _, key in node.by_start:
+                    if start > ns:
+                        break
+                    keys.append(key)
+                node = node.left
+            else:
+                for _, end, key in node.by_end:
+                    if end <= ns:
+                        break
+                    keys.append(key)
+                node = node.right
+        return keys
+
+    def stab(self, time: Time) -> list[K]:
+        """Return the keys of all periods containing the given Time, in no particular
+        order"""
+
+        return self.stab_ns(time_to_ns(time))
+
+    def stab_many(self, times: Iterable[Time]) -> list[list[K]]:
+        """Return the keys of all periods containing each of the given Times"""
+
+        stab_ns = self.stab_ns
+        return [stab_ns(time_to_ns(time)) for time in times]
+
+
+class WeeklyPeriodIndex(PeriodIndex[K]):
+    """A PeriodIndex answering "which periods contain this datetime?" for keyed
+    WeeklyTimePeriods, and TimePeriods recurring on every day of the week, by the local
+    day of the week and clock time of the datetime. stab_ns takes nanoseconds since
+    midnight on Monday.
+
+    Example:
+    >> index = WeeklyPeriodIndex({"weekend": ModularWeeklyTimePeriod(Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8))})
+    >> index.stab(PlainDateTime(2024, 1, 6, 12))
+    ['weekend']
+    """
+
+    __slots__ = ()
+
+    _cycle_ns = NS_PER_WEEK
+    _split = staticmethod(split_at_week)
+
+    def stab(self, moment: LocalDateTime) -> list[K]:
+        """Return the keys of all periods containing the given datetime, in no
+        particular order"""
+
+        return self.stab_ns(datetime_to_week_ns(moment))
+
+    def stab_many(self, moments: Iterable[LocalDateTime]) -> list[list[K]]:
+        """Return the keys of all periods containing each of the given datetimes"""
+
+        stab_ns = self.stab_ns
+        return [stab_ns(datetime_to_week_ns(moment)) for moment in moments]
@@ -0,0 +1,199 @@
+"""Opt-in instrumentation of the hot paths of the built-in TimePeriod classes.
+
+While enabled, construction, membership (__contains__), intersection (__and__) and
+comparisons (__lt__, __gt__) are counted and timed per operation and per pair of
+operand types. Instrumentation works by swapping instrumented methods onto the classes
+and restoring the originals when disabled, so there is no overhead at all while it is
+disabled.
+
+Example:
+>> from whenever_time_period import instrumentation
+>> with instrumentation.enabled():
+..     LinearTimePeriod(Time(3), Time(10)) & ModularTimePeriod(Time(7), Time(5))
+>> instrumentation.snapshot()["operations"]["and"]["count"]
+1
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, Optional
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.time_period import PERIOD_TYPES
+
+# upper bounds of the latency histogram buckets, the last bucket is unbounded
+BUCKET_BOUNDS_NS = (100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 100_000)
+
+# (operation, type of self, type of other or None)
+Key = tuple[str, str, Optional[str]]
+
+
+class _Stats:
+    __slots__ = ("count", "total_ns", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.histogram = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+
+    def merge(self, other: _Stats) -> None:
+        self.count += other.count
+        self.total_ns += other.total_ns
+        for i, count in enumerate(other.histogram):
+            self.histogram[i] += count
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "histogram": list(self.histogram),
+        }
+
+
+_lock = threading.Lock()
+_stats: dict[Key, _Stats] = {}
+_originals: dict[tuple[type, str], Any] = {}
+
+
+def _record(key: Key, elapsed_ns: int) -> None:
+    with _lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = _Stats()
+        stats.count += 1
+        stats.total_ns += elapsed_ns
+        stats.histogram[bisect_left(BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+
+
+def _binary(operation: str, method: Callable) -> Callable:
+    @wraps(method)
+    def instrumented(self, other):
+        start = perf_counter_ns()
+        try:
+            return method(self, other)
+        finally:
+            _record(
+                (operation, type(self).__name__, type(other).__name__),
+                perf_counter_ns() - start,
+            )
+
+    return instrumented
+
+
+def _init(method: Callable) -> Callable:
+    @wraps(method)
+    def instrumented(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _record(("construct", type(self).__name__, None), perf_counter_ns() - start)
+
+    return instrumented
+
+
+def _from_parts(method: Callable) -> Callable:
+    function = method.__func__
+
+    @wraps(function)
+    def instrumented(cls, *args):
+        start = perf_counter_ns()
+        try:
+            return function(cls, *args)
+        finally:
+            _record(("construct", cls.__name__, None), perf_counter_ns() - start)
+
+    return classmethod(instrumented)
+
+
+def _patch(cls: type, name: str, wrapper: Callable[[Any], Any]) -> None:
+    _originals[cls, name] = cls.__dict__.get(name)
+    setattr(cls, name, wrapper(getattr(cls, name)))
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable() -> None:
+    """Start instrumenting the built-in TimePeriod classes"""
+
+    with _lock:
+        if _originals:
+            return
+        for cls in PERIOD_TYPES:
+            _patch(cls, "__init__", _init)
+            _patch(cls, "_from_parts", _from_parts)
+            _patch(cls, "__contains__", lambda m: _binary("contains", m))
+            _patch(cls, "__and__", lambda m: _binary("and", m))
+        _patch(AbstractTimePeriod, "__lt__", lambda m: _binary("lt", m))
+        _patch(AbstractTimePeriod, "__gt__", lambda m: _binary("gt", m))
+
+
+def disable() -> None:
+    """Stop instrumenting, restoring the original methods. Collected statistics are kept
+    until reset."""
+
+    with _lock:
+        for (cls, name), original in _originals.items():
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        _originals.clear()
+
+
+@contextmanager
+def enabled() -> Iterator[None]:
+    """Instrument the TimePeriod classes for the duration of the context"""
+
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset() -> None:
+    """Discard all collected statistics"""
+
+    with _lock:
+        _stats.clear()
+
+
+def snapshot() -> dict[str, Any]:
+    """Return a JSON-serializable copy of the collected statistics, totalled per
+    operation and broken down per pair of operand types.
+
+    Each entry holds the call count, the cumulative time in nanoseconds and a latency
+    histogram, where histogram[i] counts calls that took at most bucket_bounds_ns[i]
+    nanoseconds (and more than the previous bound), and the last bucket counts the
+    calls slower than every bound."""
+
+    with _lock:
+        items = [(key, stats.as_dict()) for key, stats in _stats.items()]
+        operations: dict[str, _Stats] = {}
+        for (operation, _, _), stats in _stats.items():
+            operations.setdefault(operation, _Stats()).merge(stats)
+
+    return {
+        "enabled": is_enabled(),
+        "bucket_bounds_ns": list(BUCKET_BOUNDS_NS),
+        "operations": {
+            operation: stats.as_dict()
+            for operation, stats in sorted(operations.items())
+        },
+        "pairs": [
+            {"operation": operation, "left": left, "right": right, **stats}
+            for (operation, left, right), stats in sorted(
+                items, key=lambda item: (item[0][0], item[0][1], item[0][2] or "")
+            )
+        ],
+    }
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import random
+import threading
+from itertools import count
+from typing import Generic, Hashable, Iterable, Iterator, Mapping, Optional, TypeVar
+
+from whenever import Time
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import time_to_ns
+from whenever_time_period.period_set import split_at_midnight
+from whenever_time_period.time_period import InfiniteTimePeriod
+
+K = TypeVar("K", bound=Hashable)
+
+
+class _Node:
+    """A node of a persistent treap of clock intervals [start, end), ordered by
+    (start, seq) and holding the greatest end in its subtree.
+
+    Nodes are shared between snapshots and never change once published. A node created
+    by the update of the given version is not yet published, so that update may change
+    it in place rather than copying it."""
+
+    __slots__ = (
+        "start",
+        "end",
+        "seq",
+        "key",
+        "period",
+        "priority",
+        "left",
+        "right",
+        "max_end",
+        "version",
+    )
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        seq: int,
+        key: Hashable,
+        period: AbstractTimePeriod,
+        priority: float,
+        version: int,
+    ) -> None:
+        self.start = start
+        self.end = end
+        self.seq = seq
+        self.key = key
+        self.period = period
+        self.priority = priority
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        self.max_end = end
+        self.version = version
+
+
+def _own(node: _Node, version: int) -> _Node:
+    """Return node if it belongs to the update of version, or a copy of it which does"""
+
+    if node.version == version:
+        return node
+    copy = _Node(
+        node.start, node.end, node.seq, node.key, node.period, node.priority, version
+    )
+    copy.left = node.left
+    copy.right = node.right
+    copy.max_end = node.max_end
+    return copy
+
+
+def _update(node: _Node) -> _Node:
+    max_end = node.end
+    for child in (node.left, node.right):
+        if child is not None and child.max_end > max_end:
+            max_end = child.max_end
+    node.max_end = max_end
+    return node
+
+
+def _split(
+    node: Optional[_Node], order: tuple[int, int], version: int
+) -> tuple[Optional[_Node], Optional[_Node]]:
+    """Split a treap into the nodes ordered before order and the rest"""
+
+    if node is None:
+        return None, None
+    node = _own(node, version)
+    if (node.start, node.seq) < order:
+        node.right, right = _split(node.right, order, version)
+        return _update(node), right
+    left, node.left = _split(node.left, order, version)
+    return left, _update(node)
+
+
+def _merge(
+    left: Optional[_Node], right: Optional[_Node], version: int
+) -> Optional[_Node]:
+    """Merge two treaps wherein every node of left is ordered before every node of
+    right"""
+
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left = _own(left, version)
+        left.right = _merge(left.right, right, version)
+        return _update(left)
+    right = _own(right, version)
+    right.left = _merge(left, right.left, version)
+    return _update(right)
+
+
+def _insert(node: Optional[_Node], new: _Node, version: int) -> _Node:
+    if node is None:
+        return new
+    order = (new.start, new.seq)
+    if new.priority > node.priority:
+        new.left, new.right = _split(node, order, version)
+        return _update(new)
+    node = _own(node, version)
+    if order < (node.start, node.seq):
+        node.left = _insert(node.left, new, version)
+    else:
+        node.right = _insert(node.right, new, version)
+    return _update(node)
+
+
+def _delete(node: Optional[_Node], order: tuple[int, int], version: int) -> _Node:
+    if node is None:
+        raise KeyError(order)
+    here = (node.start, node.seq)
+    if order == here:
+        return _merge(node.left, node.right, version)
+    node = _own(node, version)
+    if order < here:
+        node.left = _delete(node.left, order, version)
+    else:
+        node.right = _delete(node.right, order, version)
+    return _update(node)
+
+
+def _remove(
+    entries: dict, root: Optional[_Node], key: Hashable, version: int
+) -> Optional[_Node]:
+    """Remove the intervals of key from the treap and its entry from entries"""
+
+    _, orders = entries.pop(key)
+    for order in orders:
+        root = _delete(root, order, version)
+    return root
+
+
+class PeriodSnapshot(Generic[K]):
+    """An immutable version of a LivePeriodIndex, answering "which periods contain this
+    Time?" in O(log n + k log n), where k is the number of keys reported. Snapshots
+    share the unchanged parts of their trees, so publishing one costs O(log n) per
+    period added or removed.
+
+    Each update of the index publishes a new snapshot with the next version, and a
+    snapshot is never modified, so it can be queried from any thread without locking.
+    """
+
+    __slots__ = ("version", "_root", "_size")
+
+    def __init__(self, version: int, root: Optional[_Node], size: int) -> None:
+        self.version = version
+        self._root = root
+        self._size = size
+
+    def __len__(self) -> int:
+        """The number of keyed periods"""
+
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(version={self.version}, periods={len(self)})"
+
+    def stab_ns(self, ns: int) -> list[K]:
+        """Return the keys of all periods containing the given nanosecond of the day"""
+
+        keys: list[K] = []
+        root = self._root
+        if root is None or root.max_end <= ns:
+            return keys
+        # only subtrees with an interval ending after ns are visited
+        stack = [root]
+        push, pop, report = stack.append, stack.pop, keys.append
+        while stack:
+            node = pop()
+            left = node.left
+            if left is not None and left.max_end > ns:
+                push(left)
+            if node.start <= ns:
+                if ns < node.end:
+                    report(node.key)
+                right = node.right
+                if right is not None and right.max_end > ns:
+                    push(right)
+        return keys
+
+    def stab(self, time: Time) -> list[K]:
+        """Return the keys of all periods containing the given Time, in no particular
+        order"""
+
+        return self.stab_ns(time_to_ns(time))
+
+    def stab_many(self, times: Iterable[Time]) -> list[list[K]]:
+        """Return the keys of all periods containing each of the given Times"""
+
+        stab_ns = self.stab_ns
+        return [stab_ns(time_to_ns(time)) for time in times]
+
+    def items(self) -> Iterator[tuple[K, AbstractTimePeriod]]:
+        """Iterate the (key, period) pairs of the snapshot in order of start time"""
+
+        stack: list[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            # a ModularTimePeriod split at midnight is reported by the interval which
+            # starts with it
+            if node.start == node.period.start_ns or isinstance(
+                node.period, InfiniteTimePeriod
+            ):
+                yield node.key, node.period
+            node = node.right
+
+
+class LivePeriodIndex(Generic[K]):
+    """A mutable index of keyed TimePeriods for concurrent readers and writers.
+
+    Periods are added and removed by key in O(log n) tree operations, plus a copy of
+    the key table per update, which keeps a failed update from changing anything.
+    Every update publishes an immutable PeriodSnapshot, and update applies any number
+    of additions and removals as a single new snapshot. Readers query the snapshot attribute, which is replaced
+    by a single reference assignment and never locked, so readers never block writers
+    or each other. Writers are serialized by a lock.
+
+    Example:
+    >> index = LivePeriodIndex({"night": ModularTimePeriod(Time(22), Time(6))})
+    >> index.update(add={"morning": LinearTimePeriod(Time(5), Time(9))}, remove=["night"])
+    PeriodSnapshot(version=2, periods=1)
+    >> index.snapshot.stab(Time(5, 30))
+    ['morning']
+    """
+
+    def __init__(
+        self,
+        periods: Mapping[K, AbstractTimePeriod]
+        | Iterable[tuple[K, AbstractTimePeriod]] = (),
+    ) -> None:
+        # key -> (period, the (start, seq) order of each of its intervals)
+        self._entries: dict[K, tuple[AbstractTimePeriod, list[tuple[int, int]]]] = {}
+        self._sequence = count()
+        self._lock = threading.Lock()
+        self.snapshot: PeriodSnapshot[K] = PeriodSnapshot(0, None, 0)
+        self.update(add=periods)
+
+    def __len__(self) -> int:
+        return len(self.snapshot)
+
+    def update(
+        self,
+        add: Mapping[K, AbstractTimePeriod]
+        | Iterable[tuple[K, AbstractTimePeriod]] = (),
+        remove: Iterable[K] = (),
+    ) -> PeriodSnapshot[K]:
+        """Remove the periods of the keys in remove, then add the periods in add,
+        replacing any period already indexed under the same key, and publish the result
+        as a single snapshot, which is returned.
+
+        Raises a KeyError if a key in remove is not indexed, and a TypeError if a period
+        cannot be indexed, in which case nothing is changed."""
+
+        items = list(add.items() if isinstance(add, Mapping) else add)
+        remove = list(dict.fromkeys(remove))
+        with self._lock:
+            # the entries change with the snapshot, so a failure leaves both unchanged
+            entries = dict(self._entries)
+            for key in remove:
+                if key not in entries:
+                    raise KeyError(key)
+            intervals = [split_at_midnight(period) for _, period in items]
+
+            version = self.snapshot.version + 1
+            root = self.snapshot._root
+            for key in remove:
+                root = _remove(entries, root, key, version)
+            for (key, period), pieces in zip(items, intervals):
+                if key in entries:
+                    root = _remove(entries, root, key, version)
+                orders = []
+                for start, end in pieces:
+                    seq = next(self._sequence)
+                    node = _Node(start, end, seq, key, period, random.random(), version)
+                    root = _insert(root, node, version)
+                    orders.append((start, seq))
+                entries[key] = (period, orders)
+
+            snapshot = PeriodSnapshot(version, root, len(entries))
+            self._entries, self.snapshot = entries, snapshot
+        return snapshot
+
+    def add(self, key: K, period: AbstractTimePeriod) -> PeriodSnapshot[K]:
+        """Index a period under key, replacing any period already indexed under it"""
+
+        return self.update(add=[(key, period)])
+
+    def remove(self, key: K) -> PeriodSnapshot[K]:
+        """Remove the period of key. Raises a KeyError if there is none."""
+
+        return self.update(remove=[key])
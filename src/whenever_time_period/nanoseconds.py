@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from whenever import Time, Weekday
+
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MINUTE = 60 * NS_PER_SECOND
+NS_PER_HOUR = 60 * NS_PER_MINUTE
+NS_PER_DAY = 24 * NS_PER_HOUR
+NS_PER_WEEK = 7 * NS_PER_DAY
+
+
+def time_to_ns(time: Time) -> int:
+    """Return the number of nanoseconds elapsed since midnight at the given clock time,
+    in [0, NS_PER_DAY)."""
+
+    return (
+        time.hour * NS_PER_HOUR
+        + time.minute * NS_PER_MINUTE
+        + time.second * NS_PER_SECOND
+        + time.nanosecond
+    )
+
+
+def ns_to_time(ns: int) -> Time:
+    """Return the clock time at the given number of nanoseconds since midnight. The
+    inverse of time_to_ns for values in [0, NS_PER_DAY)."""
+
+    if not 0 <= ns < NS_PER_DAY:
+        raise ValueError(f"{ns} is not a nanosecond of the day")
+
+    hour, ns = divmod(ns, NS_PER_HOUR)
+    minute, ns = divmod(ns, NS_PER_MINUTE)
+    second, nanosecond = divmod(ns, NS_PER_SECOND)
+    return Time(hour, minute, second, nanosecond=nanosecond)
+
+
+def week_to_ns(day: Weekday, time: Time) -> int:
+    """Return the number of nanoseconds elapsed since midnight on Monday at the given
+    day of the week and clock time, in [0, NS_PER_WEEK)."""
+
+    return (day.value - 1) * NS_PER_DAY + time_to_ns(time)
+
+
+def ns_to_week(ns: int) -> tuple[Weekday, Time]:
+    """Return the day of the week and clock time at the given number of nanoseconds
+    since midnight on Monday. The inverse of week_to_ns for values in [0, NS_PER_WEEK)."""
+
+    if not 0 <= ns < NS_PER_WEEK:
+        raise ValueError(f"{ns} is not a nanosecond of the week")
+
+    day, ns = divmod(ns, NS_PER_DAY)
+    return Weekday(day + 1), ns_to_time(ns)
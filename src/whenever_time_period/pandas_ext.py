@@ -0,0 +1,285 @@
+"""A pandas extension type for TimePeriods, requiring pandas and numpy.
+
+Importing this module registers TimePeriodDtype under the name "time_period" and the
+Series accessor "periods". TimePeriodArray stores periods as the int64 and int8 columns
+of a PeriodArray, so membership, intersection, sorting, take and concat never box
+TimePeriod objects.
+
+Example:
+>> import whenever_time_period.pandas_ext
+>> shifts = pd.Series([LinearTimePeriod(Time(9), Time(17)), ModularTimePeriod(Time(22), Time(6))], dtype="time_period")
+>> shifts.periods.contains(pd.Series(pd.to_datetime(["2024-01-01 12:00", "2024-01-01 12:00"])))
+array([ True, False])
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+    take,
+)
+from pandas.api.indexers import check_array_indexer
+from whenever import Time
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.array import EMPTY, INFINITE, PeriodArray, times_to_ns
+from whenever_time_period.nanoseconds import NS_PER_DAY, time_to_ns
+
+
+@register_extension_dtype
+class TimePeriodDtype(ExtensionDtype):
+    """The dtype of TimePeriodArray, named "time_period". Missing periods are None."""
+
+    name = "time_period"
+    type = AbstractTimePeriod
+    kind = "O"
+    na_value = None
+
+    @classmethod
+    def construct_array_type(cls) -> type[TimePeriodArray]:
+        return TimePeriodArray
+
+
+class TimePeriodArray(ExtensionArray):
+    """A pandas ExtensionArray of TimePeriods backed by a PeriodArray, wherein EMPTY
+    periods are missing values"""
+
+    def __init__(self, periods: PeriodArray) -> None:
+        self._periods = periods
+
+    @classmethod
+    def from_periods(
+        cls, periods: Iterable[AbstractTimePeriod | None]
+    ) -> TimePeriodArray:
+        """Build an array from TimePeriods, with None for missing values"""
+
+        periods = list(periods)
+        array = PeriodArray.empty(len(periods))
+        for i, period in enumerate(periods):
+            if period is None or period is pd.NA:
+                continue
+            if not isinstance(period, AbstractTimePeriod):
+                raise TypeError(f"cannot store {period!r} in a TimePeriodArray")
+            array.start_ns[i] = period.start_ns
+            array.end_ns[i] = period.end_ns
+            array.kind[i] = period.kind
+        return cls(array)
+
+    def to_periods(self) -> list[AbstractTimePeriod | None]:
+        return self._periods.to_periods()
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Iterable, *, dtype: Any = None, copy: bool = False
+    ) -> TimePeriodArray:
+        if isinstance(scalars, TimePeriodArray):
+            return scalars.copy() if copy else scalars
+        return cls.from_periods(scalars)
+
+    @classmethod
+    def _from_factorized(
+        cls, values: np.ndarray, original: TimePeriodArray
+    ) -> TimePeriodArray:
+        return cls.from_periods(values)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[TimePeriodArray]) -> TimePeriodArray:
+        columns = [array._periods for array in to_concat]
+        return cls(
+            PeriodArray(
+                np.concatenate([c.start_ns for c in columns]),
+                np.concatenate([c.end_ns for c in columns]),
+                np.concatenate([c.kind for c in columns]),
+            )
+        )
+
+    @property
+    def dtype(self) -> TimePeriodDtype:
+        return TimePeriodDtype()
+
+    @property
+    def nbytes(self) -> int:
+        periods = self._periods
+        return periods.start_ns.nbytes + periods.end_ns.nbytes + periods.kind.nbytes
+
+    def __len__(self) -> int:
+        return len(self._periods)
+
+    def __getitem__(
+        self, item: Any
+    ) -> Union[AbstractTimePeriod, None, TimePeriodArray]:
+        if isinstance(item, (int, np.integer)):
+            return self._periods[int(item)]
+        item = check_array_indexer(self, item)
+        if isinstance(item, np.ndarray) and item.dtype == bool:
+            item = np.flatnonzero(item)
+        return TimePeriodArray(self._periods[item])
+
+    def __iter__(self) -> Iterator[AbstractTimePeriod | None]:
+        return iter(self._periods)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = check_array_indexer(self, key)
+        if isinstance(value, AbstractTimePeriod) or value is None or value is pd.NA:
+            value = TimePeriodArray.from_periods([value])._periods
+            start_ns, end_ns, kind = value.start_ns[0], value.end_ns[0], value.kind[0]
+        else:
+            value = TimePeriodArray._from_sequence(value)._periods
+            start_ns, end_ns, kind = value.start_ns, value.end_ns, value.kind
+        self._periods.start_ns[key] = start_ns
+        self._periods.end_ns[key] = end_ns
+        self._periods.kind[key] = kind
+
+    def isna(self) -> np.ndarray:
+        return self._periods.kind == EMPTY
+
+    def copy(self) -> TimePeriodArray:
+        return TimePeriodArray(self._periods.copy())
+
+    def take(
+        self, indices: Sequence[int], allow_fill: bool = False, fill_value: Any = None
+    ) -> TimePeriodArray:
+        fill = TimePeriodArray.from_periods([fill_value])._periods
+        periods = self._periods
+        return TimePeriodArray(
+            PeriodArray(
+                *(
+                    take(column, indices, allow_fill=allow_fill, fill_value=filler[0])
+                    for column, filler in (
+                        (periods.start_ns, fill.start_ns),
+                        (periods.end_ns, fill.end_ns),
+                        (periods.kind, fill.kind),
+                    )
+                )
+            )
+        )
+
+    def _keys(self) -> np.ndarray:
+        """Rows of (kind, start_ns, end_ns) which are equal exactly when the periods are,
+        as every InfiniteTimePeriod is equal"""
+
+        periods = self._periods
+        infinite = periods.kind == INFINITE
+        return np.stack(
+            [
+                periods.kind.astype(np.int64),
+                np.where(infinite, 0, periods.start_ns),
+                np.where(infinite, 0, periods.end_ns),
+            ],
+            axis=1,
+        )
+
+    def __eq__(self, other: Any) -> np.ndarray:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, AbstractTimePeriod):
+            other = TimePeriodArray.from_periods([other] * len(self))
+        elif not isinstance(other, TimePeriodArray):
+            other = TimePeriodArray._from_sequence(other)
+        if len(other) != len(self):
+            raise ValueError("lengths must match to compare")
+        return (self._keys() == other._keys()).all(axis=1) & ~self.isna()
+
+    def __ne__(self, other: Any) -> np.ndarray:
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        # missing periods equal nothing, so as NaN they differ from everything
+        return ~equal
+
+    def factorize(
+        self, use_na_sentinel: bool = True
+    ) -> tuple[np.ndarray, TimePeriodArray]:
+        present = ~self.isna()
+        _, first, inverse = np.unique(
+            self._keys()[present], axis=0, return_index=True, return_inverse=True
+        )
+        # number the unique periods in order of appearance
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        codes = np.full(len(self), -1, dtype=np.intp)
+        codes[present] = rank[inverse.ravel()]
+        uniques = self[np.flatnonzero(present)[first[order]]]
+        if not use_na_sentinel and not present.all():
+            codes[~present] = len(uniques)
+            uniques = TimePeriodArray._concat_same_type(
+                [uniques, TimePeriodArray.from_periods([None])]
+            )
+        return codes, uniques
+
+    def unique(self) -> TimePeriodArray:
+        return self.factorize(use_na_sentinel=False)[1]
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, Any]:
+        return np.array(self.to_periods(), dtype=object), None
+
+    def _values_for_argsort(self) -> np.ndarray:
+        # TimePeriods are ordered by start time
+        return self._periods.start_ns
+
+    def contains(self, times: Any) -> np.ndarray:
+        """Elementwise membership: the boolean mask m wherein m[i] is True when the
+        clock time of times[i] is in the i-th period. times is a whenever.Time, or a
+        Series or array of Times, nanoseconds of the day or datetime64 values."""
+
+        return self._periods.contains_elementwise(_clock_ns(times, len(self)))
+
+    def intersect(
+        self, other: TimePeriodArray
+    ) -> tuple[TimePeriodArray, TimePeriodArray]:
+        """Elementwise intersection, as the pair of arrays (first, second) described by
+        PeriodArray.intersect, with missing periods for absent pieces"""
+
+        first, second = self._periods.intersect(other._periods)
+        return TimePeriodArray(first), TimePeriodArray(second)
+
+    def __and__(
+        self, other: TimePeriodArray
+    ) -> tuple[TimePeriodArray, TimePeriodArray]:
+        return self.intersect(other)
+
+
+def _clock_ns(times: Any, size: int) -> np.ndarray:
+    if isinstance(times, Time):
+        return np.full(size, time_to_ns(times), dtype=np.int64)
+    if isinstance(times, (pd.Series, pd.Index)):
+        times = times.to_numpy()
+    times = np.asarray(times)
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times.astype("datetime64[ns]").view(np.int64) % NS_PER_DAY
+    if times.dtype == object:
+        return times_to_ns(times)
+    return times.astype(np.int64, copy=False)
+
+
+@register_series_accessor("periods")
+class TimePeriodAccessor:
+    """Vectorized TimePeriod operations on a Series of dtype "time_period", as
+    series.periods.contains(times) and series.periods.intersect(other)"""
+
+    def __init__(self, series: pd.Series) -> None:
+        if not isinstance(series.dtype, TimePeriodDtype):
+            raise AttributeError("the periods accessor requires dtype 'time_period'")
+        self._series = series
+
+    def contains(self, times: Any) -> np.ndarray:
+        return self._series.array.contains(times)
+
+    def intersect(self, other: pd.Series) -> pd.DataFrame:
+        """The elementwise intersection with another Series of periods, as a DataFrame
+        of the "first" and "second" pieces, aligned on the index of the series"""
+
+        other_array = other.array if isinstance(other, pd.Series) else other
+        first, second = self._series.array.intersect(other_array)
+        return pd.DataFrame(
+            {"first": first, "second": second}, index=self._series.index
+        )
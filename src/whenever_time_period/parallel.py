@@ -0,0 +1,354 @@
+"""Batch membership and intersection over very large collections, chunked across a
+concurrent.futures process pool or thread pool. Requires numpy.
+
+Inputs and outputs live in one shared memory block per batch, laid out as the int64
+and int8 columns of PeriodArrays. Each task is only the name of the block, its layout
+and a [start, stop) range of rows, so the cost of submitting a task does not grow with
+the chunk size. Every chunk writes to its own rows of the outputs, so the results are
+deterministic and in input order whatever the number of workers or the order in which
+chunks complete.
+
+contains_many and intersect_many evaluate the same batches in a pool of threads of this
+process, which share the inputs and outputs without copying them. Each thread also
+converts its own chunk of TimePeriods and Times, so on free-threaded builds of CPython
+the whole batch scales across cores, while with the GIL only the numpy kernels, which
+release it, run in parallel.
+
+Example:
+>> periods = PeriodArray.from_periods(nightly_periods)
+>> others = PeriodArray.from_periods(other_periods)
+>> with ProcessPoolExecutor() as executor:
+..     first, second = intersect_pairs(periods, others, executor=executor)
+>> mask = contains_many(nightly_periods, times, threads=8)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from multiprocessing import shared_memory
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.array import PeriodArray, times_to_ns
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+# threads share memory, so smaller chunks balance the load at no extra cost
+DEFAULT_THREAD_CHUNK_SIZE = 1 << 16
+
+Periods = Union[PeriodArray, Sequence[AbstractTimePeriod]]
+
+# name -> (byte offset, dtype, length) of each column in a shared memory block
+Layout = dict[str, tuple[int, str, int]]
+
+
+def contains_pairs(
+    periods: Periods,
+    times: Union[np.ndarray, Iterable],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> np.ndarray:
+    """Return the boolean mask m wherein m[i] is True when times[i] is in periods[i].
+
+    periods is a PeriodArray or a sequence of TimePeriods, and times an array of
+    nanoseconds since midnight or an iterable of whenever.Time objects, of equal
+    length. The pairs are split into chunks of chunk_size, which are evaluated by a
+    new pool of worker processes (by default one per CPU), or by the given executor."""
+
+    periods = _as_array(periods)
+    times_ns = _as_ns(times)
+    if len(times_ns) != len(periods):
+        raise ValueError("periods and times must be of equal length")
+
+    columns = {
+        **_period_columns("periods", periods),
+        "times_ns": times_ns,
+        "out": np.zeros(len(periods), dtype=bool),
+    }
+    with _SharedColumns(columns) as shared:
+        _run(_contains_chunk, shared, len(periods), workers, chunk_size, executor)
+        return shared.array("out").copy()
+
+
+def intersect_pairs(
+    left: Periods,
+    right: Periods,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> tuple[PeriodArray, PeriodArray]:
+    """Elementwise left[i] & right[i] of two collections of equal length, as the pair of
+    PeriodArrays (first, second) described by PeriodArray.intersect.
+
+    left and right are PeriodArrays or sequences of TimePeriods. The pairs are split
+    into chunks of chunk_size, which are evaluated by a new pool of worker processes
+    (by default one per CPU), or by the given executor."""
+
+    left, right = _as_array(left), _as_array(right)
+    if len(left) != len(right):
+        raise ValueError("left and right must be of equal length")
+
+    size = len(left)
+    columns = {
+        **_period_columns("left", left),
+        **_period_columns("right", right),
+        **_period_columns("first", PeriodArray.empty(size)),
+        **_period_columns("second", PeriodArray.empty(size)),
+    }
+    with _SharedColumns(columns) as shared:
+        _run(_intersect_chunk, shared, size, workers, chunk_size, executor)
+        return shared.periods("first").copy(), shared.periods("second").copy()
+
+
+def contains_many(
+    periods: Periods,
+    times: Union[np.ndarray, Iterable],
+    *,
+    threads: Optional[int] = None,
+    chunk_size: int = DEFAULT_THREAD_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> np.ndarray:
+    """Return the boolean mask m wherein m[i] is True when times[i] is in periods[i],
+    as contains_pairs, evaluated by a pool of threads of this process.
+
+    The pairs are split into chunks of chunk_size, which are evaluated by a new pool of
+    threads (by default one per CPU), or by the given executor."""
+
+    times = times if isinstance(times, np.ndarray) else list(times)
+    if len(times) != len(periods):
+        raise ValueError("periods and times must be of equal length")
+
+    out = np.zeros(len(periods), dtype=bool)
+
+    def chunk_task(chunk: slice) -> None:
+        _as_array(periods[chunk]).contains_elementwise(
+            _as_ns(times[chunk]), out=out[chunk]
+        )
+
+    _run_threads(chunk_task, len(periods), threads, chunk_size, executor)
+    return out
+
+
+def intersect_many(
+    left: Periods,
+    right: Periods,
+    *,
+    threads: Optional[int] = None,
+    chunk_size: int = DEFAULT_THREAD_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> tuple[PeriodArray, PeriodArray]:
+    """Elementwise left[i] & right[i] of two collections of equal length, as
+    intersect_pairs, evaluated by a pool of threads of this process.
+
+    The pairs are split into chunks of chunk_size, which are evaluated by a new pool of
+    threads (by default one per CPU), or by the given executor."""
+
+    if len(left) != len(right):
+        raise ValueError("left and right must be of equal length")
+
+    size = len(left)
+    first, second = PeriodArray.empty(size), PeriodArray.empty(size)
+
+    def chunk_task(chunk: slice) -> None:
+        _as_array(left[chunk]).intersect(
+            _as_array(right[chunk]), out=(first[chunk], second[chunk])
+        )
+
+    _run_threads(chunk_task, size, threads, chunk_size, executor)
+    return first, second
+
+
+def _as_array(periods: Periods) -> PeriodArray:
+    if isinstance(periods, PeriodArray):
+        return periods
+    return PeriodArray.from_periods(periods)
+
+
+def _as_ns(times: Union[np.ndarray, Iterable]) -> np.ndarray:
+    if isinstance(times, np.ndarray):
+        return times.astype(np.int64, copy=False)
+    return times_to_ns(times)
+
+
+def _period_columns(prefix: str, periods: PeriodArray) -> dict[str, np.ndarray]:
+    return {
+        f"{prefix}_start_ns": periods.start_ns,
+        f"{prefix}_end_ns": periods.end_ns,
+        f"{prefix}_kind": periods.kind,
+    }
+
+
+def _run(
+    task,
+    shared: _SharedColumns,
+    size: int,
+    workers: Optional[int],
+    chunk_size: int,
+    executor: Optional[Executor],
+) -> None:
+    _check_sizes(workers, chunk_size, "workers")
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(
+                task, shared.name, shared.layout, start, min(start + chunk_size, size)
+            )
+            for start in range(0, size, chunk_size)
+        ]
+        # wait for every chunk before the block can be released
+        _wait(futures)
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+
+def _run_threads(
+    task,
+    size: int,
+    threads: Optional[int],
+    chunk_size: int,
+    executor: Optional[Executor],
+) -> None:
+    _check_sizes(threads, chunk_size, "threads")
+
+    chunks = [
+        slice(start, min(start + chunk_size, size))
+        for start in range(0, size, chunk_size)
+    ]
+    own_executor = executor is None
+    if own_executor and (len(chunks) < 2 or threads == 1):
+        # a pool would only add the cost of starting its threads
+        for chunk in chunks:
+            task(chunk)
+        return
+
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=threads or os.cpu_count())
+    try:
+        # every chunk writes to its own rows of the outputs, which are only returned
+        # once all of them are done
+        _wait([executor.submit(task, chunk) for chunk in chunks])
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+
+def _check_sizes(workers: Optional[int], chunk_size: int, name: str) -> None:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if workers is not None and workers < 1:
+        raise ValueError(f"{name} must be positive")
+
+
+def _wait(futures: list[Future]) -> None:
+    """Wait for every future, then re-raise the first failure in chunk order"""
+
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+class _SharedColumns:
+    """Numpy columns copied into one shared memory block, owned by the creating process
+    and unlinked when the context exits"""
+
+    def __init__(self, columns: dict[str, np.ndarray]) -> None:
+        self.layout: Layout = {}
+        offset = 0
+        for name, column in columns.items():
+            offset = -(-offset // 8) * 8
+            self.layout[name] = (offset, column.dtype.str, len(column))
+            offset += column.nbytes
+
+        self._memory = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self.name = self._memory.name
+        for name, column in columns.items():
+            self.array(name)[:] = column
+
+    def array(self, name: str) -> np.ndarray:
+        return _view(self._memory, self.layout, name)
+
+    def periods(self, prefix: str) -> PeriodArray:
+        return _periods(self._memory, self.layout, prefix)
+
+    def __enter__(self) -> _SharedColumns:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._memory.close()
+        self._memory.unlink()
+
+
+def _view(memory: shared_memory.SharedMemory, layout: Layout, name: str) -> np.ndarray:
+    offset, dtype, length = layout[name]
+    return np.ndarray(length, dtype=dtype, buffer=memory.buf, offset=offset)
+
+
+def _periods(
+    memory: shared_memory.SharedMemory, layout: Layout, prefix: str
+) -> PeriodArray:
+    return PeriodArray(
+        _view(memory, layout, f"{prefix}_start_ns"),
+        _view(memory, layout, f"{prefix}_end_ns"),
+        _view(memory, layout, f"{prefix}_kind"),
+    )
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block created by the parent process, which remains its only owner"""
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # before 3.13 attaching registers the block with the resource tracker again, which
+    # is harmless as pool workers share the tracker of the parent process
+    return shared_memory.SharedMemory(name=name)
+
+
+def _contains_chunk(name: str, layout: Layout, start: int, stop: int) -> None:
+    memory = _attach(name)
+    _contains(memory, layout, slice(start, stop))
+    # on failure the block is closed once the traceback releases its views
+    memory.close()
+
+
+def _intersect_chunk(name: str, layout: Layout, start: int, stop: int) -> None:
+    memory = _attach(name)
+    _intersect(memory, layout, slice(start, stop))
+    memory.close()
+
+
+def _contains(memory: shared_memory.SharedMemory, layout: Layout, chunk: slice) -> None:
+    periods = _periods(memory, layout, "periods")[chunk]
+    periods.contains_elementwise(
+        _view(memory, layout, "times_ns")[chunk],
+        out=_view(memory, layout, "out")[chunk],
+    )
+
+
+def _intersect(
+    memory: shared_memory.SharedMemory, layout: Layout, chunk: slice
+) -> None:
+    left = _periods(memory, layout, "left")[chunk]
+    right = _periods(memory, layout, "right")[chunk]
+    left.intersect(
+        right,
+        out=(
+            _periods(memory, layout, "first")[chunk],
+            _periods(memory, layout, "second")[chunk],
+        ),
+    )
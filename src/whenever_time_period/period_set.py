@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from heapq import merge
+from typing import ClassVar, Iterable, Iterator
+
+from whenever import Time, TimeDelta
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import NS_PER_DAY, time_to_ns
+from whenever_time_period.time_period import (
+    InfiniteTimePeriod,
+    LinearTimePeriod,
+    ModularTimePeriod,
+    from_ns,
+)
+
+Interval = tuple[int, int]
+
+
+def split_at_midnight(period: AbstractTimePeriod) -> list[Interval]:
+    """Return the clock intervals [start_ns, end_ns) covered by a TimePeriod, wherein
+    0 <= start_ns < end_ns <= NS_PER_DAY. ModularTimePeriods are split at midnight."""
+
+    if isinstance(period, LinearTimePeriod):
+        return [(period.start_ns, period.end_ns)]
+    if isinstance(period, ModularTimePeriod):
+        intervals = [(period.start_ns, NS_PER_DAY)]
+        if period.end_ns > 0:
+            intervals.insert(0, (0, period.end_ns))
+        return intervals
+    if isinstance(period, InfiniteTimePeriod):
+        return [(0, NS_PER_DAY)]
+    raise TypeError(f"cannot split {period!r} into clock intervals")
+
+
+def coalesce(intervals: Iterable[Interval]) -> tuple[list[int], list[int]]:
+    """Merge intervals sorted by start into disjoint, non-adjacent intervals, returned as
+    lists of starts and ends"""
+
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in intervals:
+        if ends and start <= ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def coverage(periods: Iterable[AbstractTimePeriod]) -> TimeDelta:
+    """The total clock time covered by the union of the periods, counting time covered by
+    several periods once. Runs in O(n log n).
+
+    Example:
+    >> coverage([LinearTimePeriod(Time(9), Time(17)), ModularTimePeriod(Time(16), Time(1))])
+    TimeDelta("PT16h")
+    """
+
+    return TimePeriodSet(periods).duration
+
+
+class TimePeriodSet:
+    """An immutable union of TimePeriods, normalized to a sorted sequence of disjoint,
+    non-adjacent clock intervals [start_ns, end_ns) in nanoseconds since midnight.
+    ModularTimePeriods are split at midnight internally, and rejoined when the set is
+    iterated.
+
+    Set algebra (|, &, -, ^, ~) runs in a single merge pass over both operands, and
+    membership of a Time is a binary search.
+
+    Example:
+    >> business_hours = TimePeriodSet([LinearTimePeriod(Time(9), Time(17))])
+    >> business_hours - TimePeriodSet([LinearTimePeriod(Time(12), Time(13))])
+    TimePeriodSet[LinearTimePeriod[09:00:00, 12:00:00), LinearTimePeriod[13:00:00, 17:00:00)]
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    # the length of the cycle of the intervals, how a period splits into them and how
+    # an interval joins back into a period, overridden by WeeklyTimePeriodSet
+    _cycle_ns: ClassVar[int] = NS_PER_DAY
+    _split = staticmethod(split_at_midnight)
+    _period = staticmethod(from_ns)
+
+    def __init__(self, periods: Iterable[AbstractTimePeriod] = ()) -> None:
+        split = self._split
+        intervals = sorted(interval for period in periods for interval in split(period))
+        self._starts, self._ends = coalesce(intervals)
+
+    @classmethod
+    def _from_normalized(cls, starts: list[int], ends: list[int]) -> TimePeriodSet:
+        period_set = object.__new__(cls)
+        period_set._starts = starts
+        period_set._ends = ends
+        return period_set
+
+    @classmethod
+    def full(cls) -> TimePeriodSet:
+        return cls._from_normalized([0], [cls._cycle_ns])
+
+    @property
+    def intervals(self) -> list[Interval]:
+        """The normalized clock intervals [start_ns, end_ns) of the set"""
+
+        return list(zip(self._starts, self._ends))
+
+    @property
+    def duration(self) -> TimeDelta:
+        """The total clock time covered by the set"""
+
+        return TimeDelta(
+            nanoseconds=sum(end - start for start, end in zip(self._starts, self._ends))
+        )
+
+    def __contains__(self, other: Time) -> bool:
+        if not isinstance(other, Time):
+            return False
+        ns = time_to_ns(other)
+        i = bisect_right(self._starts, ns) - 1
+        return i >= 0 and ns < self._ends[i]
+
+    def __iter__(self) -> Iterator[AbstractTimePeriod]:
+        """Iterate the TimePeriods of the set in order of start time, rejoining intervals
+        which touch at midnight into a single ModularTimePeriod"""
+
+        starts, ends, cycle_ns, period = (
+            self._starts,
+            self._ends,
+            self._cycle_ns,
+            self._period,
+        )
+        if not starts:
+            return
+        if starts == [0] and ends == [cycle_ns]:
+            yield period(0, 0)
+            return
+
+        wraps = len(starts) > 1 and starts[0] == 0 and ends[-1] == cycle_ns
+        last = len(starts) - 1 if wraps else len(starts)
+        for start, end in zip(starts[int(wraps) : last], ends[int(wraps) : last]):
+            yield period(start, end % cycle_ns)
+        if wraps:
+            yield period(starts[-1], ends[0])
+
+    def __len__(self) -> int:
+        """The number of TimePeriods yielded when iterating the set"""
+
+        wraps = len(self._starts) > 1 and self._starts[0] == 0
+        return len(self._starts) - int(wraps and self._ends[-1] == self._cycle_ns)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self) -> int:
+        return hash((tuple(self._starts), tuple(self._ends)))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{', '.join(map(repr, self))}]"
+
+    def _coerce(self, other: object) -> TimePeriodSet | None:
+        if type(other) is type(self):
+            return other
+        if isinstance(other, AbstractTimePeriod):
+            return type(self)([other])
+        return None
+
+    def __or__(self, other: TimePeriodSet | AbstractTimePeriod) -> TimePeriodSet:
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._from_normalized(*coalesce(merge(self.intervals, other.intervals)))
+
+    def __and__(self, other: TimePeriodSet | AbstractTimePeriod) -> TimePeriodSet:
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+
+        a_starts, a_ends, b_starts, b_ends = (
+            self._starts,
+            self._ends,
+            other._starts,
+            other._ends,
+        )
+        starts: list[int] = []
+        ends: list[int] = []
+        i = j = 0
+        while i < len(a_starts) and j < len(b_starts):
+            start = max(a_starts[i], b_starts[j])
+            end = min(a_ends[i], b_ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            if a_ends[i] < b_ends[j]:
+                i += 1
+            else:
+                j += 1
+        return self._from_normalized(starts, ends)
+
+    def __invert__(self) -> TimePeriodSet:
+        starts: list[int] = []
+        ends: list[int] = []
+        previous_end = 0
+        for start, end in zip(self._starts, self._ends):
+            if previous_end < start:
+                starts.append(previous_end)
+                ends.append(start)
+            previous_end = end
+        if previous_end < self._cycle_ns:
+            starts.append(previous_end)
+            ends.append(self._cycle_ns)
+        return self._from_normalized(starts, ends)
+
+    def __sub__(self, other: TimePeriodSet | AbstractTimePeriod) -> TimePeriodSet:
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self & ~other
+
+    def __xor__(self, other: TimePeriodSet | AbstractTimePeriod) -> TimePeriodSet:
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return (self | other) - (self & other)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __rsub__(self, other: AbstractTimePeriod) -> TimePeriodSet:
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return other - self
+
+    def union(self, *others: TimePeriodSet | AbstractTimePeriod) -> TimePeriodSet:
+        """The union of the set with any number of others, in a single merge pass"""
+
+        others = [self._coerce(other) for other in others]
+        if any(other is None for other in others):
+            raise TypeError("union requires TimePeriodSets or TimePeriods")
+        return self._from_normalized(
+            *coalesce(merge(self.intervals, *(other.intervals for other in others)))
+        )
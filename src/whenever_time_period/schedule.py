@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Generic, Hashable, Iterable, Iterator, Optional, TypeVar
+
+import numpy as np
+from whenever import Time
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import NS_PER_DAY, time_to_ns
+from whenever_time_period.period_set import split_at_midnight
+from whenever_time_period.time_period import from_ns
+
+L = TypeVar("L", bound=Hashable)
+
+# label ID of the clock times covered by no entry
+UNLABELLED = -1
+
+
+class Schedule(Generic[L]):
+    """A prioritized list of (label, period) entries compiled into a piecewise-constant
+    function of the clock time: sorted boundaries in nanoseconds since midnight, and the
+    label ID of each segment between consecutive boundaries.
+
+    Where entries overlap, the one listed first wins. Label IDs index labels, in order
+    of first appearance in the entries, and times covered by no entry are UNLABELLED.
+
+    A Schedule is immutable, and its lookup arrays are read-only, so one instance can
+    be shared between threads.
+
+    Example:
+    >> tariffs = Schedule([("peak", LinearTimePeriod(Time(17), Time(21))),
+    ..                     ("off-peak", InfiniteTimePeriod(Time(0), Time(0)))])
+    >> tariffs.classify(times_to_ns([Time(18), Time(3)]))
+    array([0, 1], dtype=int32)
+    >> tariffs.labels
+    ('peak', 'off-peak')
+    """
+
+    __slots__ = ("labels", "_starts", "_ids", "_starts_array", "_ids_array")
+
+    def __init__(self, entries: Iterable[tuple[L, AbstractTimePeriod]]) -> None:
+        entries = [(label, split_at_midnight(period)) for label, period in entries]
+        label_ids: dict[L, int] = {}
+        for label, _ in entries:
+            label_ids.setdefault(label, len(label_ids))
+
+        points = sorted(
+            {0}
+            | {
+                bound
+                for _, intervals in entries
+                for interval in intervals
+                for bound in interval
+                if bound < NS_PER_DAY
+            }
+        )
+
+        # paint the segments from the lowest priority up, so that earlier entries win
+        ids = [UNLABELLED] * len(points)
+        for label, intervals in reversed(entries):
+            label_id = label_ids[label]
+            for start, end in intervals:
+                lo, hi = bisect_left(points, start), bisect_left(points, end)
+                ids[lo:hi] = [label_id] * (hi - lo)
+
+        # merge neighbouring segments of the same label
+        starts, merged = [], []
+        for point, label_id in zip(points, ids):
+            if not merged or merged[-1] != label_id:
+                starts.append(point)
+                merged.append(label_id)
+
+        self.labels: tuple[L, ...] = tuple(label_ids)
+        self._starts = tuple(starts)
+        self._ids = tuple(merged)
+        self._starts_array = np.array(starts, dtype=np.int64)
+        self._ids_array = np.array(merged, dtype=np.int32)
+        self._starts_array.flags.writeable = False
+        self._ids_array.flags.writeable = False
+
+    @property
+    def boundaries(self) -> np.ndarray:
+        """The read-only, sorted starts of the segments in nanoseconds since midnight,
+        beginning with 0"""
+
+        return self._starts_array
+
+    @property
+    def label_ids(self) -> np.ndarray:
+        """The read-only label ID of each segment"""
+
+        return self._ids_array
+
+    def __len__(self) -> int:
+        """The number of segments"""
+
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({len(self)} segments, labels={self.labels!r})"
+        )
+
+    def segments(self) -> Iterator[tuple[Optional[L], AbstractTimePeriod]]:
+        """Iterate the (label, period) segments of the schedule in order of start, with
+        a label of None for UNLABELLED segments"""
+
+        ends = self._starts[1:] + (NS_PER_DAY,)
+        for start, end, label_id in zip(self._starts, ends, self._ids):
+            label = None if label_id == UNLABELLED else self.labels[label_id]
+            yield label, from_ns(start, end % NS_PER_DAY)
+
+    def label_of(self, time: Time) -> Optional[L]:
+        """The label of the given Time, or None if no entry covers it"""
+
+        label_id = self._ids[bisect_right(self._starts, time_to_ns(time)) - 1]
+        return None if label_id == UNLABELLED else self.labels[label_id]
+
+    def classify(self, values: np.ndarray) -> np.ndarray:
+        """Return the int32 label IDs of an array of nanoseconds since midnight, or of
+        datetime64 values, whose clock time is classified as is. NaT values are
+        UNLABELLED.
+
+        Each value is located with a single binary search over the boundaries, so the
+        cost is O(n log m) for n values and m segments."""
+
+        values = np.asarray(values)
+        nat = None
+        if np.issubdtype(values.dtype, np.datetime64):
+            nat = np.isnat(values)
+            values = values.astype("datetime64[ns]").view(np.int64) % NS_PER_DAY
+        else:
+            values = values.astype(np.int64, copy=False)
+            if values.size and (values.min() < 0 or values.max() >= NS_PER_DAY):
+                raise ValueError("values must be nanoseconds of the day")
+
+        label_ids = self._ids_array[
+            np.searchsorted(self._starts_array, values, side="right") - 1
+        ]
+        if nat is not None and nat.any():
+            label_ids[nat] = UNLABELLED
+        return label_ids
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Sequence
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.period_set import split_at_midnight
+from whenever_time_period.time_period import intersection
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from whenever_time_period.array import PeriodArray
+
+LEFT, RIGHT = 0, 1
+
+
+def overlapping_pairs(
+    left: Sequence[AbstractTimePeriod], right: Sequence[AbstractTimePeriod]
+) -> list[tuple[int, int]]:
+    """Return the sorted index pairs (i, j) for which left[i] and right[j] share at least
+    one clock time, found by sweeping the start and end points of both collections once.
+
+    Runs in O((n + m) log(n + m) + k) for k overlapping pairs."""
+
+    # (start_ns, end_ns, side, index), with ModularTimePeriods split at midnight
+    intervals = sorted(
+        (start, end, side, index)
+        for side, periods in ((LEFT, left), (RIGHT, right))
+        for index, period in enumerate(periods)
+        for start, end in split_at_midnight(period)
+    )
+
+    # the intervals of each side which are still open, and a heap of their ends
+    active: tuple[dict[int, int], dict[int, int]] = ({}, {})
+    ends: list[tuple[int, int, int]] = []
+    pairs: set[tuple[int, int]] = set()
+    for start, end, side, index in intervals:
+        while ends and ends[0][0] <= start:
+            _, closed_side, closed_index = heapq.heappop(ends)
+            active[closed_side][closed_index] -= 1
+            if not active[closed_side][closed_index]:
+                del active[closed_side][closed_index]
+
+        if side == LEFT:
+            pairs.update((index, other) for other in active[RIGHT])
+        else:
+            pairs.update((other, index) for other in active[LEFT])
+
+        active[side][index] = active[side].get(index, 0) + 1
+        heapq.heappush(ends, (end, side, index))
+
+    return sorted(pairs)
+
+
+def intersect_all(
+    left: Sequence[AbstractTimePeriod], right: Sequence[AbstractTimePeriod]
+) -> Iterator[tuple[int, int, AbstractTimePeriod]]:
+    """Yield (i, j, period) for every piece of every non-empty left[i] & right[j], in
+    order of (i, j).
+
+    Each piece follows the semantics of __and__: a LinearTimePeriod & ModularTimePeriod
+    double overlap yields two triples with the same (i, j), in order of start time.
+
+    Example:
+    >> list(intersect_all([LinearTimePeriod(Time(3), Time(10))],
+    ..                    [ModularTimePeriod(Time(7), Time(5))]))
+    [(0, 0, LinearTimePeriod[03:00:00, 05:00:00)),
+     (0, 0, LinearTimePeriod[07:00:00, 10:00:00))]
+    """
+
+    for i, j in overlapping_pairs(left, right):
+        pieces = intersection(left[i], right[j])
+        if pieces is None:
+            continue
+        if isinstance(pieces, list):
+            for piece in pieces:
+                yield i, j, piece
+        else:
+            yield i, j, pieces
+
+
+class IntersectionColumns(NamedTuple):
+    """The pieces of the intersections of two collections of periods, as columns"""
+
+    left_index: np.ndarray
+    right_index: np.ndarray
+    periods: PeriodArray
+
+
+def intersect_all_columns(
+    left: Sequence[AbstractTimePeriod], right: Sequence[AbstractTimePeriod]
+) -> IntersectionColumns:
+    """The same triples as intersect_all, as int64 index arrays and a PeriodArray of the
+    pieces. The intersections are evaluated vectorized, which requires numpy."""
+
+    import numpy as np
+
+    from whenever_time_period.array import EMPTY, PeriodArray
+
+    pairs = np.array(overlapping_pairs(left, right), dtype=np.int64).reshape(-1, 2)
+    left_periods = PeriodArray.from_periods(left)[pairs[:, 0]]
+    right_periods = PeriodArray.from_periods(right)[pairs[:, 1]]
+    first, second = left_periods & right_periods
+
+    # interleave the second pieces after the first, then drop the absent ones
+    start_ns = np.stack([first.start_ns, second.start_ns], axis=1).ravel()
+    end_ns = np.stack([first.end_ns, second.end_ns], axis=1).ravel()
+    kind = np.stack([first.kind, second.kind], axis=1).ravel()
+    present = kind != EMPTY
+    index = np.repeat(pairs, 2, axis=0)[present]
+
+    return IntersectionColumns(
+        index[:, 0],
+        index[:, 1],
+        PeriodArray(start_ns[present], end_ns[present], kind[present]),
+    )
@@ -0,0 +1,114 @@
+"""Parsing and formatting of TimePeriods as text, e.g. "22:00-06:00" or
+"09:30:00.5-17:00".
+
+A period is written as its start and end clock times separated by "-", each time in
+the ISO 8601 format parsed by whenever.Time.parse_iso, e.g. HH:MM, HH:MM:SS or
+HH:MM:SS.fffffffff. Whitespace around the times is ignored. The subclass is chosen
+from the ordering of the times, as by from_times, so "22:00-06:00" is a
+ModularTimePeriod and "03:00-03:00" an InfiniteTimePeriod.
+
+Example:
+>> errors = []
+>> list(parse_periods(["22:00-06:00", "9am-5pm"], errors))
+[ModularTimePeriod[22:00:00, 06:00:00), None]
+>> errors
+[MalformedRow(row=1, text='9am-5pm', reason="invalid ISO 8601 string: '9am'")]
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from whenever import Time
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.nanoseconds import time_to_ns
+from whenever_time_period.time_period import PERIOD_TYPES, kind_of
+
+EXPECTED = "expected two ISO 8601 clock times separated by '-'"
+
+parse_iso = Time.parse_iso
+
+# the number of distinct rows remembered by a call of parse_periods
+TEXT_CACHE_SIZE = 65536
+
+
+class MalformedRow(NamedTuple):
+    """A row which could not be parsed as a TimePeriod, and why"""
+
+    row: int
+    text: object
+    reason: str
+
+
+def _parse(text: str) -> AbstractTimePeriod:
+    # ISO 8601 clock times never contain "-", and whenever parses them natively
+    start, separator, end = text.partition("-")
+    if not separator:
+        raise ValueError(EXPECTED)
+    try:
+        start_time, end_time = parse_iso(start), parse_iso(end)
+    except ValueError:
+        start_time, end_time = parse_iso(start.strip()), parse_iso(end.strip())
+    start_ns, end_ns = time_to_ns(start_time), time_to_ns(end_time)
+    subcls = PERIOD_TYPES[kind_of(start_ns, end_ns)]
+    return subcls._from_parts(start_time, end_time, start_ns, end_ns)
+
+
+def parse_period(text: str) -> AbstractTimePeriod:
+    """Parse a single TimePeriod. Raises a ValueError if the text is malformed."""
+
+    try:
+        return _parse(text)
+    except ValueError as error:
+        raise ValueError(f"{text!r}: {error}") from None
+
+
+def parse_periods(
+    rows: Iterable[str], errors: Optional[list[MalformedRow]] = None
+) -> Iterator[Optional[AbstractTimePeriod]]:
+    """Lazily parse an iterable of strings, such as the lines of a file or a column of a
+    table, yielding one TimePeriod per row.
+
+    Malformed rows, including rows which are not strings, never raise: None is yielded
+    in their place, so the output stays aligned with the rows, and a MalformedRow is
+    appended to errors if it is given.
+
+    Periods are immutable, so a row repeating the text of a recent row yields the
+    same TimePeriod object without parsing it again. The rows remembered are forgotten
+    whenever TEXT_CACHE_SIZE are, so the cache follows a stream whose rows change."""
+
+    parsed: dict[str, AbstractTimePeriod] = {}
+    remembered, parse = parsed.get, _parse
+    for row, text in enumerate(rows):
+        period = remembered(text) if type(text) is str else None
+        if period is None:
+            try:
+                if not isinstance(text, str):
+                    raise ValueError("not a string")
+                period = parse(text)
+            except ValueError as error:
+                if errors is not None:
+                    errors.append(MalformedRow(row, text, str(error)))
+            else:
+                # clearing is cheaper per row than LRU bookkeeping, and unlike keeping
+                # the first rows forever it adapts to the rows seen lately
+                if len(parsed) >= TEXT_CACHE_SIZE:
+                    parsed.clear()
+                parsed[text] = period
+        yield period
+
+
+def format_period(period: AbstractTimePeriod) -> str:
+    """Format a TimePeriod as text which parse_period parses back to an equal period"""
+
+    return f"{period.start_time}-{period.end_time}"
+
+
+def format_periods(periods: Iterable[AbstractTimePeriod]) -> Iterator[str]:
+    """Lazily format an iterable of TimePeriods"""
+
+    # whenever formats Times natively, faster than a cache of the texts could be
+    # looked up and filled
+    for period in periods:
+        yield f"{period.start_time}-{period.end_time}"
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from enum import IntEnum
+from typing import ClassVar, Optional
 
-from plum import dispatch
-from whenever import Time
+from whenever import Time, TimeDelta
 
-from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.abstract import AbstractTimePeriod, greater_than, less_than
+from whenever_time_period.dispatch import KernelTable
+from whenever_time_period.nanoseconds import NS_PER_DAY, ns_to_time, time_to_ns
 
+intersection = KernelTable("intersection")
 
-@dataclass
+
+class PeriodKind(IntEnum):
+    """Integer codes of the built-in TimePeriod subclasses, used by the columnar and
+    binary representations of periods"""
+
+    LINEAR = 0
+    MODULAR = 1
+    INFINITE = 2
+
+
+@dataclass(frozen=True, slots=True)
 class LinearTimePeriod(AbstractTimePeriod):
     """A LinearTimePeriod is a right-open clock interval of whenever.Time objects,
     [start_time, end_time) wherein start_time < end_time.
@@ -18,56 +31,29 @@ class LinearTimePeriod(AbstractTimePeriod):
     >> LinearTimePeriod(start_time=Time(5), end_time=Time(10))
     """
 
+    kind: ClassVar[PeriodKind] = PeriodKind.LINEAR
+
     def __post_init__(self):
-        if not self.start_time < self.end_time:
+        AbstractTimePeriod.__post_init__(self)
+        if not self.start_ns < self.end_ns:
             raise ValueError
 
+    @property
+    def duration(self) -> TimeDelta:
+        return TimeDelta(nanoseconds=self.end_ns - self.start_ns)
+
     def __contains__(self, other: Time) -> bool:
         return self.start_time <= other < self.end_time
 
-    @dispatch
-    def __and__(self, other: LinearTimePeriod) -> Optional[LinearTimePeriod]:
-        start_inter = max(self.start_time, other.start_time)
-        end_inter = min(self.end_time, other.end_time)
-
-        if start_inter < end_inter:
-            return LinearTimePeriod(start_inter, end_inter)
-
-        return None
-
-    @dispatch
-    def __and__(  # noqa F811
-        self, other: ModularTimePeriod
+    def __and__(
+        self, other: AbstractTimePeriod
     ) -> list[LinearTimePeriod] | LinearTimePeriod | None:
-        intr = []
-
-        # region 1
-        if max(self.start_time, other.start_time) < self.end_time:
-            intr.append(
-                LinearTimePeriod(max(self.start_time, other.start_time), self.end_time)
-            )
-
-        # region 2
-        if self.start_time < min(self.end_time, other.end_time):
-            intr.append(
-                LinearTimePeriod(self.start_time, min(self.end_time, other.end_time))
-            )
+        return intersection(self, other)
 
-        if len(intr) > 1:
-            return sorted(intr)
-        elif len(intr) > 0:
-            return intr[0]
-        return None
+    __repr__ = AbstractTimePeriod.__repr__
 
-    @dispatch
-    def __and__(self, other: InfiniteTimePeriod) -> LinearTimePeriod:  # noqa F811
-        return self
 
-    def __repr__(self) -> str:
-        return super().__repr__()
-
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModularTimePeriod(AbstractTimePeriod):
     """A ModularTimePeriod is a right-open clock interval of whenever.Time objects,
     [start_time, end_time) wherein end_time < start_time. Used for intervals which wrap
@@ -77,45 +63,45 @@ class ModularTimePeriod(AbstractTimePeriod):
     >> ModularTimePeriod(start_time=Time(10), end_time=Time(5))
     """
 
+    kind: ClassVar[PeriodKind] = PeriodKind.MODULAR
+
     def __post_init__(self):
-        if not self.end_time < self.start_time:
+        AbstractTimePeriod.__post_init__(self)
+        if not self.end_ns < self.start_ns:
             raise ValueError
 
+    @property
+    def duration(self) -> TimeDelta:
+        return TimeDelta(nanoseconds=NS_PER_DAY - self.start_ns + self.end_ns)
+
     def __contains__(self, other: Time) -> bool:
         return self.start_time <= other or other < self.end_time
 
-    @dispatch
     def __and__(
-        self, other: LinearTimePeriod
-    ) -> list[LinearTimePeriod] | LinearTimePeriod | None:
-        return LinearTimePeriod.__and__(other, self)
-
-    @dispatch
-    def __and__(self, other: ModularTimePeriod) -> Optional[ModularTimePeriod]:  # noqa F811
-        start_inter = max(self.start_time, other.start_time)
-        end_inter = min(self.end_time, other.end_time)
-        if start_inter >= end_inter:
-            return ModularTimePeriod(start_inter, end_inter)
-        return None
+        self, other: AbstractTimePeriod
+    ) -> list[LinearTimePeriod] | AbstractTimePeriod | None:
+        return intersection(self, other)
 
-    @dispatch
-    def __and__(self, other: InfiniteTimePeriod) -> ModularTimePeriod:  # noqa F811
-        return self
+    __repr__ = AbstractTimePeriod.__repr__
 
-    def __repr__(self) -> str:
-        return super().__repr__()
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InfiniteTimePeriod(AbstractTimePeriod):
     """An InfiniteTimePeriod is a right-open clock interval of whenever.Time objects,
     [start_time, end_time) wherein start_time == end_time. Used to represent intervals
     which span all possible clock times to nanosecond precision."""
 
+    kind: ClassVar[PeriodKind] = PeriodKind.INFINITE
+
     def __post_init__(self):
-        if not self.start_time == self.end_time:
+        AbstractTimePeriod.__post_init__(self)
+        if not self.start_ns == self.end_ns:
             raise ValueError
 
+    @property
+    def duration(self) -> TimeDelta:
+        return TimeDelta(nanoseconds=NS_PER_DAY)
+
     def __contains__(self, other: Time) -> bool:
         if not isinstance(other, Time):
             return False
@@ -126,17 +112,148 @@ class InfiniteTimePeriod(AbstractTimePeriod):
             return True
         return False
 
-    @dispatch
-    def __and__(self, other: LinearTimePeriod) -> LinearTimePeriod:
-        return other
+    def __hash__(self) -> int:
+        return hash(InfiniteTimePeriod)
+
+    def __and__(self, other: AbstractTimePeriod) -> AbstractTimePeriod:
+        return intersection(self, other)
+
+    __repr__ = AbstractTimePeriod.__repr__
+
+
+# the built-in subclasses, indexed by PeriodKind
+PERIOD_TYPES = (LinearTimePeriod, ModularTimePeriod, InfiniteTimePeriod)
+
+
+def from_times(start_time: Time, end_time: Time) -> AbstractTimePeriod:
+    """Construct the TimePeriod [start_time, end_time), choosing the LinearTimePeriod,
+    ModularTimePeriod or InfiniteTimePeriod subclass from the ordering of the times.
+
+    Example:
+    >> from_times(Time(22), Time(6))
+    ModularTimePeriod[22:00:00, 06:00:00)
+    """
+
+    start_ns, end_ns = time_to_ns(start_time), time_to_ns(end_time)
+    subcls = PERIOD_TYPES[kind_of(start_ns, end_ns)]
+    return subcls._from_parts(start_time, end_time, start_ns, end_ns)
+
+
+def from_ns(start_ns: int, end_ns: int) -> AbstractTimePeriod:
+    """Construct the TimePeriod between the given nanoseconds since midnight, choosing
+    the subclass from their ordering as from_times does."""
+
+    subcls = PERIOD_TYPES[kind_of(start_ns, end_ns)]
+    return subcls._from_parts(
+        ns_to_time(start_ns), ns_to_time(end_ns), start_ns, end_ns
+    )
+
+
+def kind_of(start_ns: int, end_ns: int) -> PeriodKind:
+    """Return the kind of the TimePeriod between the given nanoseconds since midnight"""
+
+    if start_ns < end_ns:
+        return PeriodKind.LINEAR
+    if end_ns < start_ns:
+        return PeriodKind.MODULAR
+    return PeriodKind.INFINITE
+
+
+def _linear(start: AbstractTimePeriod, end: AbstractTimePeriod) -> LinearTimePeriod:
+    """The LinearTimePeriod from the start of one period to the end of another"""
+
+    return LinearTimePeriod._from_parts(
+        start.start_time, end.end_time, start.start_ns, end.end_ns
+    )
+
+
+@intersection.register
+def _(period: LinearTimePeriod, other: LinearTimePeriod) -> Optional[LinearTimePeriod]:
+    start_inter = period if period.start_ns >= other.start_ns else other
+    end_inter = period if period.end_ns <= other.end_ns else other
+
+    if start_inter.start_ns < end_inter.end_ns:
+        return _linear(start_inter, end_inter)
+
+    return None
+
+
+@intersection.register
+def _linear_and_modular(
+    period: LinearTimePeriod, other: ModularTimePeriod
+) -> list[LinearTimePeriod] | LinearTimePeriod | None:
+    # region 1
+    region_1 = None
+    start_inter = period if period.start_ns >= other.start_ns else other
+    if start_inter.start_ns < period.end_ns:
+        region_1 = _linear(start_inter, period)
+
+    # region 2
+    region_2 = None
+    end_inter = period if period.end_ns <= other.end_ns else other
+    if period.start_ns < end_inter.end_ns:
+        region_2 = _linear(period, end_inter)
+
+    if region_1 is None:
+        return region_2
+    if region_2 is None:
+        return region_1
+
+    # region 2 never starts after region 1, so the sorted order is known
+    # without comparing the periods
+    if region_2.start_ns < region_1.start_ns:
+        return [region_2, region_1]
+    return [region_1, region_2]
+
+
+@intersection.register
+def _(period: LinearTimePeriod, other: InfiniteTimePeriod) -> LinearTimePeriod:
+    return period
+
+
+@intersection.register
+def _(
+    period: ModularTimePeriod, other: LinearTimePeriod
+) -> list[LinearTimePeriod] | LinearTimePeriod | None:
+    return _linear_and_modular(other, period)
+
+
+@intersection.register
+def _(
+    period: ModularTimePeriod, other: ModularTimePeriod
+) -> Optional[ModularTimePeriod]:
+    start_inter = period if period.start_ns >= other.start_ns else other
+    end_inter = period if period.end_ns <= other.end_ns else other
+    if start_inter.start_ns >= end_inter.end_ns:
+        return ModularTimePeriod._from_parts(
+            start_inter.start_time,
+            end_inter.end_time,
+            start_inter.start_ns,
+            end_inter.end_ns,
+        )
+    return None
+
+
+@intersection.register
+def _(period: ModularTimePeriod, other: InfiniteTimePeriod) -> ModularTimePeriod:
+    return period
+
+
+@intersection.register
+def _(period: InfiniteTimePeriod, other: LinearTimePeriod) -> LinearTimePeriod:
+    return other
+
+
+@intersection.register
+def _(period: InfiniteTimePeriod, other: ModularTimePeriod) -> ModularTimePeriod:
+    return other
+
 
-    @dispatch
-    def __and__(self, other: ModularTimePeriod) -> ModularTimePeriod:  # noqa F811
-        return other
+@intersection.register
+def _(period: InfiniteTimePeriod, other: InfiniteTimePeriod) -> InfiniteTimePeriod:
+    return other
 
-    @dispatch
-    def __and__(self, other: InfiniteTimePeriod) -> InfiniteTimePeriod:  # noqa F811
-        return other
 
-    def __repr__(self) -> str:
-        return super().__repr__()
+# serve comparisons between the built-in classes from the kernel tables directly
+less_than.precompute(PERIOD_TYPES, (Time, *PERIOD_TYPES))
+greater_than.precompute(PERIOD_TYPES, (Time, *PERIOD_TYPES))
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+from itertools import count
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+from whenever import Instant, Time, ZonedDateTime
+
+from whenever_time_period.abstract import AbstractTimePeriod
+from whenever_time_period.time_period import InfiniteTimePeriod
+
+K = TypeVar("K", bound=Hashable)
+
+ENTER: Literal["enter"] = "enter"
+EXIT: Literal["exit"] = "exit"
+
+# (nanoseconds since the epoch, sequence number, key, generation, kind)
+Entry = tuple[int, int, Hashable, int, str]
+
+
+class PeriodEvent(NamedTuple):
+    """The clock entering or exiting the period of key at the instant at"""
+
+    kind: Literal["enter", "exit"]
+    key: Hashable
+    period: AbstractTimePeriod
+    at: ZonedDateTime
+
+
+class PeriodWatcher(Generic[K]):
+    """An asyncio watcher emitting an enter event when the clock of the timezone tz
+    reaches the start of a period, and an exit event when it reaches its end.
+
+    The next boundary of every period is kept in a single heap, and the watcher sleeps
+    until the earliest one, so there is no polling and no task per period. Adding a
+    period costs O(log n). Removing one is O(1), its pending boundary is discarded when
+    it reaches the top of the heap.
+
+    A period containing the current time when it is added is entered immediately. An
+    InfiniteTimePeriod is entered and never exited. Boundary clock times which fall in
+    a gap or a fold of the timezone are resolved as whenever does by default: forward by
+    the length of the gap, and to the earlier offset.
+
+    The current instant is read from clock, Instant.now by default, which may be
+    replaced e.g. by a clock pinned to a known date.
+
+    Example:
+    >> watcher = PeriodWatcher({"peak": LinearTimePeriod(Time(17), Time(21))}, "Europe/Amsterdam")
+    >> async for event in watcher:
+    ..     print(event.kind, event.key, event.at)
+    enter peak 2024-01-01T17:00:00+01:00[Europe/Amsterdam]
+    """
+
+    def __init__(
+        self,
+        periods: Mapping[K, AbstractTimePeriod]
+        | Iterable[tuple[K, AbstractTimePeriod]] = (),
+        tz: str = "UTC",
+        clock: Callable[[], Instant] = Instant.now,
+    ) -> None:
+        self.tz = tz
+        self._clock = clock
+        self._periods: dict[K, tuple[AbstractTimePeriod, int]] = {}
+        self._heap: list[Entry] = []
+        # an upper bound of the entries of removed periods still in the heap
+        self._stale = 0
+        self._sequence = count()
+        self._changed = asyncio.Event()
+
+        items = periods.items() if isinstance(periods, Mapping) else periods
+        for key, period in items:
+            self.add(key, period)
+
+    def __len__(self) -> int:
+        return len(self._periods)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._periods
+
+    def add(self, key: K, period: AbstractTimePeriod) -> None:
+        """Watch a period under key, replacing any period already watched under it"""
+
+        if key in self._periods:
+            self.remove(key)
+        generation = next(self._sequence)
+        self._periods[key] = (period, generation)
+
+        now = self._clock().to_tz(self.tz)
+        if now.time() in period:
+            self._push(now, key, generation, ENTER)
+        else:
+            self._push(self._next(period.start_time, now), key, generation, ENTER)
+
+    def remove(self, key: K) -> None:
+        """Stop watching the period of key. Raises a KeyError if there is none."""
+
+        del self._periods[key]
+        self._stale += 1
+        if self._stale > 64 and self._stale > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if not self._is_stale(entry)]
+            heapq.heapify(self._heap)
+            self._stale = 0
+        self._changed.set()
+
+    def _push(self, at: ZonedDateTime, key: K, generation: int, kind: str) -> None:
+        entry = (
+            at.to_instant().timestamp(unit="nanosecond"),
+            next(self._sequence),
+            key,
+            generation,
+            kind,
+        )
+        heapq.heappush(self._heap, entry)
+        self._changed.set()
+
+    def _is_stale(self, entry: Entry) -> bool:
+        _, _, key, generation, _ = entry
+        watched = self._periods.get(key)
+        return watched is None or watched[1] != generation
+
+    def _next(self, time: Time, after: ZonedDateTime) -> ZonedDateTime:
+        """The first instant after the given one at which the clock reads time"""
+
+        day = after.date()
+        at = day.at(time).assume_tz(self.tz, disambiguation="compatible")
+        if at <= after:
+            at = (
+                day.add(days=1).at(time).assume_tz(self.tz, disambiguation="compatible")
+            )
+        return at
+
+    def __aiter__(self) -> AsyncIterator[PeriodEvent]:
+        return self._events()
+
+    async def _events(self) -> AsyncIterator[PeriodEvent]:
+        """Yield events in order of their instant, for as long as the iteration is
+        consumed. When no period is watched, wait for one to be added."""
+
+        while True:
+            self._changed.clear()
+            heap = self._heap
+            while heap and self._is_stale(heap[0]):
+                heapq.heappop(heap)
+                self._stale = max(self._stale - 1, 0)
+            if not heap:
+                await self._changed.wait()
+                continue
+
+            delay_ns = heap[0][0] - self._clock().timestamp(unit="nanosecond")
+            if delay_ns > 0:
+                # an added period may have an earlier boundary, so wake up on changes
+                try:
+                    await asyncio.wait_for(self._changed.wait(), delay_ns / 1e9)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            timestamp, _, key, generation, kind = heapq.heappop(heap)
+            period = self._periods[key][0]
+            at = Instant.from_timestamp(timestamp, unit="nanosecond").to_tz(self.tz)
+            if kind == ENTER:
+                if not isinstance(period, InfiniteTimePeriod):
+                    self._push(self._next(period.end_time, at), key, generation, EXIT)
+            else:
+                self._push(self._next(period.start_time, at), key, generation, ENTER)
+            yield PeriodEvent(kind, key, period, at)
+
+    async def run(
+        self, callback: Callable[[PeriodEvent], Optional[Awaitable[None]]]
+    ) -> None:
+        """Call callback with every event until cancelled, awaiting it if it returns an
+        awaitable"""
+
+        async for event in self:
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result
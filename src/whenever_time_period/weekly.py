@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar, Union
+
+from whenever import (
+    OffsetDateTime,
+    PlainDateTime,
+    Time,
+    TimeDelta,
+    Weekday,
+    ZonedDateTime,
+)
+
+from whenever_time_period.abstract import AbstractTimePeriod, greater_than, less_than
+from whenever_time_period.nanoseconds import (
+    NS_PER_DAY,
+    NS_PER_HOUR,
+    NS_PER_MINUTE,
+    NS_PER_SECOND,
+    NS_PER_WEEK,
+    ns_to_week,
+    week_to_ns,
+)
+from whenever_time_period.period_set import (
+    Interval,
+    TimePeriodSet,
+    coalesce,
+    split_at_midnight,
+)
+from whenever_time_period.time_period import (
+    PERIOD_TYPES,
+    InfiniteTimePeriod,
+    PeriodKind,
+    intersection,
+    kind_of,
+)
+
+if TYPE_CHECKING:
+    from whenever_time_period.expression import PeriodExpression
+
+# the datetimes whose local day of the week and clock time place them in a week
+LocalDateTime = Union[PlainDateTime, ZonedDateTime, OffsetDateTime]
+LOCAL_DATETIME_TYPES = (PlainDateTime, ZonedDateTime, OffsetDateTime)
+
+
+def datetime_to_week_ns(moment: LocalDateTime) -> int:
+    """Return the number of nanoseconds elapsed since midnight on Monday at the local
+    day of the week and clock time of the given datetime, in [0, NS_PER_WEEK)."""
+
+    return (
+        (moment.day_of_week().value - 1) * NS_PER_DAY
+        + moment.hour * NS_PER_HOUR
+        + moment.minute * NS_PER_MINUTE
+        + moment.second * NS_PER_SECOND
+        + moment.nanosecond
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class AbstractWeeklyTimePeriod(ABC):
+    """A WeeklyTimePeriod is an abstract right-open interval of the week,
+    [start_day start_time, end_day end_time), which recurs every week as a TimePeriod
+    recurs every day.
+
+    WeeklyTimePeriods are immutable and hashable. The start and end are cached as integer
+    nanoseconds since midnight on Monday, start_ns and end_ns, which are used for
+    membership, comparisons, equality and hashing. A datetime is in a WeeklyTimePeriod
+    when its local day of the week and clock time are."""
+
+    start_day: Weekday = field(compare=False)
+    start_time: Time = field(compare=False)
+    end_day: Weekday = field(compare=False)
+    end_time: Time = field(compare=False)
+    start_ns: int = field(init=False, repr=False)
+    end_ns: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "start_ns", week_to_ns(self.start_day, self.start_time)
+        )
+        object.__setattr__(self, "end_ns", week_to_ns(self.end_day, self.end_time))
+
+    @classmethod
+    def _from_ns(cls, start_ns: int, end_ns: int) -> AbstractWeeklyTimePeriod:
+        """Construct an instance from already validated nanoseconds of the week,
+        skipping __post_init__"""
+
+        period = object.__new__(cls)
+        start_day, start_time = ns_to_week(start_ns)
+        end_day, end_time = ns_to_week(end_ns)
+        object.__setattr__(period, "start_day", start_day)
+        object.__setattr__(period, "start_time", start_time)
+        object.__setattr__(period, "end_day", end_day)
+        object.__setattr__(period, "end_time", end_time)
+        object.__setattr__(period, "start_ns", start_ns)
+        object.__setattr__(period, "end_ns", end_ns)
+        return period
+
+    def __reduce__(self) -> tuple:
+        return _unpickle, (type(self), self.start_ns, self.end_ns)
+
+    @property
+    @abstractmethod
+    def duration(self) -> TimeDelta:
+        """The length of time covered by the period in a week"""
+
+    @abstractmethod
+    def contains_ns(self, ns: int) -> bool:
+        """Whether the given nanosecond of the week is in the period"""
+
+    def __contains__(self, other: LocalDateTime) -> bool:
+        if not isinstance(other, LOCAL_DATETIME_TYPES):
+            return False
+        return self.contains_ns(datetime_to_week_ns(other))
+
+    def __and__(
+        self, other: AbstractWeeklyTimePeriod | AbstractTimePeriod
+    ) -> list[AbstractWeeklyTimePeriod] | AbstractWeeklyTimePeriod | None:
+        return intersection(self, other)
+
+    def __rand__(self, other: TimePeriodSet) -> WeeklyTimePeriodSet:
+        return intersection(other, self)
+
+    def __or__(self, other: TimePeriodSet) -> WeeklyTimePeriodSet:
+        if not isinstance(other, TimePeriodSet):
+            return NotImplemented
+        return WeeklyTimePeriodSet([self]) | other
+
+    __ror__ = __or__
+
+    def __invert__(self) -> PeriodExpression:
+        """The lazy complement of the period, see whenever_time_period.expression"""
+
+        # imported here as the expression module builds on the period classes
+        from whenever_time_period.expression import lazy
+
+        return ~lazy(self)
+
+    def __lt__(self, other: AbstractWeeklyTimePeriod) -> bool:
+        return less_than(self, other)
+
+    def __gt__(self, other: AbstractWeeklyTimePeriod) -> bool:
+        return greater_than(self, other)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}[{self.start_day.name[:3].title()} "
+            f"{self.start_time}, {self.end_day.name[:3].title()} {self.end_time})"
+        )
+
+
+def _unpickle(cls: type, start_ns: int, end_ns: int) -> AbstractWeeklyTimePeriod:
+    return cls._from_ns(start_ns, end_ns)
+
+
+@dataclass(frozen=True, slots=True)
+class LinearWeeklyTimePeriod(AbstractWeeklyTimePeriod):
+    """A LinearWeeklyTimePeriod is a right-open interval of the week wherein the start
+    is before the end within a week starting on Monday.
+
+    Example:
+    >> LinearWeeklyTimePeriod(Weekday.MONDAY, Time(22), Weekday.TUESDAY, Time(6))
+    """
+
+    kind: ClassVar[PeriodKind] = PeriodKind.LINEAR
+
+    def __post_init__(self):
+        AbstractWeeklyTimePeriod.__post_init__(self)
+        if not self.start_ns < self.end_ns:
+            raise ValueError
+
+    @property
+    def duration(self) -> TimeDelta:
+        return TimeDelta(nanoseconds=self.end_ns - self.start_ns)
+
+    def contains_ns(self, ns: int) -> bool:
+        return self.start_ns <= ns < self.end_ns
+
+    __repr__ = AbstractWeeklyTimePeriod.__repr__
+
+
+@dataclass(frozen=True, slots=True)
+class ModularWeeklyTimePeriod(AbstractWeeklyTimePeriod):
+    """A ModularWeeklyTimePeriod is a right-open interval of the week wherein the end
+    is before the start. Used for intervals which wrap around midnight on Sunday.
+
+    Example:
+    >> ModularWeeklyTimePeriod(Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8))
+    """
+
+    kind: ClassVar[PeriodKind] = PeriodKind.MODULAR
+
+    def __post_init__(self):
+        AbstractWeeklyTimePeriod.__post_init__(self)
+        if not self.end_ns < self.start_ns:
+            raise ValueError
+
+    @property
+    def duration(self) -> TimeDelta:
+        return TimeDelta(nanoseconds=NS_PER_WEEK - self.start_ns + self.end_ns)
+
+    def contains_ns(self, ns: int) -> bool:
+        return self.start_ns <= ns or ns < self.end_ns
+
+    __repr__ = AbstractWeeklyTimePeriod.__repr__
+
+
+@dataclass(frozen=True, slots=True)
+class InfiniteWeeklyTimePeriod(AbstractWeeklyTimePeriod):
+    """An InfiniteWeeklyTimePeriod is a right-open interval of the week wherein the
+    start and the end are equal. Used to represent intervals which span the whole
+    week."""
+
+    kind: ClassVar[PeriodKind] = PeriodKind.INFINITE
+
+    def __post_init__(self):
+        AbstractWeeklyTimePeriod.__post_init__(self)
+        if not self.start_ns == self.end_ns:
+            raise ValueError
+
+    @property
+    def duration(self) -> TimeDelta:
+        return TimeDelta(nanoseconds=NS_PER_WEEK)
+
+    def contains_ns(self, ns: int) -> bool:
+        return True
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, InfiniteWeeklyTimePeriod):
+            return True
+        return False
+
+    def __hash__(self) -> int:
+        return hash(InfiniteWeeklyTimePeriod)
+
+    __repr__ = AbstractWeeklyTimePeriod.__repr__
+
+
+# the weekly subclasses, indexed by PeriodKind
+WEEKLY_PERIOD_TYPES = (
+    LinearWeeklyTimePeriod,
+    ModularWeeklyTimePeriod,
+    InfiniteWeeklyTimePeriod,
+)
+
+
+def weekly_from_times(
+    start_day: Weekday, start_time: Time, end_day: Weekday, end_time: Time
+) -> AbstractWeeklyTimePeriod:
+    """Construct the WeeklyTimePeriod [start_day start_time, end_day end_time), choosing
+    the Linear, Modular or Infinite subclass from the ordering of its bounds in a week
+    starting on Monday.
+
+    Example:
+    >> weekly_from_times(Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8))
+    ModularWeeklyTimePeriod[Fri 17:00:00, Mon 08:00:00)
+    """
+
+    start_ns = week_to_ns(start_day, start_time)
+    end_ns = week_to_ns(end_day, end_time)
+    return WEEKLY_PERIOD_TYPES[kind_of(start_ns, end_ns)]._from_ns(start_ns, end_ns)
+
+
+def weekly_from_ns(start_ns: int, end_ns: int) -> AbstractWeeklyTimePeriod:
+    """Construct the WeeklyTimePeriod between the given nanoseconds of the week,
+    choosing the subclass from their ordering as weekly_from_times does."""
+
+    return WEEKLY_PERIOD_TYPES[kind_of(start_ns, end_ns)]._from_ns(start_ns, end_ns)
+
+
+def split_at_week(
+    period: AbstractWeeklyTimePeriod | AbstractTimePeriod,
+) -> list[Interval]:
+    """Return the intervals [start_ns, end_ns) of the week covered by a WeeklyTimePeriod,
+    or by a TimePeriod on every day of the week, wherein
+    0 <= start_ns < end_ns <= NS_PER_WEEK. ModularWeeklyTimePeriods are split at
+    midnight on Sunday."""
+
+    if isinstance(period, LinearWeeklyTimePeriod):
+        return [(period.start_ns, period.end_ns)]
+    if isinstance(period, ModularWeeklyTimePeriod):
+        intervals = [(period.start_ns, NS_PER_WEEK)]
+        if period.end_ns > 0:
+            intervals.insert(0, (0, period.end_ns))
+        return intervals
+    if isinstance(period, (InfiniteWeeklyTimePeriod, InfiniteTimePeriod)):
+        return [(0, NS_PER_WEEK)]
+    if isinstance(period, AbstractTimePeriod):
+        daily = split_at_midnight(period)
+        starts, ends = coalesce(
+            (day + start, day + end)
+            for day in range(0, NS_PER_WEEK, NS_PER_DAY)
+            for start, end in daily
+        )
+        return list(zip(starts, ends))
+    raise TypeError(f"cannot split {period!r} into intervals of the week")
+
+
+class WeeklyTimePeriodSet(TimePeriodSet):
+    """An immutable union of WeeklyTimePeriods, and of TimePeriods recurring on every
+    day of the week, normalized to a sorted sequence of disjoint, non-adjacent intervals
+    [start_ns, end_ns) in nanoseconds since midnight on Monday. It supports the set
+    algebra of a TimePeriodSet, with which it can be combined, and membership of a
+    datetime is a binary search.
+
+    Example:
+    >> weekend = WeeklyTimePeriodSet([ModularWeeklyTimePeriod(Weekday.FRIDAY, Time(17), Weekday.MONDAY, Time(8))])
+    >> weekend & TimePeriodSet([LinearTimePeriod(Time(9), Time(17))])
+    WeeklyTimePeriodSet[LinearWeeklyTimePeriod[Sat 09:00:00, Sat 17:00:00), LinearWeeklyTimePeriod[Sun 09:00:00, Sun 17:00:00)]
+    """
+
+    __slots__ = ()
+
+    _cycle_ns = NS_PER_WEEK
+    _split = staticmethod(split_at_week)
+    _period = staticmethod(weekly_from_ns)
+
+    def __contains__(self, other: LocalDateTime) -> bool:
+        if not isinstance(other, LOCAL_DATETIME_TYPES):
+            return False
+        ns = datetime_to_week_ns(other)
+        i = bisect_right(self._starts, ns) - 1
+        return i >= 0 and ns < self._ends[i]
+
+    def _coerce(self, other: object) -> WeeklyTimePeriodSet | None:
+        if type(other) is WeeklyTimePeriodSet:
+            return other
+        if isinstance(other, TimePeriodSet):
+            return WeeklyTimePeriodSet(other)
+        if isinstance(other, (AbstractWeeklyTimePeriod, AbstractTimePeriod)):
+            return WeeklyTimePeriodSet([other])
+        return None
+
+
+def _linear(start_ns: int, end_ns: int) -> LinearWeeklyTimePeriod:
+    return LinearWeeklyTimePeriod._from_ns(start_ns, end_ns)
+
+
+def _intersect(
+    period: AbstractWeeklyTimePeriod | AbstractTimePeriod,
+    other: AbstractWeeklyTimePeriod | AbstractTimePeriod,
+) -> list[AbstractWeeklyTimePeriod] | AbstractWeeklyTimePeriod | None:
+    """The intersection of two periods of which at least one is weekly, as None, a
+    single WeeklyTimePeriod or a list of them in order of start"""
+
+    pieces = list(WeeklyTimePeriodSet([period]) & WeeklyTimePeriodSet([other]))
+    if not pieces:
+        return None
+    return pieces[0] if len(pieces) == 1 else pieces
+
+
+@intersection.register
+def _(
+    period: LinearWeeklyTimePeriod, other: LinearWeeklyTimePeriod
+) -> LinearWeeklyTimePeriod | None:
+    start_ns = max(period.start_ns, other.start_ns)
+    end_ns = min(period.end_ns, other.end_ns)
+    if start_ns < end_ns:
+        return _linear(start_ns, end_ns)
+    return None
+
+
+@intersection.register
+def _(
+    period: AbstractWeeklyTimePeriod, other: AbstractWeeklyTimePeriod
+) -> list[AbstractWeeklyTimePeriod] | AbstractWeeklyTimePeriod | None:
+    return _intersect(period, other)
+
+
+@intersection.register
+def _(
+    period: AbstractWeeklyTimePeriod, other: AbstractTimePeriod
+) -> list[AbstractWeeklyTimePeriod] | AbstractWeeklyTimePeriod | None:
+    return _intersect(period, other)
+
+
+@intersection.register
+def _(
+    period: AbstractTimePeriod, other: AbstractWeeklyTimePeriod
+) -> list[AbstractWeeklyTimePeriod] | AbstractWeeklyTimePeriod | None:
+    return _intersect(period, other)
+
+
+# a TimePeriodSet cannot hold a weekly period, so their intersection is weekly in either
+# operand order
+@intersection.register
+def _(period: AbstractWeeklyTimePeriod, other: TimePeriodSet) -> WeeklyTimePeriodSet:
+    return WeeklyTimePeriodSet([period]) & other
+
+
+@intersection.register
+def _(period: TimePeriodSet, other: AbstractWeeklyTimePeriod) -> WeeklyTimePeriodSet:
+    return WeeklyTimePeriodSet([other]) & period
+
+
+@less_than.register
+def _(period: AbstractWeeklyTimePeriod, other: AbstractWeeklyTimePeriod) -> bool:
+    return period.start_ns < other.start_ns
+
+
+@greater_than.register
+def _(period: AbstractWeeklyTimePeriod, other: AbstractWeeklyTimePeriod) -> bool:
+    return period.start_ns > other.start_ns
+
+
+# serve operations between the weekly and built-in classes from the kernel tables
+# directly
+for table in (intersection, less_than, greater_than):
+    table.precompute(WEEKLY_PERIOD_TYPES, WEEKLY_PERIOD_TYPES + PERIOD_TYPES)
+    table.precompute(PERIOD_TYPES, WEEKLY_PERIOD_TYPES)